@@ -15,6 +15,7 @@ Features:
 import logging
 import os
 import json
+import re
 import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -32,6 +33,23 @@ except ImportError:
     logger.warning("requests not available - LLM integration disabled")
 
 
+def _compile_terms(terms: List[str]) -> "re.Pattern":
+    """Compile literal terms into one alternation so a single scan finds any of them"""
+    return re.compile("|".join(map(re.escape, terms)))
+
+
+# Symmetry Guard term sets (matched as substrings of the lowercased prompt)
+_STOP_LOSS_TERMS = _compile_terms(['stop', 'risk', 'loss', 'risk management'])
+_COT_TERMS = _compile_terms(['reasoning', 'explain', 'step-by-step', 'chain-of-thought'])
+_DANGEROUS_PATTERNS = _compile_terms([
+    'no stop',
+    'ignore risk',
+    'unlimited loss',
+    'all in',
+    'no risk management'
+])
+
+
 class EvolutionaryMutator:
     """
     The DNA Patch - Self-Improvement through Prompt Evolution
@@ -386,24 +404,12 @@ Provide the complete rewritten system prompt between [PROMPT_START] and [PROMPT_
         prompt_lower = prompt.lower()
         
         # Check for required safety elements
-        has_stop_loss = any(term in prompt_lower for term in [
-            'stop', 'risk', 'loss', 'risk management'
-        ])
+        has_stop_loss = _STOP_LOSS_TERMS.search(prompt_lower) is not None
         
-        has_cot = any(term in prompt_lower for term in [
-            'reasoning', 'explain', 'step-by-step', 'chain-of-thought'
-        ])
+        has_cot = _COT_TERMS.search(prompt_lower) is not None
         
         # Check for dangerous patterns
-        dangerous_patterns = [
-            'no stop',
-            'ignore risk',
-            'unlimited loss',
-            'all in',
-            'no risk management'
-        ]
-        
-        has_dangerous = any(pattern in prompt_lower for pattern in dangerous_patterns)
+        has_dangerous = _DANGEROUS_PATTERNS.search(prompt_lower) is not None
         
         # Validation
         if not has_stop_loss:
@@ -126,7 +126,7 @@ class NarrativePulse:
             whale_event: Whale event details if applicable
         """
         # Get current state
-        current_state = self.shared_state.get_all_state()
+        current_state = self.shared_state.get_all_state(include_raw=True)
         
         # Add whale_dump_risk to state
         # Note: SharedState doesn't have a native whale_dump_risk field,
@@ -236,19 +236,29 @@ Example: {{"sentiment": "Neutral", "multiplier": 1.0, "reasoning": "Balanced mar
             'fear_greed_value': fng_value
         }
     
-    async def update_sentiment(self) -> float:
+    async def update_sentiment(
+        self,
+        fear_greed: Optional[Dict[str, Any]] = None,
+        headlines: Optional[List[str]] = None
+    ) -> float:
         """
         Update sentiment multiplier in shared state
         
+        Args:
+            fear_greed: Already-fetched Fear & Greed data (fetched here if None)
+            headlines: Already-fetched Bitcoin headlines (fetched here if None)
+        
         Returns:
             Sentiment multiplier (0.5 to 1.5)
         """
         try:
             # Fetch Fear & Greed Index
-            fear_greed = self.fetch_fear_greed_index()
+            if fear_greed is None:
+                fear_greed = self.fetch_fear_greed_index()
             
             # Fetch Bitcoin news
-            headlines = self.fetch_bitcoin_news(count=5)
+            if headlines is None:
+                headlines = self.fetch_bitcoin_news(count=5)
             
             # Analyze sentiment
             if self.use_deepseek:
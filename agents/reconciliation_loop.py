@@ -24,6 +24,13 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_INSERT_PREDICTION_SQL = """
+    INSERT INTO predictions (
+        timestamp, predicted_bias, predicted_outcome, confidence,
+        market_regime, archetype, signal, price_at_prediction
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class IntelligenceLedger:
     """
@@ -61,9 +68,23 @@ class IntelligenceLedger:
         
         logger.info(f"IntelligenceLedger initialized at {self.db_path}")
     
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a ledger connection
+        
+        WAL journaling (persisted in the database file) lets readers run
+        alongside writes; synchronous=NORMAL is per-connection and drops the
+        fsync on every commit, which is safe under WAL.
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+    
     def _init_database(self):
         """Initialize database schema"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -129,17 +150,12 @@ class IntelligenceLedger:
         Returns:
             Prediction ID
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         timestamp = datetime.now().isoformat()
         
-        cursor.execute("""
-            INSERT INTO predictions (
-                timestamp, predicted_bias, predicted_outcome, confidence,
-                market_regime, archetype, signal, price_at_prediction
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        cursor.execute(_INSERT_PREDICTION_SQL, (
             timestamp, predicted_bias, predicted_outcome, confidence,
             market_regime, archetype, signal, price_at_prediction
         ))
@@ -151,6 +167,37 @@ class IntelligenceLedger:
         logger.info(f"Recorded prediction #{prediction_id}: {predicted_bias} -> {predicted_outcome}")
         return prediction_id
     
+    def record_predictions(self, predictions: List[Dict[str, Any]]) -> List[int]:
+        """
+        Record several predictions in a single transaction
+        
+        Args:
+            predictions: Dicts with the same keys as record_prediction's arguments
+            
+        Returns:
+            Prediction IDs, in input order
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        timestamp = datetime.now().isoformat()
+        prediction_ids = []
+        
+        for prediction in predictions:
+            cursor.execute(_INSERT_PREDICTION_SQL, (
+                timestamp, prediction['predicted_bias'], prediction['predicted_outcome'],
+                prediction['confidence'], prediction['market_regime'], prediction['archetype'],
+                prediction['signal'], prediction['price_at_prediction']
+            ))
+            prediction_ids.append(cursor.lastrowid)
+        
+        # One commit for the whole batch instead of one per row
+        conn.commit()
+        conn.close()
+        
+        logger.info(f"Recorded {len(prediction_ids)} predictions")
+        return prediction_ids
+    
     def update_actual_price(
         self,
         prediction_id: int,
@@ -165,7 +212,7 @@ class IntelligenceLedger:
             actual_price: Actual market price at timeframe
             timeframe: Timeframe (1h, 4h, 12h)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         field_name = f"actual_price_{timeframe}"
@@ -193,7 +240,7 @@ class IntelligenceLedger:
         Returns:
             List of prediction dicts
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -227,7 +274,7 @@ class IntelligenceLedger:
             timeframe: Timeframe (1h, 4h, 12h)
             score: Success score (-1 to +1)
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         field_name = f"success_score_{timeframe}"
@@ -240,9 +287,35 @@ class IntelligenceLedger:
         conn.commit()
         conn.close()
     
+    def update_outcomes(
+        self,
+        timeframe: str,
+        outcomes: List[Tuple[int, float, float]]
+    ):
+        """
+        Update actual price and success score for several predictions at once
+        
+        Args:
+            timeframe: Timeframe (1h, 4h, 12h)
+            outcomes: (prediction_id, actual_price, score) tuples
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        price_field = f"actual_price_{timeframe}"
+        score_field = f"success_score_{timeframe}"
+        cursor.executemany(f"""
+            UPDATE predictions 
+            SET {price_field} = ?, {score_field} = ? 
+            WHERE id = ?
+        """, [(actual_price, score, prediction_id) for prediction_id, actual_price, score in outcomes])
+        
+        conn.commit()
+        conn.close()
+    
     def mark_audited(self, prediction_id: int):
         """Mark a prediction as fully audited"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -269,7 +342,7 @@ class IntelligenceLedger:
         Returns:
             List of failed prediction dicts
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -300,7 +373,7 @@ class IntelligenceLedger:
         Returns:
             Statistics dict
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Total predictions
@@ -522,7 +595,7 @@ class ReconciliationAuditor:
         Returns:
             True if fully audited
         """
-        conn = sqlite3.connect(self.ledger.db_path)
+        conn = self.ledger._connect()
         cursor = conn.cursor()
         
         cursor.execute("""
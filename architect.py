@@ -3,9 +3,10 @@ Architect - Evolves the trading logic based on R1 analysis
 """
 import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Union
 from datetime import datetime
 import os
+import numpy as np
 from data.memory import EvolutionMemory
 from data.shared_state import get_shared_state, RiskLevel
 
@@ -16,6 +17,7 @@ logger = logging.getLogger(__name__)
 CONFIDENCE_BOOST = 0.1  # Boost when R1 signal matches our signal
 R1_OVERRIDE_THRESHOLD = 0.7  # Confidence threshold for R1 to override
 HIGH_RISK_REDUCTION = 0.5  # 50% reduction when global risk is HIGH
+WHALE_RISK_REDUCTION = 0.7  # 30% reduction when whale dump risk is active
 
 
 class Architect:
@@ -381,14 +383,17 @@ def generate_signal(indicators: Dict[str, Any], analysis: Dict[str, Any]) -> Dic
         Returns:
             Adjusted position size
         """
+        # One snapshot per call, so all factors come from the same state
+        state = self.shared_state.get_all_state()
+        
         # Get sentiment multiplier
-        sentiment_multiplier = self.shared_state.get_sentiment_multiplier()
+        sentiment_multiplier = state['sentiment_multiplier']
         
         # Apply sentiment multiplier
         adjusted_size = base_size * sentiment_multiplier
         
         # Get global risk level
-        global_risk = self.shared_state.get_global_risk_level()
+        global_risk = state['global_risk_level']
         
         # Safety override: 50% reduction if HIGH risk
         if global_risk == RiskLevel.HIGH:
@@ -405,11 +410,52 @@ def generate_signal(indicators: Dict[str, Any], analysis: Dict[str, Any]) -> Dic
             )
         
         # NEW: Whale dump risk reduction
-        if self.shared_state.get_whale_dump_risk():
-            adjusted_size *= 0.7  # 30% reduction
+        if state['whale_dump_risk']:
+            adjusted_size *= WHALE_RISK_REDUCTION
             logger.warning(
                 f"🐋 Whale risk active: Position reduced by 30% "
                 f"(Final size: {adjusted_size:.4f})"
             )
         
         return adjusted_size
+    
+    def get_adjusted_sizes_batch(
+        self,
+        base_sizes: Union[float, Sequence[float]],
+        risk_levels: Union[RiskLevel, Sequence[RiskLevel]],
+        sentiment_multipliers: Union[float, Sequence[float]],
+        whale_dump_risk: Optional[Union[bool, Sequence[bool]]] = None
+    ) -> np.ndarray:
+        """
+        Calculate adjusted position sizes for many scenarios at once
+        
+        Same formula as get_adjusted_size, but every factor comes from the
+        arguments instead of shared state, so scenario grids can be sized
+        without mutating it. Inputs broadcast against each other, so any of
+        them may be a single value shared by every scenario.
+        
+        Args:
+            base_sizes: Base position sizes
+            risk_levels: Global risk level per scenario (or one for all)
+            sentiment_multipliers: Sentiment multiplier per scenario (or one for all)
+            whale_dump_risk: Whale dump flag per scenario (default: the current shared flag)
+            
+        Returns:
+            Adjusted position sizes
+        """
+        if whale_dump_risk is None:
+            whale_dump_risk = self.shared_state.get_whale_dump_risk()
+        
+        # RiskLevel is a str enum, so a single level must not be iterated (or
+        # handed to numpy) as a sequence of characters
+        if isinstance(risk_levels, RiskLevel):
+            high_risk = np.bool_(risk_levels is RiskLevel.HIGH)
+        else:
+            high_risk = np.array([level == RiskLevel.HIGH for level in risk_levels], dtype=bool)
+        
+        # Same multiplication order as get_adjusted_size, so results match exactly
+        adjusted = np.asarray(base_sizes, dtype=np.float64) * np.asarray(sentiment_multipliers, dtype=np.float64)
+        adjusted = adjusted * np.where(high_risk, HIGH_RISK_REDUCTION, 1.0)
+        adjusted = adjusted * np.where(np.asarray(whale_dump_risk, dtype=bool), WHALE_RISK_REDUCTION, 1.0)
+        
+        return adjusted
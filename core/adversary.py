@@ -17,7 +17,7 @@ import os
 import json
 import time
 import re
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from datetime import datetime
 import copy
 
@@ -52,12 +52,12 @@ class PsychologicalBiasDetector:
     """
     
     @staticmethod
-    def calculate_rsi(prices: List[float], period: int = 14) -> float:
+    def calculate_rsi(prices: Sequence[float], period: int = 14) -> float:
         """
         Calculate Relative Strength Index
         
         Args:
-            prices: List of closing prices
+            prices: Closing prices (list or float64 ndarray)
             period: RSI period (default 14)
             
         Returns:
@@ -66,12 +66,16 @@ class PsychologicalBiasDetector:
         if len(prices) < period + 1:
             return 50.0  # Neutral RSI if insufficient data
         
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        gains = [d if d > 0 else 0 for d in deltas]
-        losses = [-d if d < 0 else 0 for d in deltas]
-        
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
+        # Only the last `period` deltas are averaged, so only diff that window
+        window = prices[-(period + 1):]
+        if NUMPY_AVAILABLE:
+            deltas = np.diff(np.asarray(window, dtype=np.float64))
+            avg_gain = float(np.where(deltas > 0, deltas, 0.0).sum()) / period
+            avg_loss = float(np.where(deltas < 0, -deltas, 0.0).sum()) / period
+        else:
+            deltas = [window[i] - window[i-1] for i in range(1, len(window))]
+            avg_gain = sum(d if d > 0 else 0 for d in deltas) / period
+            avg_loss = sum(-d if d < 0 else 0 for d in deltas) / period
         
         if avg_loss == 0:
             return 100.0
@@ -111,12 +115,12 @@ class PsychologicalBiasDetector:
         return total_pv / total_volume
     
     @staticmethod
-    def calculate_volatility(prices: List[float], period: int = 15) -> float:
+    def calculate_volatility(prices: Sequence[float], period: int = 15) -> float:
         """
         Calculate price volatility (standard deviation of returns)
         
         Args:
-            prices: List of closing prices
+            prices: Closing prices (list or float64 ndarray)
             period: Lookback period
             
         Returns:
@@ -125,7 +129,16 @@ class PsychologicalBiasDetector:
         if len(prices) < 2:
             return 0.0
         
-        returns = [(prices[i] - prices[i-1]) / prices[i-1] for i in range(1, min(len(prices), period + 1))]
+        window = prices[:period + 1]
+        if NUMPY_AVAILABLE:
+            window = np.asarray(window, dtype=np.float64)
+            returns = np.diff(window) / window[:-1]
+            if not returns.size:
+                return 0.0
+            # Population std (ddof=0), same as the pure-Python variance below
+            return float(returns.std()) * 100  # Convert to percentage
+        
+        returns = [(window[i] - window[i-1]) / window[i-1] for i in range(1, len(window))]
         
         if not returns:
             return 0.0
@@ -292,7 +305,7 @@ class PsychologicalBiasDetector:
     
     @staticmethod
     def detect_recency_bias(
-        prices: List[float],
+        prices: Sequence[float],
         trend_days: int = 3
     ) -> Dict[str, Any]:
         """
@@ -0,0 +1,51 @@
+"""
+Batch HMAC-SHA256 Signing
+Signs many pre-built messages with one key (e.g. replaying synthetic orders
+in paper-trading simulations)
+"""
+import hmac
+from typing import List, Sequence
+
+import numpy as np
+
+DIGEST_SIZE = 32  # SHA-256 digest length in bytes
+
+
+def hmac_sha256_batch(key: bytes, msgs: Sequence[bytes]) -> np.ndarray:
+    """
+    Compute HMAC-SHA256 of every message under the same key
+    
+    The key schedule (inner/outer padded key) is computed once; each message
+    then only hashes from a copy of the keyed state.
+    
+    Args:
+        key: Secret key
+        msgs: Messages to sign
+        
+    Returns:
+        uint8 array of shape (len(msgs), 32), one digest per row
+    """
+    keyed = hmac.new(key, digestmod='sha256')
+    
+    digests = []
+    append = digests.append
+    for msg in msgs:
+        h = keyed.copy()
+        h.update(msg)
+        append(h.digest())
+    
+    return np.frombuffer(b"".join(digests), dtype=np.uint8).reshape(len(digests), DIGEST_SIZE)
+
+
+def hmac_sha256_hex_batch(key: bytes, msgs: Sequence[bytes]) -> List[str]:
+    """
+    Hex-encoded variant of hmac_sha256_batch (the format used in request headers)
+    
+    Args:
+        key: Secret key
+        msgs: Messages to sign
+        
+    Returns:
+        List of 64-character hex signatures
+    """
+    return [row.tobytes().hex() for row in hmac_sha256_batch(key, msgs)]
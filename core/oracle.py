@@ -2,10 +2,14 @@
 TradFi Oracle - Connects to Alpaca Market Data API
 Monitors traditional finance markets (SPY, QQQ) to set global risk levels
 """
+import asyncio
 import logging
 import os
-from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple, List, NamedTuple
+from datetime import datetime, timedelta, timezone
+import aiohttp
 from data.shared_state import get_shared_state, RiskLevel
 
 logging.basicConfig(level=logging.INFO)
@@ -14,11 +18,107 @@ logger = logging.getLogger(__name__)
 # Try to import alpaca-trade-api
 try:
     from alpaca_trade_api.rest import REST, TimeFrame
+    from requests.adapters import HTTPAdapter
     ALPACA_AVAILABLE = True
 except ImportError:
     ALPACA_AVAILABLE = False
     logger.warning("alpaca-trade-api not installed. Oracle will use fallback mode.")
 
+ALPACA_BASE_URL = 'https://paper-api.alpaca.markets'  # Use paper trading for safety
+ALPACA_DATA_URL = 'https://data.alpaca.markets'
+
+
+class MarketSnapshot(NamedTuple):
+    """
+    Flat, immutable SPY/QQQ market data reading
+    """
+    timestamp: float
+    spy_price: float
+    spy_change_pct: float
+    spy_prev_price: float
+    qqq_price: float
+    qqq_change_pct: float
+    qqq_prev_price: float
+    source: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the nested dictionary layout used by the dashboard
+        
+        Returns:
+            Dictionary with 'spy'/'qqq' sub-dicts and an ISO formatted timestamp
+        """
+        return {
+            'timestamp': datetime.fromtimestamp(self.timestamp).isoformat(),
+            'spy': {
+                'price': self.spy_price,
+                'change_pct': self.spy_change_pct,
+                'prev_price': self.spy_prev_price
+            },
+            'qqq': {
+                'price': self.qqq_price,
+                'change_pct': self.qqq_change_pct,
+                'prev_price': self.qqq_prev_price
+            },
+            'source': self.source
+        }
+
+
+# Static fallback reading (neutral/slightly positive market); only the
+# timestamp is replaced per call
+_FALLBACK_SNAPSHOT = MarketSnapshot(
+    timestamp=0.0,
+    spy_price=450.0,
+    spy_change_pct=0.2,  # Slightly positive
+    spy_prev_price=449.1,
+    qqq_price=380.0,
+    qqq_change_pct=0.3,
+    qqq_prev_price=378.86,
+    source='fallback'
+)
+
+# Static part of the update_global_risk error payload
+_ERROR_FALLBACK_TEMPLATE: Dict[str, Any] = {'source': 'error_fallback'}
+
+# Alpaca REST clients shared across oracle instances, keyed by credentials and
+# base URL, so re-constructing an oracle reuses the warm TCP/TLS pool
+_SESSION_POOL: Dict[Tuple[str, str, str], "REST"] = {}
+_SESSION_POOL_LOCK = threading.Lock()
+
+
+def _get_pooled_client(api_key: str, secret_key: str, base_url: str = ALPACA_BASE_URL) -> "REST":
+    """
+    Get (or create) a shared Alpaca REST client for the given credentials
+    
+    Args:
+        api_key: Alpaca API key
+        secret_key: Alpaca secret key
+        base_url: Alpaca API base URL
+        
+    Returns:
+        Shared REST client
+    """
+    pool_key = (api_key, secret_key, base_url)
+    with _SESSION_POOL_LOCK:
+        client = _SESSION_POOL.get(pool_key)
+        if client is None:
+            client = REST(
+                key_id=api_key,
+                secret_key=secret_key,
+                base_url=base_url
+            )
+            
+            # Widen the underlying requests pool so concurrent SPY/QQQ fetches
+            # share keep-alive connections instead of opening new ones
+            session = getattr(client, '_session', None)
+            if session is not None:
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+            
+            _SESSION_POOL[pool_key] = client
+        return client
+
 
 class TradFiOracle:
     """
@@ -36,7 +136,8 @@ class TradFiOracle:
         self,
         alpaca_api_key: Optional[str] = None,
         alpaca_secret_key: Optional[str] = None,
-        spy_threshold: float = -0.01  # -1% threshold
+        spy_threshold: float = -0.01,  # -1% threshold
+        min_publish_interval: float = 300.0
     ):
         """
         Initialize TradFi Oracle
@@ -45,20 +146,27 @@ class TradFiOracle:
             alpaca_api_key: Alpaca API key (or from env ALPACA_API_KEY)
             alpaca_secret_key: Alpaca secret key (or from env ALPACA_SECRET_KEY)
             spy_threshold: SPY percentage change threshold for HIGH risk (default: -1%)
+            min_publish_interval: Seconds after which an unchanged risk reading
+                is re-published to shared state anyway (default: 5 minutes)
         """
         self.alpaca_api_key = alpaca_api_key or os.getenv("ALPACA_API_KEY", "")
         self.alpaca_secret_key = alpaca_secret_key or os.getenv("ALPACA_SECRET_KEY", "")
         self.spy_threshold = spy_threshold
+        self._spy_threshold_pct = spy_threshold * 100  # Same units as change_pct
         self.shared_state = get_shared_state()
         
+        # Change detection for shared state writes
+        self.min_publish_interval = min_publish_interval
+        self._last_risk_key: Optional[Tuple[RiskLevel, float]] = None
+        self._last_publish_time = 0.0
+        
         # Initialize Alpaca client if available
         self.alpaca_client = None
         if ALPACA_AVAILABLE and self.alpaca_api_key and self.alpaca_secret_key:
             try:
-                self.alpaca_client = REST(
-                    key_id=self.alpaca_api_key,
-                    secret_key=self.alpaca_secret_key,
-                    base_url='https://paper-api.alpaca.markets'  # Use paper trading for safety
+                self.alpaca_client = _get_pooled_client(
+                    self.alpaca_api_key,
+                    self.alpaca_secret_key
                 )
                 logger.info("✅ TradFi Oracle initialized with Alpaca API")
             except Exception as e:
@@ -67,12 +175,12 @@ class TradFiOracle:
         else:
             logger.warning("⚠️  TradFi Oracle running in fallback mode (no Alpaca API)")
     
-    def fetch_market_data(self) -> Dict[str, Any]:
+    def fetch_market_data(self) -> MarketSnapshot:
         """
         Fetch 1-hour market data for SPY and QQQ
         
         Returns:
-            Dictionary with market data and percentage changes
+            MarketSnapshot with prices and percentage changes
         """
         try:
             if self.alpaca_client is None:
@@ -109,42 +217,144 @@ class TradFiOracle:
                 logger.warning("Insufficient QQQ data, using fallback")
                 return self._get_fallback_data()
             
-            # Calculate 1-hour percentage changes
-            spy_prev_close = spy_bars_list[-2].c
-            spy_current_close = spy_bars_list[-1].c
-            spy_change_pct = ((spy_current_close - spy_prev_close) / spy_prev_close) * 100
-            
-            qqq_prev_close = qqq_bars_list[-2].c
-            qqq_current_close = qqq_bars_list[-1].c
-            qqq_change_pct = ((qqq_current_close - qqq_prev_close) / qqq_prev_close) * 100
-            
-            market_data = {
-                'timestamp': datetime.now().isoformat(),
-                'spy': {
-                    'price': spy_current_close,
-                    'change_pct': spy_change_pct,
-                    'prev_price': spy_prev_close
-                },
-                'qqq': {
-                    'price': qqq_current_close,
-                    'change_pct': qqq_change_pct,
-                    'prev_price': qqq_prev_close
-                },
-                'source': 'alpaca'
+            return self._build_market_data(
+                spy_bars_list[-2].c,
+                spy_bars_list[-1].c,
+                qqq_bars_list[-2].c,
+                qqq_bars_list[-1].c
+            )
+            
+        except Exception as e:
+            logger.error(f"Error fetching market data: {str(e)}")
+            logger.warning("Falling back to default data")
+            return self._get_fallback_data()
+    
+    async def fetch_market_data_async(self, timeout: float = 5.0) -> MarketSnapshot:
+        """
+        Fetch 1-hour market data for SPY and QQQ without blocking the event loop
+        
+        Both symbols are requested concurrently from the Alpaca data API,
+        each bounded by a timeout.
+        
+        Args:
+            timeout: Per-request timeout in seconds (default: 5)
+            
+        Returns:
+            MarketSnapshot with prices and percentage changes
+        """
+        try:
+            if self.alpaca_client is None:
+                # Fallback mode: return mock data
+                return self._get_fallback_data()
+            
+            end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(hours=2)  # Get last 2 hours
+            
+            headers = {
+                'APCA-API-KEY-ID': self.alpaca_api_key,
+                'APCA-API-SECRET-KEY': self.alpaca_secret_key
             }
             
-            logger.info(
-                f"📊 Market Data: SPY {spy_change_pct:+.2f}%, QQQ {qqq_change_pct:+.2f}%"
-            )
+            async with aiohttp.ClientSession(headers=headers) as session:
+                spy_closes, qqq_closes = await asyncio.gather(
+                    asyncio.wait_for(
+                        self._fetch_symbol_async(session, "SPY", start_time, end_time),
+                        timeout=timeout
+                    ),
+                    asyncio.wait_for(
+                        self._fetch_symbol_async(session, "QQQ", start_time, end_time),
+                        timeout=timeout
+                    )
+                )
+            
+            if len(spy_closes) < 2:
+                logger.warning("Insufficient SPY data, using fallback")
+                return self._get_fallback_data()
+            
+            if len(qqq_closes) < 2:
+                logger.warning("Insufficient QQQ data, using fallback")
+                return self._get_fallback_data()
             
-            return market_data
+            return self._build_market_data(
+                spy_closes[-2],
+                spy_closes[-1],
+                qqq_closes[-2],
+                qqq_closes[-1]
+            )
             
         except Exception as e:
             logger.error(f"Error fetching market data: {str(e)}")
             logger.warning("Falling back to default data")
             return self._get_fallback_data()
     
-    def _get_fallback_data(self) -> Dict[str, Any]:
+    async def _fetch_symbol_async(
+        self,
+        session: aiohttp.ClientSession,
+        symbol: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[float]:
+        """
+        Fetch 1-hour closing prices for a symbol from the Alpaca data API
+        
+        Args:
+            session: Open aiohttp session with Alpaca auth headers
+            symbol: Ticker symbol (e.g., 'SPY')
+            start_time: Start of the bar window
+            end_time: End of the bar window
+            
+        Returns:
+            List of closing prices, oldest first
+        """
+        params = {
+            'timeframe': '1Hour',
+            'start': start_time.isoformat(),
+            'end': end_time.isoformat()
+        }
+        
+        async with session.get(
+            f"{ALPACA_DATA_URL}/v2/stocks/{symbol}/bars",
+            params=params
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
+        
+        return [bar['c'] for bar in (data.get('bars') or [])]
+    
+    def _build_market_data(
+        self,
+        spy_prev_close: float,
+        spy_current_close: float,
+        qqq_prev_close: float,
+        qqq_current_close: float
+    ) -> MarketSnapshot:
+        """
+        Build market data from the last two closes of SPY and QQQ
+        
+        Returns:
+            MarketSnapshot with 1-hour percentage changes
+        """
+        spy_change_pct = ((spy_current_close - spy_prev_close) / spy_prev_close) * 100
+        qqq_change_pct = ((qqq_current_close - qqq_prev_close) / qqq_prev_close) * 100
+        
+        market_data = MarketSnapshot(
+            timestamp=time.time(),
+            spy_price=spy_current_close,
+            spy_change_pct=spy_change_pct,
+            spy_prev_price=spy_prev_close,
+            qqq_price=qqq_current_close,
+            qqq_change_pct=qqq_change_pct,
+            qqq_prev_price=qqq_prev_close,
+            source='alpaca'
+        )
+        
+        logger.info(
+            f"📊 Market Data: SPY {spy_change_pct:+.2f}%, QQQ {qqq_change_pct:+.2f}%"
+        )
+        
+        return market_data
+    
+    def _get_fallback_data(self) -> MarketSnapshot:
         """
         Get fallback market data when API is unavailable
         Returns neutral/slightly positive market conditions
@@ -152,20 +362,7 @@ class TradFiOracle:
         Returns:
             Mock market data
         """
-        return {
-            'timestamp': datetime.now().isoformat(),
-            'spy': {
-                'price': 450.0,
-                'change_pct': 0.2,  # Slightly positive
-                'prev_price': 449.1
-            },
-            'qqq': {
-                'price': 380.0,
-                'change_pct': 0.3,
-                'prev_price': 378.86
-            },
-            'source': 'fallback'
-        }
+        return _FALLBACK_SNAPSHOT._replace(timestamp=time.time())
     
     def update_global_risk(self) -> RiskLevel:
         """
@@ -183,24 +380,34 @@ class TradFiOracle:
             market_data = self.fetch_market_data()
             
             # Get SPY change percentage
-            spy_change_pct = market_data['spy']['change_pct']
+            spy_change_pct = market_data.spy_change_pct
             
             # Determine risk level based on threshold
-            if spy_change_pct < (self.spy_threshold * 100):
+            if spy_change_pct < self._spy_threshold_pct:
                 risk_level = RiskLevel.HIGH
                 logger.warning(
                     f"🚨 HIGH RISK: SPY down {spy_change_pct:.2f}% "
-                    f"(threshold: {self.spy_threshold * 100:.1f}%)"
+                    f"(threshold: {self._spy_threshold_pct:.1f}%)"
                 )
             else:
                 risk_level = RiskLevel.NORMAL
                 logger.info(
                     f"✅ NORMAL RISK: SPY {spy_change_pct:+.2f}% "
-                    f"(threshold: {self.spy_threshold * 100:.1f}%)"
+                    f"(threshold: {self._spy_threshold_pct:.1f}%)"
                 )
             
-            # Update shared state
-            self.shared_state.set_global_risk_level(risk_level, market_data)
+            # Update shared state only when the reading changed, another
+            # component moved the level, or the last publish has gone stale
+            risk_key = (risk_level, round(spy_change_pct, 3))
+            now = time.monotonic()
+            if (
+                risk_key != self._last_risk_key
+                or self.shared_state.get_global_risk_level() != risk_level
+                or now - self._last_publish_time >= self.min_publish_interval
+            ):
+                self.shared_state.set_global_risk_level(risk_level, market_data.to_dict())
+                self._last_risk_key = risk_key
+                self._last_publish_time = now
             
             return risk_level
             
@@ -209,14 +416,11 @@ class TradFiOracle:
             logger.warning("Defaulting to NORMAL risk level")
             
             # Default to NORMAL on error (safe fallback)
-            self.shared_state.set_global_risk_level(
-                RiskLevel.NORMAL,
-                {
-                    'timestamp': datetime.now().isoformat(),
-                    'error': str(e),
-                    'source': 'error_fallback'
-                }
-            )
+            error_data = _ERROR_FALLBACK_TEMPLATE.copy()
+            error_data['timestamp'] = datetime.now().isoformat()
+            error_data['error'] = str(e)
+            self.shared_state.set_global_risk_level(RiskLevel.NORMAL, error_data)
+            self._last_risk_key = None  # Next successful reading always publishes
             
             return RiskLevel.NORMAL
     
@@ -232,7 +436,7 @@ class TradFiOracle:
         
         return {
             'risk_level': risk_level,
-            'market_data': market_data,
+            'market_data': market_data.to_dict(),
             'threshold': self.spy_threshold,
             'status': 'operational' if self.alpaca_client else 'fallback'
         }
@@ -3,19 +3,143 @@ Shadow Trading Engine - Runs parallel high-risk strategies in memory
 Compares Shadow ROI vs Live ROI and generates promotion alerts
 """
 import logging
-from typing import Dict, Any, Optional, List
+import math
+from typing import Dict, Any, Optional, List, NamedTuple, Sequence, Tuple, Union
 from datetime import datetime
 import threading
+import time
+import numpy as np
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available - batch simulation will use NumPy")
+
+# Annualization factor for daily Sharpe ratios
+_SQRT_252 = math.sqrt(252)
+
+# Directional drift (as a fraction of volatility) applied per trading signal
+_BIAS_MAP = {"buy": 0.3, "sell": -0.3}
+
+# Batch simulation encodes signals as int8 codes indexing into _BIAS_TABLE
+# (0=hold, 1=buy, 2=sell, 3=any other signal: trades without drift)
+_SIGNAL_CODES = {"hold": 0, "buy": 1, "sell": 2}
+_OTHER_SIGNAL_CODE = 3
+_BIAS_TABLE = np.array([0.0, 0.3, -0.3, 0.0])
+
+
+def _sim_batch_numpy(
+    z_live: np.ndarray,
+    z_shadow: np.ndarray,
+    signal_codes: np.ndarray,
+    vols: np.ndarray,
+    bias_table: np.ndarray,
+    live_leverage: float,
+    shadow_leverage: float,
+    shadow_risk_mult: float,
+    out_live: np.ndarray,
+    out_shadow: np.ndarray
+) -> None:
+    """
+    Vectorized batch PnL kernel (NumPy fallback for _sim_batch_kernel)
+    
+    PnL = price_move * price * leverage * ($1000 / price); the price cancels,
+    so only the move, leverage and $1000 base position size matter.
+    """
+    active = signal_codes != 0
+    bias = bias_table[signal_codes]
+    np.multiply((z_live + bias) * vols * (live_leverage * 1000.0), active, out=out_live)
+    np.multiply(
+        (z_shadow + bias) * vols * (shadow_risk_mult * shadow_leverage * 1000.0),
+        active,
+        out=out_shadow
+    )
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _sim_batch_kernel(
+        z_live, z_shadow, signal_codes, vols, bias_table,
+        live_leverage, shadow_leverage, shadow_risk_mult,
+        out_live, out_shadow
+    ):
+        """
+        Fused batch PnL kernel: one pass, no intermediate arrays
+        """
+        for i in numba.prange(z_live.shape[0]):
+            code = signal_codes[i]
+            if code == 0:
+                out_live[i] = 0.0
+                out_shadow[i] = 0.0
+            else:
+                bias = bias_table[code]
+                vol = vols[i]
+                out_live[i] = (z_live[i] + bias) * vol * live_leverage * 1000.0
+                out_shadow[i] = (
+                    (z_shadow[i] + bias) * vol * shadow_risk_mult * shadow_leverage * 1000.0
+                )
+
+    _sim_batch = _sim_batch_kernel
+else:
+    _sim_batch = _sim_batch_numpy
+
+
+class TradeResult(NamedTuple):
+    """
+    Result of a simulated shadow/live trade pair
+    """
+    timestamp: float
+    market_signal: str
+    live_pnl: float
+    live_sharpe: float
+    shadow_pnl: float
+    shadow_sharpe: float
+    promotion_alert: Optional[Dict[str, Any]]
+    
+    @property
+    def iso_timestamp(self) -> str:
+        """
+        ISO formatted timestamp, only formatted when actually read
+        
+        Returns:
+            Local time in ISO 8601 format
+        """
+        return datetime.fromtimestamp(self.timestamp).isoformat()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a JSON-friendly dictionary (for dashboards)
+        
+        Returns:
+            Dictionary with an ISO formatted timestamp
+        """
+        result = self._asdict()
+        result['timestamp'] = self.iso_timestamp
+        return result
+
 
 class ShadowStrategy:
     """
     Represents a shadow strategy with higher risk/leverage
     """
     
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        'name',
+        'leverage_multiplier',
+        'risk_multiplier',
+        'roi_history',
+        'sharpe_history',
+        'trade_count',
+        'win_count',
+        'total_pnl'
+    )
+    
     def __init__(
         self,
         name: str,
@@ -102,7 +226,8 @@ class ShadowEngine:
     def __init__(
         self,
         promotion_threshold_iterations: int = 100,
-        sharpe_ratio_threshold: float = 1.2
+        sharpe_ratio_threshold: float = 1.2,
+        seed: Optional[int] = None
     ):
         """
         Initialize Shadow Engine
@@ -110,10 +235,14 @@ class ShadowEngine:
         Args:
             promotion_threshold_iterations: Iterations before promotion check
             sharpe_ratio_threshold: Minimum Sharpe Ratio for promotion
+            seed: Optional RNG seed for reproducible simulations
         """
         self.promotion_threshold_iterations = promotion_threshold_iterations
         self.sharpe_ratio_threshold = sharpe_ratio_threshold
         
+        # Per-instance PCG64 generator (avoids the global `random` state)
+        self._rng = np.random.default_rng(seed)
+        
         # Initialize shadow and live strategies
         self.shadow_strategy = ShadowStrategy(
             name="Shadow-HighRisk",
@@ -129,6 +258,10 @@ class ShadowEngine:
         self.promotion_alerts: List[Dict[str, Any]] = []
         self._lock = threading.Lock()
         
+        # Comparison summary cache, invalidated whenever a trade is committed
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._summary_dirty = True
+        
         logger.info("🌑 Shadow Engine initialized")
     
     def simulate_trade_pair(
@@ -136,7 +269,7 @@ class ShadowEngine:
         market_signal: str,
         market_price: float,
         market_volatility: float = 0.02
-    ) -> Dict[str, Any]:
+    ) -> TradeResult:
         """
         Simulate a trade for both shadow and live strategies
         
@@ -146,51 +279,118 @@ class ShadowEngine:
             market_volatility: Market volatility (default: 2%)
             
         Returns:
-            Simulation results
+            TradeResult with PnL and Sharpe for both strategies
         """
-        import random
-        
-        with self._lock:
-            # Simulate live strategy trade
-            live_pnl = self._simulate_single_trade(
+        # Bind the strategies once so a concurrent reset cannot swap them mid-trade
+        live_strategy = self.live_strategy
+        shadow_strategy = self.shadow_strategy
+        
+        # Hold means no position: skip the simulation and don't count a trade,
+        # since zero-PnL entries would drag the Sharpe ratio towards zero
+        if market_signal == "hold":
+            return TradeResult(
+                time.time(),
                 market_signal,
-                market_price,
-                self.live_strategy.leverage_multiplier,
-                market_volatility
+                0.0,
+                self._calculate_sharpe_ratio(live_strategy),
+                0.0,
+                self._calculate_sharpe_ratio(shadow_strategy),
+                None
             )
-            live_is_winner = live_pnl > 0
-            live_sharpe = self._calculate_sharpe_ratio(self.live_strategy)
-            
-            self.live_strategy.record_trade(live_pnl, live_is_winner, live_sharpe)
-            
-            # Simulate shadow strategy trade (higher risk/reward)
-            shadow_pnl = self._simulate_single_trade(
-                market_signal,
-                market_price,
-                self.shadow_strategy.leverage_multiplier,
-                market_volatility * self.shadow_strategy.risk_multiplier
-            )
-            shadow_is_winner = shadow_pnl > 0
-            shadow_sharpe = self._calculate_sharpe_ratio(self.shadow_strategy)
-            
-            self.shadow_strategy.record_trade(shadow_pnl, shadow_is_winner, shadow_sharpe)
+        
+        # Compute phase (lock-free): simulation and Sharpe only read state.
+        # Sharpe works on a slice of the ROI history, which is an atomic snapshot.
+        live_pnl = self._simulate_single_trade(
+            market_signal,
+            market_price,
+            live_strategy.leverage_multiplier,
+            market_volatility
+        )
+        live_sharpe = self._calculate_sharpe_ratio(live_strategy)
+        
+        # Simulate shadow strategy trade (higher risk/reward)
+        shadow_pnl = self._simulate_single_trade(
+            market_signal,
+            market_price,
+            shadow_strategy.leverage_multiplier,
+            market_volatility * shadow_strategy.risk_multiplier
+        )
+        shadow_sharpe = self._calculate_sharpe_ratio(shadow_strategy)
+        
+        # Commit phase: only state mutation happens under the lock
+        with self._lock:
+            live_strategy.record_trade(live_pnl, live_pnl > 0, live_sharpe)
             
-            # Check for promotion alert
+            # A reset during the compute phase replaced the shadow strategy:
+            # drop this shadow trade rather than credit the retired strategy
             promotion_alert = None
-            if self.shadow_strategy.trade_count >= self.promotion_threshold_iterations:
-                promotion_alert = self._check_promotion_criteria()
+            if self.shadow_strategy is shadow_strategy:
+                shadow_strategy.record_trade(shadow_pnl, shadow_pnl > 0, shadow_sharpe)
+                
+                # Check for promotion alert
+                if shadow_strategy.trade_count >= self.promotion_threshold_iterations:
+                    promotion_alert = self._check_promotion_criteria()
             
-            result = {
-                'timestamp': datetime.now().isoformat(),
-                'market_signal': market_signal,
-                'live_pnl': live_pnl,
-                'live_sharpe': live_sharpe,
-                'shadow_pnl': shadow_pnl,
-                'shadow_sharpe': shadow_sharpe,
-                'promotion_alert': promotion_alert
-            }
+            self._summary_dirty = True
+        
+        return TradeResult(
+            time.time(),
+            market_signal,
+            live_pnl,
+            live_sharpe,
+            shadow_pnl,
+            shadow_sharpe,
+            promotion_alert
+        )
+    
+    def simulate_batch(
+        self,
+        signals: Sequence[str],
+        volatility: Union[float, Sequence[float]] = 0.02
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Simulate PnL for many trades at once (backtests and what-if sweeps)
+        
+        Uses the same model as simulate_trade_pair but does not record the
+        trades on either strategy. Runs as a fused Numba kernel when numba
+        is installed, otherwise as a vectorized NumPy kernel.
+        
+        Args:
+            signals: Trading signals ("buy", "sell", or "hold"), one per trade
+            volatility: Market volatility, either a scalar or one per trade
             
-            return result
+        Returns:
+            Tuple of (live_pnl, shadow_pnl) arrays
+        """
+        n = len(signals)
+        signal_codes = np.fromiter(
+            (_SIGNAL_CODES.get(signal, _OTHER_SIGNAL_CODE) for signal in signals),
+            dtype=np.int8,
+            count=n
+        )
+        vols = np.ascontiguousarray(
+            np.broadcast_to(np.asarray(volatility, dtype=np.float64), (n,))
+        )
+        z_live, z_shadow = self._rng.standard_normal((2, n))
+        
+        live_strategy = self.live_strategy
+        shadow_strategy = self.shadow_strategy
+        out_live = np.empty(n)
+        out_shadow = np.empty(n)
+        _sim_batch(
+            z_live,
+            z_shadow,
+            signal_codes,
+            vols,
+            _BIAS_TABLE,
+            live_strategy.leverage_multiplier,
+            shadow_strategy.leverage_multiplier,
+            shadow_strategy.risk_multiplier,
+            out_live,
+            out_shadow
+        )
+        
+        return out_live, out_shadow
     
     def _simulate_single_trade(
         self,
@@ -203,7 +403,7 @@ class ShadowEngine:
         Simulate a single trade outcome
         
         Args:
-            signal: Trading signal
+            signal: Trading signal ("buy" or "sell"; holds are handled by the caller)
             price: Market price
             leverage: Leverage multiplier
             volatility: Market volatility
@@ -211,23 +411,9 @@ class ShadowEngine:
         Returns:
             Simulated PnL
         """
-        import random
-        
-        if signal == "hold":
-            return 0.0
-        
         # Simulate price movement
-        # Positive bias for correct signals, negative for wrong signals
-        base_move = random.gauss(0, volatility)
-        
-        if signal == "buy":
-            # Assume bullish bias in buy signal
-            price_move = base_move + (volatility * 0.3)  # Slight bullish bias
-        elif signal == "sell":
-            # Assume bearish bias in sell signal
-            price_move = base_move - (volatility * 0.3)  # Slight bearish bias
-        else:
-            price_move = base_move
+        # Slight bullish bias for buy signals, bearish bias for sell signals
+        price_move = self._rng.normal(0.0, volatility) + _BIAS_MAP.get(signal, 0.0) * volatility
         
         # Calculate PnL with leverage
         base_position_size = 1000.0  # $1000 base
@@ -263,7 +449,7 @@ class ShadowEngine:
             return 0.0
         
         # Annualized Sharpe (assuming daily returns)
-        sharpe = (avg_return / std_return) * (252 ** 0.5)
+        sharpe = (avg_return / std_return) * _SQRT_252
         
         return sharpe
     
@@ -315,14 +501,20 @@ class ShadowEngine:
         """
         Get comparison summary between shadow and live strategies
         
+        The summary is cached until the next trade is recorded, so repeated
+        dashboard polls between trades do not rebuild it. Treat it as read-only.
+        
         Returns:
             Comparison statistics
         """
         with self._lock:
+            if not self._summary_dirty and self._summary_cache is not None:
+                return self._summary_cache
+            
             shadow_stats = self.shadow_strategy.get_stats()
             live_stats = self.live_strategy.get_stats()
             
-            return {
+            self._summary_cache = {
                 'timestamp': datetime.now().isoformat(),
                 'shadow': shadow_stats,
                 'live': live_stats,
@@ -337,6 +529,9 @@ class ShadowEngine:
                     self.promotion_alerts[-1] if self.promotion_alerts else None
                 )
             }
+            self._summary_dirty = False
+            
+            return self._summary_cache
     
     def reset_shadow_strategy(
         self,
@@ -356,6 +551,7 @@ class ShadowEngine:
                 leverage_multiplier=leverage_multiplier,
                 risk_multiplier=risk_multiplier
             )
+            self._summary_dirty = True
             logger.info(
                 f"🔄 Shadow strategy reset: "
                 f"leverage={leverage_multiplier}x, risk={risk_multiplier}x"
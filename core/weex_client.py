@@ -3,17 +3,191 @@ WEEX Native Client - Native Python client using aiohttp
 Implements direct API access to WEEX exchange with precision enforcement
 """
 import aiohttp
+import asyncio
 import hmac
-import hashlib
 import json
+import numpy as np
 import time
 import logging
-from typing import Dict, Any, Optional, List
-from decimal import Decimal, ROUND_DOWN
+import math
+from typing import Callable, Dict, Any, Optional, List, Sequence, Tuple, Union
+from decimal import Decimal
+
+from core.hmac_batch import hmac_sha256_hex_batch
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available - order serialization will use json")
+
+CONTRACTS_ENDPOINT = "/capi/v2/market/contracts"
+PLACE_ORDER_ENDPOINT = "/capi/v2/order/placeOrder"
+
+# Pre-encoded signing components, so the hot path only encodes the timestamp
+_GET = b"GET"
+_POST = b"POST"
+_CONTRACTS_ENDPOINT_B = CONTRACTS_ENDPOINT.encode('utf-8')
+_PLACE_ORDER_ENDPOINT_B = PLACE_ORDER_ENDPOINT.encode('utf-8')
+
+
+def _as_bytes(value: Union[str, bytes]) -> bytes:
+    """Return value as UTF-8 bytes, without copying if it already is bytes"""
+    return value if isinstance(value, bytes) else value.encode('utf-8')
+
+
+def _timestamp_ms() -> str:
+    """Current time in milliseconds, from integer nanoseconds (no float round-trip)"""
+    return str(time.time_ns() // 1_000_000)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize a request payload to compact JSON bytes
+    
+    Both paths produce identical bytes, so signatures do not depend on
+    whether orjson is installed.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _to_ticks(increment: Decimal) -> Tuple[int, int]:
+    """
+    Express a decimal increment as an integer count of 10**-decimals units
+    
+    Args:
+        increment: Tick size or size increment (e.g. Decimal('0.01'))
+        
+    Returns:
+        (increment_int, decimals), e.g. (1, 2) for 0.01
+    """
+    exponent = increment.as_tuple().exponent
+    decimals = max(-exponent, 0)
+    return int(increment.scaleb(decimals)), decimals
+
+
+def _add_integer_precision(market_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Store integer-tick versions of tick_size/size_increment on a market info entry
+    
+    Args:
+        market_info: Cached market info with Decimal tick_size and size_increment
+        
+    Returns:
+        The same dict, updated in place
+    """
+    tick_size_int, tick_decimals = _to_ticks(market_info['tick_size'])
+    size_increment_int, size_decimals = _to_ticks(market_info['size_increment'])
+    market_info.update({
+        'tick_size_int': tick_size_int,
+        'tick_decimals': tick_decimals,
+        'tick_scale': 10 ** tick_decimals,
+        'size_increment_int': size_increment_int,
+        'size_decimals': size_decimals,
+        'size_scale': 10 ** size_decimals,
+        'min_order_size_float': float(market_info.get('min_order_size', 0)),
+        'max_order_size_float': float(market_info.get('max_order_size', 0))
+    })
+    return market_info
+
+
+def _floor_to_increment(value: float, scale: int, increment_int: int) -> int:
+    """
+    Round value down to a multiple of increment_int / scale, in integer units of 1/scale
+    
+    Products within a few ulps of an integer snap to it, so float noise such
+    as 0.123 * 1000 == 122.99999999999999 does not drop a whole tick.
+    """
+    scaled = value * scale
+    nearest = round(scaled)
+    if abs(scaled - nearest) <= 4 * math.ulp(scaled):
+        units = nearest
+    else:
+        units = math.floor(scaled)
+    return (units // increment_int) * increment_int
+
+
+def _is_on_increment(value: float, scale: int, increment_int: int) -> bool:
+    """
+    Check that value is a multiple of increment_int / scale
+    
+    Uses the same few-ulps tolerance as _floor_to_increment.
+    """
+    scaled = value * scale
+    nearest = round(scaled)
+    return abs(scaled - nearest) <= 4 * math.ulp(scaled) and nearest % increment_int == 0
+
+
+def _on_increment(values: np.ndarray, scale: int, increment_int: int) -> np.ndarray:
+    """
+    Vectorized _is_on_increment
+    """
+    scaled = values * scale
+    nearest = np.rint(scaled)
+    near_integer = np.abs(scaled - nearest) <= 4 * np.spacing(np.abs(scaled))
+    return near_integer & (nearest.astype(np.int64) % increment_int == 0)
+
+
+def _floor_units(values: np.ndarray, scale: int, increment_int: int) -> np.ndarray:
+    """
+    Vectorized _floor_to_increment, returning int64 units of 1/scale
+    """
+    scaled = values * scale
+    nearest = np.rint(scaled)
+    near_integer = np.abs(scaled - nearest) <= 4 * np.spacing(np.abs(scaled))
+    units = np.where(near_integer, nearest, np.floor(scaled)).astype(np.int64)
+    return (units // increment_int) * increment_int
+
+
+def _make_precision_fn(market_info: Dict[str, Any]) -> Callable[[float, float], Tuple[Decimal, Decimal]]:
+    """
+    Build a precision adjuster specialized to one symbol's market info
+    
+    The tick/size constants become closure variables, so adjusting an order
+    does no dict lookups.
+    
+    Args:
+        market_info: Market info with integer-tick fields (see _add_integer_precision)
+    
+    Returns:
+        adjust(price, size) -> (adjusted_price, adjusted_size)
+    """
+    tick_scale = market_info['tick_scale']
+    tick_int = market_info['tick_size_int']
+    tick_exp = -market_info['tick_decimals']
+    size_scale = market_info['size_scale']
+    size_int = market_info['size_increment_int']
+    size_exp = -market_info['size_decimals']
+    min_size = market_info.get('min_order_size', Decimal('0'))
+    max_size = market_info.get('max_order_size', Decimal('0'))
+    has_max = max_size > 0
+    
+    def adjust(price: float, size: float) -> Tuple[Decimal, Decimal]:
+        # Note: Rounding down to ensure we never exceed available funds
+        # This results in slightly smaller orders but prevents rejection
+        adjusted_price = Decimal(_floor_to_increment(price, tick_scale, tick_int)).scaleb(tick_exp)
+        adjusted_size = Decimal(_floor_to_increment(size, size_scale, size_int)).scaleb(size_exp)
+        
+        # Validate against min/max order sizes
+        if adjusted_size < min_size:
+            logger.warning(f"Order size {adjusted_size} below minimum {min_size}")
+            adjusted_size = min_size
+        
+        if has_max and adjusted_size > max_size:
+            logger.warning(f"Order size {adjusted_size} above maximum {max_size}")
+            adjusted_size = max_size
+        
+        logger.info(f"Precision adjusted: price {price} -> {adjusted_price}, size {size} -> {adjusted_size}")
+        return adjusted_price, adjusted_size
+    
+    return adjust
+
 
 class WEEXClient:
     """
@@ -39,23 +213,77 @@ class WEEXClient:
         """
         self.api_key = api_key
         self.api_secret = api_secret
+        self._secret_bytes = api_secret.encode('utf-8')  # Encoded once, reused per signature
         self.api_password = api_password
+        
+        # Headers that are identical on every request; only the signature
+        # and timestamp are filled in per call
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "WEEX-ACCESS-KEY": api_key,
+        }
+        if api_password:
+            self._base_headers["WEEX-ACCESS-PASSPHRASE"] = api_password
         self.session: Optional[aiohttp.ClientSession] = None
         self.market_info_cache: Dict[str, Dict[str, Any]] = {}
         
+        # Per-symbol precision adjusters, keyed to the market info they were built from
+        self._precision_fns: Dict[str, Tuple[Dict[str, Any], Callable[[float, float], Tuple[Decimal, Decimal]]]] = {}
+        
+        # Connection pool shared by every 'async with' block on this client;
+        # created lazily because connectors are bound to the running event loop
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._connector_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_refs = 0
+        
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        loop = asyncio.get_running_loop()
+        if self._connector is None or self._connector.closed or self._connector_loop is not loop:
+            self._connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self._connector_loop = loop
+        
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=self._connector,
+                connector_owner=False
+            )
+        self._session_refs += 1
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
+        """Async context manager exit (keeps the connection pool warm)"""
+        self._session_refs -= 1
+        if self._session_refs == 0 and self.session:
+            await self.session.close()
+            self.session = None
+    
+    async def close(self):
+        """Close the session and release the pooled connections"""
         if self.session:
             await self.session.close()
+            self.session = None
+        self._session_refs = 0
+        if self._connector:
+            await self._connector.close()
+            self._connector = None
     
-    def _generate_signature(self, timestamp: str, method: str, endpoint: str, body: str = "") -> str:
+    def _generate_signature(
+        self,
+        timestamp: Union[str, bytes],
+        method: Union[str, bytes],
+        endpoint: Union[str, bytes],
+        body: Union[str, bytes] = b""
+    ) -> str:
         """
         Generate HMAC SHA256 signature for WEEX API
+        Arguments may be str or pre-encoded bytes
         
         Args:
             timestamp: Request timestamp in milliseconds
@@ -66,15 +294,38 @@ class WEEXClient:
         Returns:
             HMAC signature
         """
-        message = f"{timestamp}{method}{endpoint}{body}"
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        message = b"".join((
+            _as_bytes(timestamp),
+            _as_bytes(method),
+            _as_bytes(endpoint),
+            _as_bytes(body)
+        ))
+        # One-shot hmac.digest runs entirely in OpenSSL (no HMAC object per call)
+        return hmac.digest(self._secret_bytes, message, 'sha256').hex()
     
-    def _get_headers(self, timestamp: str, method: str, endpoint: str, body: str = "") -> Dict[str, str]:
+    def sign_batch(self, messages: List[Tuple[Union[str, bytes], ...]]) -> List[str]:
+        """
+        Sign many requests at once (e.g. synthetic orders in paper trading)
+        
+        Args:
+            messages: (timestamp, method, endpoint[, body]) tuples, as passed
+                to _generate_signature
+        
+        Returns:
+            Hex signatures, in input order
+        """
+        return hmac_sha256_hex_batch(
+            self._secret_bytes,
+            [b"".join(map(_as_bytes, parts)) for parts in messages]
+        )
+    
+    def _get_headers(
+        self,
+        timestamp: str,
+        method: Union[str, bytes],
+        endpoint: Union[str, bytes],
+        body: Union[str, bytes] = b""
+    ) -> Dict[str, str]:
         """
         Generate request headers with authentication
         
@@ -89,17 +340,11 @@ class WEEXClient:
         """
         signature = self._generate_signature(timestamp, method, endpoint, body)
         
-        headers = {
-            "Content-Type": "application/json",
-            "WEEX-ACCESS-KEY": self.api_key,
+        return {
+            **self._base_headers,
             "WEEX-ACCESS-SIGN": signature,
             "WEEX-ACCESS-TIMESTAMP": timestamp,
         }
-        
-        if self.api_password:
-            headers["WEEX-ACCESS-PASSPHRASE"] = self.api_password
-        
-        return headers
     
     async def get_market_contracts(self) -> List[Dict[str, Any]]:
         """
@@ -112,13 +357,12 @@ class WEEXClient:
         if not self.session:
             raise RuntimeError("Client session not initialized. Use 'async with' context manager.")
         
-        endpoint = "/capi/v2/market/contracts"
-        timestamp = str(int(time.time() * 1000))
-        headers = self._get_headers(timestamp, "GET", endpoint)
+        timestamp = _timestamp_ms()
+        headers = self._get_headers(timestamp, _GET, _CONTRACTS_ENDPOINT_B)
         
         try:
             async with self.session.get(
-                f"{self.BASE_URL}{endpoint}",
+                f"{self.BASE_URL}{CONTRACTS_ENDPOINT}",
                 headers=headers
             ) as response:
                 response.raise_for_status()
@@ -127,17 +371,22 @@ class WEEXClient:
                 # Cache market info for precision enforcement
                 if data.get('code') == 200 and data.get('data'):
                     contracts = data['data']
-                    for contract in contracts:
-                        symbol = contract.get('symbol')
-                        if symbol:
-                            self.market_info_cache[symbol] = {
-                                'tick_size': Decimal(str(contract.get('tickSize', '0.01'))),
-                                'size_increment': Decimal(str(contract.get('sizeIncrement', '0.001'))),
-                                'min_order_size': Decimal(str(contract.get('minOrderSize', '0'))),
-                                'max_order_size': Decimal(str(contract.get('maxOrderSize', '0'))),
-                                'contract_type': contract.get('contractType'),
-                                'status': contract.get('status')
-                            }
+                    _D = Decimal
+                    # Merge rather than replace so manually cached symbols survive
+                    self.market_info_cache.update({
+                        c['symbol']: _add_integer_precision({
+                            'tick_size': _D(str(c.get('tickSize', '0.01'))),
+                            'size_increment': _D(str(c.get('sizeIncrement', '0.001'))),
+                            'min_order_size': _D(str(c.get('minOrderSize', '0'))),
+                            'max_order_size': _D(str(c.get('maxOrderSize', '0'))),
+                            'contract_type': c.get('contractType'),
+                            'status': c.get('status')
+                        })
+                        for c in contracts if c.get('symbol')
+                    })
+                    for c in contracts:
+                        if c.get('symbol'):
+                            self._precision_fn(c['symbol'])
                     
                     logger.info(f"Fetched {len(contracts)} market contracts")
                     return contracts
@@ -152,6 +401,40 @@ class WEEXClient:
             logger.error(f"Error fetching contracts: {str(e)}")
             raise
     
+    def _get_precision_info(self, symbol: str) -> Dict[str, Any]:
+        """
+        Get cached market info for a symbol, with integer-tick fields filled in
+        
+        Args:
+            symbol: Trading symbol (must be in market_info_cache)
+            
+        Returns:
+            Market info dict
+        """
+        market_info = self.market_info_cache[symbol]
+        if 'tick_size_int' not in market_info:
+            # Entries set directly (not via get_market_contracts) lack the integer fields
+            _add_integer_precision(market_info)
+        return market_info
+    
+    def _precision_fn(self, symbol: str) -> Callable[[float, float], Tuple[Decimal, Decimal]]:
+        """
+        Get the specialized precision adjuster for a symbol, (re)building it
+        when its market info entry has been replaced
+        
+        Args:
+            symbol: Trading symbol (must be in market_info_cache)
+        
+        Returns:
+            adjust(price, size) -> (adjusted_price, adjusted_size)
+        """
+        market_info = self.market_info_cache[symbol]
+        cached = self._precision_fns.get(symbol)
+        if cached is None or cached[0] is not market_info:
+            cached = (market_info, _make_precision_fn(self._get_precision_info(symbol)))
+            self._precision_fns[symbol] = cached
+        return cached[1]
+    
     def _enforce_precision(self, symbol: str, price: float, size: float) -> tuple[Decimal, Decimal]:
         """
         Enforce tick_size and size_increment precision from Discovery Agent
@@ -168,35 +451,7 @@ class WEEXClient:
             logger.warning(f"No market info cached for {symbol}. Using defaults.")
             return Decimal(str(price)), Decimal(str(size))
         
-        market_info = self.market_info_cache[symbol]
-        tick_size = market_info['tick_size']
-        size_increment = market_info['size_increment']
-        
-        # Adjust price to tick_size precision
-        # Note: Using ROUND_DOWN to ensure we never exceed available funds
-        # This results in slightly smaller orders but prevents rejection
-        price_decimal = Decimal(str(price))
-        adjusted_price = (price_decimal / tick_size).quantize(Decimal('1'), rounding=ROUND_DOWN) * tick_size
-        
-        # Adjust size to size_increment precision
-        # Note: Using ROUND_DOWN to ensure we never exceed available funds
-        size_decimal = Decimal(str(size))
-        adjusted_size = (size_decimal / size_increment).quantize(Decimal('1'), rounding=ROUND_DOWN) * size_increment
-        
-        # Validate against min/max order sizes
-        min_size = market_info.get('min_order_size', Decimal('0'))
-        max_size = market_info.get('max_order_size', Decimal('0'))
-        
-        if adjusted_size < min_size:
-            logger.warning(f"Order size {adjusted_size} below minimum {min_size}")
-            adjusted_size = min_size
-        
-        if max_size > 0 and adjusted_size > max_size:
-            logger.warning(f"Order size {adjusted_size} above maximum {max_size}")
-            adjusted_size = max_size
-        
-        logger.info(f"Precision adjusted: price {price} -> {adjusted_price}, size {size} -> {adjusted_size}")
-        return adjusted_price, adjusted_size
+        return self._precision_fn(symbol)(price, size)
     
     async def place_order(
         self,
@@ -233,8 +488,7 @@ class WEEXClient:
             _, adjusted_size = self._enforce_precision(symbol, 0, size)
             adjusted_price = None
         
-        endpoint = "/capi/v2/order/placeOrder"
-        timestamp = str(int(time.time() * 1000))
+        timestamp = _timestamp_ms()
         
         # Build order payload
         order_data = {
@@ -250,12 +504,12 @@ class WEEXClient:
         # Add any additional parameters
         order_data.update(kwargs)
         
-        body = json.dumps(order_data)
-        headers = self._get_headers(timestamp, "POST", endpoint, body)
+        body = _dumps(order_data)
+        headers = self._get_headers(timestamp, _POST, _PLACE_ORDER_ENDPOINT_B, body)
         
         try:
             async with self.session.post(
-                f"{self.BASE_URL}{endpoint}",
+                f"{self.BASE_URL}{PLACE_ORDER_ENDPOINT}",
                 headers=headers,
                 data=body
             ) as response:
@@ -304,18 +558,177 @@ class WEEXClient:
             logger.warning(f"Cannot validate precision - no market info for {symbol}")
             return False
         
+        if self._is_tick_aligned(symbol, price, size):
+            return True
+        
+        # Misaligned: compute the adjusted values for the log message only
         adjusted_price, adjusted_size = self._enforce_precision(symbol, price, size)
         
-        # Check if adjustment was needed
-        price_matches = abs(float(adjusted_price) - price) < 1e-10
-        size_matches = abs(float(adjusted_size) - size) < 1e-10
+        # Exact Decimal comparison; the float round-trip would reintroduce FP error
+        price_matches = adjusted_price == Decimal(str(price))
+        size_matches = adjusted_size == Decimal(str(size))
         
-        if not price_matches or not size_matches:
-            logger.warning(
-                f"Order parameters need adjustment:\n"
-                f"  Price: {price} -> {adjusted_price} (match: {price_matches})\n"
-                f"  Size: {size} -> {adjusted_size} (match: {size_matches})"
-            )
+        logger.warning(
+            f"Order parameters need adjustment:\n"
+            f"  Price: {price} -> {adjusted_price} (match: {price_matches})\n"
+            f"  Size: {size} -> {adjusted_size} (match: {size_matches})"
+        )
+        return False
+    
+    def _is_tick_aligned(self, symbol: str, price: float, size: float) -> bool:
+        """
+        Check an order needs no precision adjustment, using integer ticks only
+        
+        Args:
+            symbol: Trading symbol (must be in market_info_cache)
+            price: Order price
+            size: Order size
+            
+        Returns:
+            True if _enforce_precision would leave price and size unchanged
+        """
+        market_info = self._get_precision_info(symbol)
+        
+        if not _is_on_increment(price, market_info['tick_scale'], market_info['tick_size_int']):
             return False
         
-        return True
+        # Sizes outside the order limits would be clamped by _enforce_precision,
+        # which also makes a size exactly at the minimum valid
+        min_size = market_info['min_order_size_float']
+        max_size = market_info['max_order_size_float']
+        if size == min_size:
+            return True
+        if size < min_size or (max_size > 0 and size > max_size):
+            return False
+        return _is_on_increment(size, market_info['size_scale'], market_info['size_increment_int'])
+    
+    def precision_context(self, symbol: str) -> Tuple[float, float]:
+        """
+        Get a symbol's tick size and size increment as plain floats
+        
+        Args:
+            symbol: Trading symbol (must be in market_info_cache)
+            
+        Returns:
+            (tick_size, size_increment)
+        """
+        market_info = self._get_precision_info(symbol)
+        return (
+            market_info['tick_size_int'] / market_info['tick_scale'],
+            market_info['size_increment_int'] / market_info['size_scale']
+        )
+    
+    def enforce_precision_batch(
+        self,
+        symbol: str,
+        prices: np.ndarray,
+        sizes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized _enforce_precision for many orders on one symbol
+        
+        Prices and sizes are rounded down in integer tick units, so each
+        result is the float nearest the Decimal _enforce_precision returns.
+        Convert with Decimal(str(value)) only when an order is submitted.
+        
+        Args:
+            symbol: Trading symbol
+            prices: Order prices
+            sizes: Order sizes (same length as prices)
+            
+        Returns:
+            (adjusted_prices, adjusted_sizes) as float64 arrays
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        
+        if symbol not in self.market_info_cache:
+            logger.warning(f"No market info cached for {symbol}. Using defaults.")
+            return prices.copy(), sizes.copy()
+        
+        market_info = self._get_precision_info(symbol)
+        tick_scale = market_info['tick_scale']
+        size_scale = market_info['size_scale']
+        
+        adjusted_prices = _floor_units(prices, tick_scale, market_info['tick_size_int']) / tick_scale
+        adjusted_sizes = _floor_units(sizes, size_scale, market_info['size_increment_int']) / size_scale
+        
+        # Same min/max clamping as the scalar path
+        adjusted_sizes = np.maximum(adjusted_sizes, market_info['min_order_size_float'])
+        max_size = market_info['max_order_size_float']
+        if max_size > 0:
+            adjusted_sizes = np.minimum(adjusted_sizes, max_size)
+        
+        return adjusted_prices, adjusted_sizes
+    
+    def enforce_precision_multi(
+        self,
+        symbols: Sequence[str],
+        prices: np.ndarray,
+        sizes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        enforce_precision_batch for orders spread across several symbols
+        
+        Orders are grouped by symbol so each market's precision info is
+        looked up once; results come back in input order.
+        
+        Args:
+            symbols: Trading symbol of each order
+            prices: Order prices
+            sizes: Order sizes (same length as prices)
+            
+        Returns:
+            (adjusted_prices, adjusted_sizes) as float64 arrays
+        """
+        symbols = np.asarray(symbols)
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        
+        adjusted_prices = np.empty_like(prices)
+        adjusted_sizes = np.empty_like(sizes)
+        for symbol in dict.fromkeys(symbols.tolist()):
+            mask = symbols == symbol
+            adjusted_prices[mask], adjusted_sizes[mask] = self.enforce_precision_batch(
+                symbol, prices[mask], sizes[mask]
+            )
+        
+        return adjusted_prices, adjusted_sizes
+    
+    def validate_batch(self, symbol: str, prices: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+        """
+        Validate many (price, size) pairs for one symbol at once
+        
+        Same rules as validate_order_precision: the price must sit on a
+        tick, the size on a size increment and within min/max order size.
+        
+        Args:
+            symbol: Trading symbol
+            prices: Order prices
+            sizes: Order sizes (same length as prices)
+            
+        Returns:
+            Boolean array, True where the order needs no adjustment
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        sizes = np.asarray(sizes, dtype=np.float64)
+        
+        if symbol not in self.market_info_cache:
+            logger.warning(f"Cannot validate precision - no market info for {symbol}")
+            return np.zeros(prices.shape, dtype=bool)
+        
+        market_info = self._get_precision_info(symbol)
+        
+        price_ok = _on_increment(prices, market_info['tick_scale'], market_info['tick_size_int'])
+        size_ok = _on_increment(sizes, market_info['size_scale'], market_info['size_increment_int'])
+        
+        # Sizes outside the order limits would be clamped by _enforce_precision,
+        # which also makes a size exactly at the minimum valid
+        min_size = market_info['min_order_size_float']
+        max_size = market_info['max_order_size_float']
+        size_ok &= sizes >= min_size
+        if max_size > 0:
+            size_ok &= sizes <= max_size
+        size_ok |= sizes == min_size
+        
+        return price_ok & size_ok
@@ -9,35 +9,184 @@ from pathlib import Path
 from datetime import datetime
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+from collections import deque
 import sys
 import os
+import threading
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from data.logger import ReasoningLogger
-from data.memory import EvolutionMemory
+from data.memory import EvolutionMemory, journal_file_for
+from data.logger import find_thought_tags, load_trace_line
 
+_RECENT_TRACES = 10  # The thinking log only shows the latest trace and the last 10
+_WEBGL_MIN_POINTS = 1000  # Series at least this long render with WebGL instead of SVG
 
-def load_reasoning_logs(log_file: str = "../data/reasoning_logs.jsonl") -> List[Dict]:
-    """Load reasoning logs from JSONL file"""
-    logger = ReasoningLogger(log_file)
-    return logger.read_recent_traces(count=100)
 
+def _file_version(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, used as a cache key; None if it doesn't exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
-def load_evolution_history(history_file: str = "../data/evolution_history.json") -> Dict:
-    """Load evolution history"""
+
+@st.cache_resource(show_spinner=False)
+def _get_log_tail(log_file: str, count: int) -> Dict[str, Any]:
+    """
+    Process-wide tail state for a JSONL log: byte offset read so far, the
+    number of complete lines seen and the last `count` parsed traces
+    """
+    return {
+        'lock': threading.Lock(),
+        'inode': None,
+        'offset': 0,
+        'total': 0,
+        'traces': deque(maxlen=count)
+    }
+
+
+def _tail_reasoning_logs(log_file: str, count: int) -> Tuple[List[Dict], int]:
+    """
+    Parse only the lines appended since the previous read
+    
+    Starts over when the file was rotated or truncated. A trailing partial
+    line (writer mid-append) is left for the next read. Lines that would
+    fall out of the `count`-sized window are counted but never parsed.
+    """
+    tail = _get_log_tail(log_file, count)
+    
+    with tail['lock']:
+        with open(log_file, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != tail['inode'] or stat.st_size < tail['offset']:
+                tail['inode'] = stat.st_ino
+                tail['offset'] = 0
+                tail['total'] = 0
+                tail['traces'].clear()
+            
+            f.seek(tail['offset'])
+            chunk = f.read()
+        
+        end = chunk.rfind(b'\n') + 1
+        lines = chunk[:end].splitlines()
+        tail['total'] += len(lines)
+        for line in lines[-count:]:
+            try:
+                tail['traces'].append(load_trace_line(line))
+            except json.JSONDecodeError:
+                continue
+        tail['offset'] += end
+        
+        return list(tail['traces']), tail['total']
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _load_reasoning_logs_cached(log_file: str, version: Tuple[int, int], count: int) -> Tuple[List[Dict], int]:
+    """Cached trace load; `version` only serves as the cache key"""
+    return _tail_reasoning_logs(log_file, count)
+
+
+def load_reasoning_logs(log_file: str = "../data/reasoning_logs.jsonl", count: int = _RECENT_TRACES) -> List[Dict]:
+    """Load the last `count` reasoning logs from JSONL file (re-read only when the file changes)"""
+    version = _file_version(log_file)
+    if version is None:
+        return []
+    return _load_reasoning_logs_cached(log_file, version, count)[0]
+
+
+def count_reasoning_logs(log_file: str = "../data/reasoning_logs.jsonl", count: int = _RECENT_TRACES) -> int:
+    """Total number of logged traces (shares the tail load, nothing extra is parsed)"""
+    version = _file_version(log_file)
+    if version is None:
+        return 0
+    return _load_reasoning_logs_cached(log_file, version, count)[1]
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _load_evolution_history_cached(history_file: str, version: Tuple[Optional[Tuple[int, int]], ...]) -> Dict:
+    """Cached history load; `version` only serves as the cache key"""
     memory = EvolutionMemory(history_file)
     return memory.data
 
 
+def load_evolution_history(history_file: str = "../data/evolution_history.json") -> Dict:
+    """Load evolution history (re-read only when the snapshot or its journal changes)"""
+    version = (_file_version(history_file), _file_version(str(journal_file_for(history_file))))
+    return _load_evolution_history_cached(history_file, version)
+
+
 def parse_thought_tags(response: str) -> List[str]:
     """Extract thought tags from response"""
-    import re
-    pattern = r'<thought>(.*?)</thought>'
-    thoughts = re.findall(pattern, response, re.DOTALL)
-    return [thought.strip() for thought in thoughts]
+    return [thought.strip() for thought in find_thought_tags(response)]
+
+
+def _scatter_trace(n_points: int):
+    """Scatter trace class for a series: SVG for small ones, WebGL for large ones"""
+    return go.Scattergl if n_points >= _WEBGL_MIN_POINTS else go.Scatter
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _build_timeline_fig(timeline_df: pd.DataFrame) -> go.Figure:
+    """Build the strategy evolution timeline (cached on the DataFrame contents)"""
+    fig = go.Figure()
+    
+    fig.add_trace(_scatter_trace(len(timeline_df))(
+        x=timeline_df['Timestamp'],
+        y=timeline_df.index,
+        mode='markers+lines+text',
+        marker=dict(size=15, color='lightblue'),
+        text=timeline_df['Version'],
+        textposition='top center',
+        name='Evolutions'
+    ))
+    
+    fig.update_layout(
+        title="Strategy Evolution Timeline",
+        xaxis_title="Date",
+        yaxis_title="Version",
+        height=400,
+        uirevision='static'
+    )
+    
+    return fig
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _build_pnl_fig(pnl_df: pd.DataFrame) -> go.Figure:
+    """Build the PnL vs kill-switch chart (cached on the DataFrame contents)"""
+    fig = go.Figure()
+    
+    # PnL line (float32 halves the serialized payload)
+    fig.add_trace(_scatter_trace(len(pnl_df))(
+        x=pnl_df['Timestamp'].values,
+        y=pnl_df['PnL'].astype('float32').values,
+        mode='lines+markers',
+        name='PnL',
+        line=dict(color='green')
+    ))
+    
+    # 3% kill-switch threshold line (assuming initial equity of 1000)
+    threshold = -30  # 3% of 1000
+    fig.add_hline(
+        y=threshold,
+        line_dash="dash",
+        line_color="red",
+        annotation_text="Kill-Switch Threshold (-3%)"
+    )
+    
+    fig.update_layout(
+        title="PnL Over Time",
+        xaxis_title="Date",
+        yaxis_title="PnL ($)",
+        height=400,
+        uirevision='static'
+    )
+    
+    return fig
 
 
 def render_thinking_log():
@@ -97,17 +246,19 @@ def render_thinking_log():
         st.markdown("---")
         st.subheader("Recent Reasoning Traces")
         
-        # Convert to DataFrame for display
-        trace_df = pd.DataFrame([
-            {
-                'Timestamp': datetime.fromisoformat(t['timestamp']).strftime("%Y-%m-%d %H:%M"),
-                'Source': t.get('source', 'Unknown'),
-                'Thoughts': t.get('thought_count', 0),
-                'Signal': t.get('metadata', {}).get('signal', 'N/A'),
-                'Confidence': f"{t.get('metadata', {}).get('confidence', 0):.1%}" if t.get('metadata', {}).get('confidence') else 'N/A'
-            }
-            for t in traces[-10:]
-        ])
+        # Convert to DataFrame for display (built column-wise)
+        columns = {'Timestamp': [], 'Source': [], 'Thoughts': [], 'Signal': [], 'Confidence': []}
+        for t in traces[-_RECENT_TRACES:]:
+            metadata = t.get('metadata') or {}
+            confidence = metadata.get('confidence')
+            # ISO timestamps: slicing gives "YYYY-MM-DD HH:MM" without parsing
+            columns['Timestamp'].append(t['timestamp'][:16].replace('T', ' '))
+            columns['Source'].append(t.get('source', 'Unknown'))
+            columns['Thoughts'].append(t.get('thought_count', 0))
+            columns['Signal'].append(metadata.get('signal', 'N/A'))
+            columns['Confidence'].append(f"{confidence:.1%}" if confidence else 'N/A')
+        
+        trace_df = pd.DataFrame(columns)
         
         st.dataframe(trace_df, use_container_width=True)
         
@@ -147,39 +298,21 @@ def render_strategy_lineage():
         # Display evolution timeline
         st.subheader("Evolution Timeline")
         
-        # Create timeline visualization
-        timeline_data = []
+        # Create timeline visualization (built column-wise)
+        timeline_data = {'Version': [], 'Timestamp': [], 'Reason': [], 'PnL': []}
         for i, evo in enumerate(evolutions):
-            timestamp = datetime.fromisoformat(evo['timestamp'])
-            timeline_data.append({
-                'Version': f"v{i+1}",
-                'Timestamp': timestamp,
-                'Reason': evo.get('reason', 'Unknown'),
-                'PnL': evo.get('final_pnl', evo.get('current_pnl', 'Pending'))
-            })
+            timeline_data['Version'].append(f"v{i+1}")
+            timeline_data['Timestamp'].append(evo['timestamp'])
+            timeline_data['Reason'].append(evo.get('reason', 'Unknown'))
+            timeline_data['PnL'].append(evo.get('final_pnl', evo.get('current_pnl', 'Pending')))
         
+        # Parse the whole timestamp column at once instead of per row
+        timeline_data['Timestamp'] = pd.to_datetime(timeline_data['Timestamp'], format='ISO8601', cache=True)
         timeline_df = pd.DataFrame(timeline_data)
+        display_times = timeline_df['Timestamp'].dt.strftime("%Y-%m-%d %H:%M:%S").tolist()
         
         # Plot timeline
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=timeline_df['Timestamp'],
-            y=timeline_df.index,
-            mode='markers+lines+text',
-            marker=dict(size=15, color='lightblue'),
-            text=timeline_df['Version'],
-            textposition='top center',
-            name='Evolutions'
-        ))
-        
-        fig.update_layout(
-            title="Strategy Evolution Timeline",
-            xaxis_title="Date",
-            yaxis_title="Version",
-            height=400
-        )
-        
+        fig = _build_timeline_fig(timeline_df)
         st.plotly_chart(fig, use_container_width=True)
         
         # Display evolution details
@@ -191,7 +324,7 @@ def render_strategy_lineage():
                 
                 with col1:
                     st.markdown("**Timestamp:**")
-                    st.text(datetime.fromisoformat(evo['timestamp']).strftime("%Y-%m-%d %H:%M:%S"))
+                    st.text(display_times[i])
                     
                     st.markdown("**Reason:**")
                     st.text(evo.get('reason', 'Unknown'))
@@ -268,46 +401,18 @@ def render_live_metrics():
         
         # Generate sample PnL data
         if evolutions:
-            pnl_data = []
+            pnl_data = {'Version': [], 'PnL': [], 'Timestamp': []}
             for i, evo in enumerate(evolutions):
                 pnl = evo.get('final_pnl', evo.get('current_pnl', 0))
                 if isinstance(pnl, (int, float)):
-                    pnl_data.append({
-                        'Version': f"v{i+1}",
-                        'PnL': pnl,
-                        'Timestamp': datetime.fromisoformat(evo['timestamp'])
-                    })
+                    pnl_data['Version'].append(f"v{i+1}")
+                    pnl_data['PnL'].append(pnl)
+                    pnl_data['Timestamp'].append(evo['timestamp'])
             
-            if pnl_data:
+            if pnl_data['PnL']:
+                pnl_data['Timestamp'] = pd.to_datetime(pnl_data['Timestamp'], format='ISO8601', cache=True)
                 pnl_df = pd.DataFrame(pnl_data)
-                
-                fig = go.Figure()
-                
-                # PnL line
-                fig.add_trace(go.Scatter(
-                    x=pnl_df['Timestamp'],
-                    y=pnl_df['PnL'],
-                    mode='lines+markers',
-                    name='PnL',
-                    line=dict(color='green')
-                ))
-                
-                # 3% kill-switch threshold line (assuming initial equity of 1000)
-                threshold = -30  # 3% of 1000
-                fig.add_hline(
-                    y=threshold,
-                    line_dash="dash",
-                    line_color="red",
-                    annotation_text="Kill-Switch Threshold (-3%)"
-                )
-                
-                fig.update_layout(
-                    title="PnL Over Time",
-                    xaxis_title="Date",
-                    yaxis_title="PnL ($)",
-                    height=400
-                )
-                
+                fig = _build_pnl_fig(pnl_df)
                 st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No PnL data available yet")
@@ -560,12 +665,12 @@ def main():
         
         try:
             history = load_evolution_history()
-            traces = load_reasoning_logs()
+            trace_count = count_reasoning_logs()
             
             with col1:
                 st.metric("Total Evolutions", len(history.get('evolutions', [])))
             with col2:
-                st.metric("Reasoning Traces", len(traces))
+                st.metric("Reasoning Traces", trace_count)
             with col3:
                 blacklisted = len(history.get('blacklisted_parameters', []))
                 st.metric("Blacklisted Params", blacklisted)
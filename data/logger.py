@@ -2,16 +2,188 @@
 Telemetry Logger for AlphaWEEX Phase 3
 Logs reasoning traces from DeepSeek-R1 for analysis and debugging
 """
+import atexit
 import logging
 import json
-from typing import Dict, Any, Optional
+import mmap
+import os
+import threading
+import weakref
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 import re
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available - trace serialization will use json")
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+    logger.warning("pysimdjson not available - trace statistics will use full parsing")
+
+# Pattern to match <thought>...</thought> tags
+_THOUGHT_OPEN = '<thought>'
+_THOUGHT_CLOSE = '</thought>'
+_THOUGHT_RE = re.compile(r'<thought>(.*?)</thought>', re.DOTALL)
+_SCAN_MIN_CHARS = 256  # Texts at least this long are scanned with str.find instead of the regex
+
+# Block size for scanning the log backwards from the end
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+# Most buffers a single writev() accepts (POSIX IOV_MAX is at least 16)
+_IOV_MAX = os.sysconf('SC_IOV_MAX') if hasattr(os, 'sysconf') and 'SC_IOV_MAX' in os.sysconf_names else 1024
+if _IOV_MAX <= 0:
+    _IOV_MAX = 16
+
+
+def _append_chunks(path: Path, chunks: List[bytes]) -> int:
+    """
+    Append byte strings to a file with gather writes
+    
+    os.writev hands the kernel all buffered lines in one call without
+    first joining them into a new bytes object; platforms without writev
+    (Windows) join and use a single write.
+    
+    Args:
+        path: File to append to (created if missing)
+        chunks: Byte strings to write, in order
+    
+    Returns:
+        Number of bytes written
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        total = 0
+        if hasattr(os, 'writev'):
+            for start in range(0, len(chunks), _IOV_MAX):
+                batch = chunks[start:start + _IOV_MAX]
+                size = sum(map(len, batch))
+                written = os.writev(fd, batch)
+                if written < size:
+                    # Short write: finish the rest of this batch with write()
+                    _write_all(fd, memoryview(b''.join(batch))[written:])
+                total += size
+        else:
+            payload = b''.join(chunks)
+            _write_all(fd, memoryview(payload))
+            total = len(payload)
+        return total
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: memoryview):
+    """os.write until every byte of data is written"""
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _dump_trace_line(entry: Dict[str, Any]) -> bytes:
+    """
+    Serialize one trace as a newline-terminated JSONL line (orjson when available)
+    
+    Falls back to json for values orjson rejects, so any entry that
+    serialized before still does.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                entry,
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            pass
+    return (json.dumps(entry) + '\n').encode('utf-8')
+
+
+def _make_source_reader() -> Callable[[bytes], str]:
+    """
+    Build a function returning a trace line's 'source' field
+    
+    With pysimdjson, one parser is reused for every line and only the
+    'source' value is materialized; otherwise the line is fully decoded.
+    Invalid lines raise ValueError (json.JSONDecodeError subclasses it).
+    """
+    if SIMDJSON_AVAILABLE:
+        parser = simdjson.Parser()
+        
+        def read_source(line: bytes) -> str:
+            try:
+                return parser.parse(line)['source']
+            except KeyError:
+                return 'unknown'
+    else:
+        def read_source(line: bytes) -> str:
+            return load_trace_line(line).get('source', 'unknown')
+    
+    return read_source
+
+
+def find_thought_tags(text: str) -> List[str]:
+    """
+    Contents of every <thought>...</thought> block, like _THOUGHT_RE.findall
+    
+    Beyond a few hundred characters a two-pointer str.find scan is several
+    times faster than the regex, which has to test each position for the
+    opening tag; short texts keep the regex, whose setup cost is lower.
+    
+    Args:
+        text: Response text that may contain <thought> tags
+    
+    Returns:
+        List of raw (unstripped) thought contents
+    """
+    if len(text) < _SCAN_MIN_CHARS:
+        return _THOUGHT_RE.findall(text)
+    
+    thoughts = []
+    pos = 0
+    while True:
+        start = text.find(_THOUGHT_OPEN, pos)
+        if start < 0:
+            break
+        start += len(_THOUGHT_OPEN)
+        end = text.find(_THOUGHT_CLOSE, start)
+        if end < 0:
+            break
+        thoughts.append(text[start:end])
+        pos = end + len(_THOUGHT_CLOSE)
+    return thoughts
+
+
+def load_trace_line(line: bytes) -> Dict[str, Any]:
+    """
+    Parse one JSONL trace line (orjson when available)
+    
+    Raises:
+        json.JSONDecodeError: If the line is not valid JSON (orjson's error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+# Loggers that may still hold buffered traces, flushed once at interpreter exit.
+# Weak references keep loggers that are never closed from living until exit; a
+# logger with buffered traces stays referenced by its pending flush timer.
+_open_loggers: "weakref.WeakSet[ReasoningLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_loggers():
+    """Flush every live ReasoningLogger at interpreter exit"""
+    for reasoning_logger in list(_open_loggers):
+        reasoning_logger.flush()
+
 
 class ReasoningLogger:
     """
@@ -24,24 +196,45 @@ class ReasoningLogger:
     - Supports log rotation and management
     """
     
-    def __init__(self, log_file: str = "data/reasoning_logs.jsonl", max_size_mb: int = 100):
+    def __init__(
+        self,
+        log_file: str = "data/reasoning_logs.jsonl",
+        max_size_mb: int = 100,
+        flush_threshold_bytes: int = 64 * 1024,
+        flush_interval: float = 1.0
+    ):
         """
         Initialize Reasoning Logger
         
         Args:
             log_file: Path to JSONL log file
             max_size_mb: Maximum log file size in MB before rotation
+            flush_threshold_bytes: Buffered size that triggers a write to disk
+            flush_interval: Seconds a trace may wait in the buffer (0 writes immediately)
         """
         self.log_file = Path(log_file)
         self.max_size_bytes = max_size_mb * 1024 * 1024
         
+        # Traces are buffered and appended in batches (one open/write per flush)
+        self._buf: List[bytes] = []
+        self._buf_bytes = 0
+        self._flush_threshold = flush_threshold_bytes
+        self._flush_interval = flush_interval
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        _open_loggers.add(self)
+        
         # Create directory if needed
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize log file if it doesn't exist
         if not self.log_file.exists():
             self.log_file.touch()
-            logger.info(f"Created reasoning log file: {self.log_file}")
+            logger.info("Created reasoning log file: %s", self.log_file)
+        
+        # Bytes in the current log file, kept up to date on every flush so
+        # rotation checks don't need a stat() call
+        self._file_size = self.log_file.stat().st_size
     
     def extract_thought_tags(self, text: str) -> list:
         """
@@ -53,14 +246,8 @@ class ReasoningLogger:
         Returns:
             List of thought contents
         """
-        # Pattern to match <thought>...</thought> tags
-        pattern = r'<thought>(.*?)</thought>'
-        thoughts = re.findall(pattern, text, re.DOTALL)
-        
         # Clean up thoughts (strip whitespace)
-        cleaned_thoughts = [thought.strip() for thought in thoughts]
-        
-        return cleaned_thoughts
+        return [thought.strip() for thought in find_thought_tags(text)]
     
     def log_reasoning_trace(
         self,
@@ -93,20 +280,16 @@ class ReasoningLogger:
                 'metadata': metadata or {}
             }
             
-            # Check file size and rotate if needed
-            self._check_and_rotate()
-            
-            # Append to JSONL file
-            with open(self.log_file, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            # Buffer for the next batched append to the JSONL file
+            self._append(_dump_trace_line(log_entry))
             
             logger.info(
-                f"Logged reasoning trace from {source} "
-                f"({len(thoughts)} thoughts, {len(response)} chars)"
+                "Logged reasoning trace from %s (%d thoughts, %d chars)",
+                source, len(thoughts), len(response)
             )
             
         except Exception as e:
-            logger.error(f"Error logging reasoning trace: {str(e)}")
+            logger.error("Error logging reasoning trace: %s", e)
     
     def log_analysis(
         self,
@@ -192,23 +375,70 @@ Implementation approach:
         
         self.log_reasoning_trace(source, prompt, response, metadata)
     
+    def _append(self, line: bytes):
+        """Add a serialized trace to the write buffer, flushing when it is full"""
+        with self._lock:
+            self._buf.append(line)
+            self._buf_bytes += len(line)
+            
+            if self._buf_bytes >= self._flush_threshold or self._flush_interval <= 0:
+                self._flush_locked()
+            elif self._flush_timer is None:
+                # Bound how long a trace can wait before readers see it
+                self._flush_timer = threading.Timer(self._flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush(self):
+        """Write all buffered traces to the log file"""
+        try:
+            with self._lock:
+                self._flush_locked()
+        except Exception as e:
+            logger.error("Error flushing reasoning traces: %s", e)
+    
+    def _flush_locked(self):
+        """Write the buffer in a single gather append (caller holds self._lock)"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        
+        if not self._buf:
+            return
+        
+        # Check file size and rotate if needed
+        self._check_and_rotate()
+        
+        self._file_size += _append_chunks(self.log_file, self._buf)
+        
+        self._buf.clear()
+        self._buf_bytes = 0
+    
+    def close(self):
+        """Flush buffered traces and stop flushing at interpreter exit"""
+        self.flush()
+        _open_loggers.discard(self)
+    
     def _check_and_rotate(self):
-        """Check log file size and rotate if needed"""
-        if not self.log_file.exists():
+        """Rotate the log file once the tracked size exceeds the limit"""
+        if self._file_size <= self.max_size_bytes:
             return
         
-        file_size = self.log_file.stat().st_size
+        # Rotate log file
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        rotated_name = f"{self.log_file.stem}_{timestamp}{self.log_file.suffix}"
+        rotated_path = self.log_file.parent / rotated_name
         
-        if file_size > self.max_size_bytes:
-            # Rotate log file
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            rotated_name = f"{self.log_file.stem}_{timestamp}{self.log_file.suffix}"
-            rotated_path = self.log_file.parent / rotated_name
-            
-            self.log_file.rename(rotated_path)
-            self.log_file.touch()
-            
-            logger.info(f"Rotated log file to {rotated_name}")
+        try:
+            os.rename(self.log_file, rotated_path)
+        except FileNotFoundError:
+            # Removed externally; the next append starts a new file
+            pass
+        else:
+            logger.info("Rotated log file to %s", rotated_name)
+        
+        self.log_file.touch()
+        self._file_size = 0
     
     def read_recent_traces(self, count: int = 10) -> list:
         """
@@ -220,31 +450,112 @@ Implementation approach:
         Returns:
             List of trace dictionaries
         """
-        if not self.log_file.exists():
+        self.flush()
+        
+        if not self.log_file.exists() or count <= 0:
             return []
         
         try:
             traces = []
-            with open(self.log_file, 'r') as f:
-                # Read all lines
-                lines = f.readlines()
-                
-                # Get last N lines
-                recent_lines = lines[-count:] if len(lines) > count else lines
-                
-                # Parse JSON
-                for line in recent_lines:
-                    try:
-                        traces.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+            
+            # Parse JSON (only the last N lines are read from disk)
+            for line in self._read_tail_lines(count):
+                try:
+                    traces.append(load_trace_line(line))
+                except json.JSONDecodeError:
+                    continue
             
             return traces
             
         except Exception as e:
-            logger.error(f"Error reading traces: {str(e)}")
+            logger.error("Error reading traces: %s", e)
             return []
     
+    def _read_tail_lines(self, count: int) -> List[bytes]:
+        """
+        Read the last `count` lines, walking newlines backwards over a memory map
+        
+        Args:
+            count: Number of lines to return
+        
+        Returns:
+            List of raw lines (oldest first)
+        """
+        with open(self.log_file, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty file, or a platform/filesystem without mmap support
+                return self._scan_tail_lines(f, count)
+            
+            with mm:
+                lines = []
+                stop = len(mm)
+                if mm[stop - 1:stop] == b'\n':
+                    stop -= 1
+                
+                while len(lines) < count:
+                    start = mm.rfind(b'\n', 0, stop) + 1
+                    lines.append(mm[start:stop])
+                    if start == 0:
+                        break
+                    stop = start - 1
+            
+            lines.reverse()
+            return lines
+    
+    def _scan_tail_lines(self, f, count: int) -> List[bytes]:
+        """
+        Fallback for _read_tail_lines: read blocks backwards from the end of file
+        
+        Args:
+            f: Log file opened in binary mode
+            count: Number of lines to return
+        
+        Returns:
+            List of raw lines (oldest first)
+        """
+        pos = f.seek(0, os.SEEK_END)
+        blocks = []
+        newlines = 0
+        
+        # More than `count` newlines guarantees `count` complete lines
+        while pos > 0 and newlines <= count:
+            step = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            newlines += block.count(b'\n')
+            blocks.append(block)
+        
+        # Blocks were read back to front; join once instead of prepending each
+        blocks.reverse()
+        lines = b''.join(blocks).splitlines()
+        if pos > 0:
+            # First line may start before the scanned region
+            lines = lines[1:]
+        
+        return lines[-count:]
+    
+    def count_traces(self) -> int:
+        """
+        Count logged traces without parsing them (like `wc -l`)
+        
+        Returns:
+            Number of lines in the log file
+        """
+        self.flush()
+        
+        if not self.log_file.exists():
+            return 0
+        
+        total = 0
+        with open(self.log_file, 'rb') as f:
+            for block in iter(lambda: f.read(_TAIL_BLOCK_SIZE), b''):
+                total += block.count(b'\n')
+        
+        return total
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about logged reasoning traces
@@ -252,6 +563,8 @@ Implementation approach:
         Returns:
             Dictionary with statistics
         """
+        self.flush()
+        
         if not self.log_file.exists():
             return {
                 'total_traces': 0,
@@ -263,16 +576,17 @@ Implementation approach:
             total_traces = 0
             sources = {}
             
-            with open(self.log_file, 'r') as f:
+            read_source = _make_source_reader()
+            
+            with open(self.log_file, 'rb') as f:
                 for line in f:
                     try:
-                        trace = json.loads(line)
-                        total_traces += 1
-                        
-                        source = trace.get('source', 'unknown')
-                        sources[source] = sources.get(source, 0) + 1
-                    except json.JSONDecodeError:
+                        source = read_source(line)
+                    except ValueError:
                         continue
+                    
+                    total_traces += 1
+                    sources[source] = sources.get(source, 0) + 1
             
             file_size_mb = self.log_file.stat().st_size / (1024 * 1024)
             
@@ -283,7 +597,7 @@ Implementation approach:
             }
             
         except Exception as e:
-            logger.error(f"Error calculating statistics: {str(e)}")
+            logger.error("Error calculating statistics: %s", e)
             return {
                 'total_traces': 0,
                 'file_size_mb': 0,
@@ -4,13 +4,117 @@ Tracks performance history and manages parameter blacklisting
 """
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import os
+from typing import Dict, Any, Hashable, List, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not available - evolution history will be saved with json")
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    logger.warning("msgpack not available - evolution history will be loaded from JSON")
+
+
+def _json_default(value: Any) -> Any:
+    """Convert numpy scalars/arrays for the json fallback (orjson handles them natively)"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps_history(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize the history as 2-space indented JSON bytes (orjson when available)
+    
+    Falls back to json for values orjson rejects.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+
+
+def _dumps_event(event: Dict[str, Any]) -> bytes:
+    """Serialize a journal event as one newline-terminated JSON line"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                event,
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            pass
+    return (json.dumps(event, default=_json_default) + '\n').encode('utf-8')
+
+
+def _write_atomic(path: Path, payload: bytes):
+    """Replace a file's contents via a temporary file so readers never see a partial write"""
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_file, path)
+
+
+def journal_file_for(history_file: str) -> Path:
+    """
+    Path of the append-only journal kept next to a history snapshot
+    
+    Args:
+        history_file: Path to evolution history JSON file
+    
+    Returns:
+        e.g. data/evolution_history.journal.jsonl for data/evolution_history.json
+    """
+    path = Path(history_file)
+    return path.with_name(f"{path.stem}.journal.jsonl")
+
+
+def _freeze_params(value: Any) -> Optional[Hashable]:
+    """
+    Hashable key for a parameter set, equal for any two sets that compare ==
+    
+    Numbers are keyed as floats (1 == 1.0 == True) and dicts as frozensets,
+    so key order doesn't matter. Different sets may share a key (e.g. a list
+    and a tuple), so candidates are still confirmed with ==.
+    
+    Returns:
+        The key, or None if the parameters contain unhashable values
+    """
+    try:
+        return _freeze(value)
+    except (TypeError, OverflowError):
+        return None
+
+
+def _freeze(value: Any) -> Hashable:
+    """Recursive helper for _freeze_params (raises TypeError if unhashable)"""
+    if isinstance(value, dict):
+        key = frozenset((_freeze(k), _freeze(v)) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        key = tuple(_freeze(v) for v in value)
+    elif isinstance(value, (bool, int, float)):
+        key = float(value)
+    else:
+        key = value
+    hash(key)
+    return key
+
 
 class EvolutionMemory:
     """
@@ -21,33 +125,82 @@ class EvolutionMemory:
     - Monitor PnL over 2-hour windows
     - Blacklist parameters that result in negative PnL
     - Persist memory to JSON file
+    
+    Changes are appended to a JSONL journal next to the JSON snapshot and
+    folded into the snapshot every `compact_every` events, so a single
+    update doesn't rewrite the whole history.
     """
     
-    def __init__(self, history_file: str = "data/evolution_history.json"):
+    def __init__(self, history_file: str = "data/evolution_history.json", compact_every: int = 200):
         """
         Initialize Evolution Memory
         
         Args:
             history_file: Path to evolution history JSON file
+            compact_every: Journal events after which the snapshot is rewritten
         """
         self.history_file = Path(history_file)
+        self.journal_file = journal_file_for(history_file)
+        # Binary copy of the snapshot, faster to load than the JSON (which
+        # stays the human-readable format)
+        self.msgpack_file = self.history_file.with_suffix(".msgpack")
+        self.compact_every = compact_every
         self.data = self._load_history()
         
+        # Events carry increasing sequence numbers; the snapshot records the
+        # last one it includes so a journal left over from an interrupted
+        # compaction is not applied twice
+        self._journal_seq = self.data.get("journal_seq", 0)
+        self._journal_events = 0
+        self._replay_journal()
+        
+        self._rebuild_blacklist_index()
+        
     def _load_history(self) -> Dict[str, Any]:
-        """Load evolution history from JSON file"""
+        """Load evolution history from the msgpack copy if current, else the JSON file"""
+        data = self._load_msgpack_history()
+        if data is not None:
+            logger.info("Loaded evolution history: %d evolutions", len(data.get('evolutions', [])))
+            return data
+        
         if self.history_file.exists():
             try:
                 with open(self.history_file, 'r') as f:
                     data = json.load(f)
-                    logger.info(f"Loaded evolution history: {len(data.get('evolutions', []))} evolutions")
+                    logger.info("Loaded evolution history: %d evolutions", len(data.get('evolutions', [])))
                     return data
             except Exception as e:
-                logger.error(f"Error loading evolution history: {str(e)}")
+                logger.error("Error loading evolution history: %s", e)
                 return self._default_structure()
         else:
             logger.info("No evolution history found, creating new")
             return self._default_structure()
     
+    def _load_msgpack_history(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the msgpack copy of the history
+        
+        Returns:
+            History data, or None if msgpack is unavailable or the copy is
+            missing, unreadable or older than the JSON file
+        """
+        if not MSGPACK_AVAILABLE:
+            return None
+        
+        try:
+            # The copy is written after the JSON; an older one means the JSON
+            # was changed without it (e.g. edited by hand)
+            if self.msgpack_file.stat().st_mtime_ns < self.history_file.stat().st_mtime_ns:
+                return None
+            data = msgpack.unpackb(self.msgpack_file.read_bytes(), raw=False)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable evolution history copy: %s", e)
+            return None
+        
+        return data if isinstance(data, dict) else None
+    
     def _default_structure(self) -> Dict[str, Any]:
         """Get default evolution history structure"""
         return {
@@ -57,16 +210,110 @@ class EvolutionMemory:
         }
     
     def _save_history(self):
-        """Save evolution history to JSON file"""
+        """Save the full evolution history to the JSON file and reset the journal"""
         try:
             # Create directory if it doesn't exist
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.history_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            self.data["journal_seq"] = self._journal_seq
+            _write_atomic(self.history_file, _dumps_history(self.data))
+            self._save_msgpack_history()
+            
+            # Every journaled event is now in the snapshot
+            self.journal_file.unlink(missing_ok=True)
+            self._journal_events = 0
             logger.info("Evolution history saved")
         except Exception as e:
-            logger.error(f"Error saving evolution history: {str(e)}")
+            logger.error("Error saving evolution history: %s", e)
+    
+    def _save_msgpack_history(self):
+        """Write the msgpack copy of the history (after the JSON file)"""
+        if not MSGPACK_AVAILABLE:
+            return
+        
+        try:
+            _write_atomic(self.msgpack_file, msgpack.packb(self.data, use_bin_type=True))
+        except Exception as e:
+            # e.g. numpy values; the JSON file alone is still complete
+            logger.warning("Could not write evolution history copy: %s", e)
+            self.msgpack_file.unlink(missing_ok=True)
+    
+    def _append_event(self, event: Dict[str, Any]):
+        """
+        Journal one change (already applied to self.data)
+        
+        Args:
+            event: Event with an 'op' of 'evolution', 'update' or 'blacklist'
+        """
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            self._journal_seq += 1
+            event["seq"] = self._journal_seq
+            with open(self.journal_file, 'ab') as f:
+                start = f.tell()
+                try:
+                    f.write(_dumps_event(event))
+                    f.flush()
+                except Exception:
+                    # Don't leave a fragment for the next append to land on
+                    f.truncate(start)
+                    raise
+            self._journal_events += 1
+        except Exception as e:
+            logger.error("Error journaling evolution history: %s", e)
+            return
+        
+        if self._journal_events >= self.compact_every:
+            self._save_history()
+    
+    def _replay_journal(self):
+        """Apply journaled events newer than the snapshot to self.data"""
+        if not self.journal_file.exists():
+            return
+        
+        try:
+            complete_end = 0
+            with open(self.journal_file, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Torn final append from a crash
+                        break
+                    complete_end += len(line)
+                    
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    
+                    self._journal_events += 1
+                    if event.get("seq", 0) <= self._journal_seq:
+                        continue
+                    try:
+                        self._apply_event(event)
+                    except (KeyError, IndexError, TypeError) as e:
+                        logger.warning("Skipping unreadable journal event %s: %s", event.get("seq"), e)
+                    self._journal_seq = event["seq"]
+                
+                torn = f.tell() != complete_end
+            
+            if torn:
+                # Drop the fragment so the next append starts on a fresh line
+                with open(self.journal_file, 'r+b') as f:
+                    f.truncate(complete_end)
+                logger.warning("Discarded partial last line of %s", self.journal_file)
+        except Exception as e:
+            logger.error("Error replaying evolution journal: %s", e)
+    
+    def _apply_event(self, event: Dict[str, Any]):
+        """Apply one journal event to self.data"""
+        op = event.get("op")
+        if op == "evolution":
+            self.data.setdefault("evolutions", []).append(event["record"])
+        elif op == "update":
+            self.data["evolutions"][event["index"]].update(event["fields"])
+        elif op == "blacklist":
+            self.data.setdefault("blacklisted_parameters", []).append(event["entry"])
     
     def record_evolution(
         self,
@@ -94,9 +341,9 @@ class EvolutionMemory:
         }
         
         self.data["evolutions"].append(evolution_record)
-        self._save_history()
+        self._append_event({"op": "evolution", "record": evolution_record})
         
-        logger.info(f"Recorded evolution: {reason}")
+        logger.info("Recorded evolution: %s", reason)
     
     def update_performance_window(
         self,
@@ -113,7 +360,7 @@ class EvolutionMemory:
             pnl: Profit/Loss since evolution
         """
         if evolution_index >= len(self.data["evolutions"]):
-            logger.warning(f"Invalid evolution index: {evolution_index}")
+            logger.warning("Invalid evolution index: %s", evolution_index)
             return
         
         evolution = self.data["evolutions"][evolution_index]
@@ -128,21 +375,23 @@ class EvolutionMemory:
                 self._blacklist_parameters(evolution["parameters"], pnl, evolution_index)
             
             # Mark as evaluated
-            evolution["evaluated"] = True
-            evolution["final_pnl"] = pnl
-            evolution["final_equity"] = current_equity
-            self._save_history()
+            fields = {"evaluated": True, "final_pnl": pnl, "final_equity": current_equity}
+            evolution.update(fields)
+            self._append_event({"op": "update", "index": evolution_index, "fields": fields})
             
             logger.info(
-                f"Evolution {evolution_index} window closed: "
-                f"PnL={pnl:.2f}, Blacklisted={pnl < 0}"
+                "Evolution %s window closed: PnL=%.2f, Blacklisted=%s",
+                evolution_index, pnl, pnl < 0
             )
         else:
             # Still within window, update current performance
-            evolution["current_equity"] = current_equity
-            evolution["current_pnl"] = pnl
-            evolution["last_update"] = current_time.isoformat()
-            self._save_history()
+            fields = {
+                "current_equity": current_equity,
+                "current_pnl": pnl,
+                "last_update": current_time.isoformat()
+            }
+            evolution.update(fields)
+            self._append_event({"op": "update", "index": evolution_index, "fields": fields})
     
     def _blacklist_parameters(self, parameters: Dict[str, Any], pnl: float, evolution_index: int):
         """
@@ -162,11 +411,13 @@ class EvolutionMemory:
         }
         
         self.data["blacklisted_parameters"].append(blacklist_entry)
-        self._save_history()
+        self._index_blacklist_entry(blacklist_entry)
+        self._append_event({"op": "blacklist", "entry": blacklist_entry})
         
         logger.warning(
-            f"⚠️  Parameters blacklisted due to negative PnL: {pnl:.2f}\n"
-            f"   Parameters: {parameters}"
+            "⚠️  Parameters blacklisted due to negative PnL: %.2f\n"
+            "   Parameters: %s",
+            pnl, parameters
         )
     
     def is_blacklisted(self, parameters: Dict[str, Any]) -> tuple[bool, Optional[str]]:
@@ -179,7 +430,14 @@ class EvolutionMemory:
         Returns:
             (is_blacklisted, reason)
         """
-        for entry in self.data["blacklisted_parameters"]:
+        key = _freeze_params(parameters)
+        if key is None:
+            candidates = self.data["blacklisted_parameters"]
+        else:
+            # Only entries with the same key can match exactly
+            candidates = self._blacklist_index.get(key, []) + self._unindexed_blacklist
+        
+        for entry in candidates:
             # Check if parameters match (simplified - can be made more sophisticated)
             if self._parameters_match(entry["parameters"], parameters):
                 reason = entry.get("reason", "Unknown reason")
@@ -187,6 +445,21 @@ class EvolutionMemory:
         
         return False, None
     
+    def _rebuild_blacklist_index(self):
+        """Index blacklist entries by parameter key for is_blacklisted lookups"""
+        self._blacklist_index: Dict[Hashable, List[Dict[str, Any]]] = {}
+        self._unindexed_blacklist: List[Dict[str, Any]] = []
+        for entry in self.data.get("blacklisted_parameters", []):
+            self._index_blacklist_entry(entry)
+    
+    def _index_blacklist_entry(self, entry: Dict[str, Any]):
+        """Add one blacklist entry to the lookup index"""
+        key = _freeze_params(entry.get("parameters"))
+        if key is None:
+            self._unindexed_blacklist.append(entry)
+        else:
+            self._blacklist_index.setdefault(key, []).append(entry)
+    
     def _parameters_match(self, blacklisted: Dict[str, Any], proposed: Dict[str, Any]) -> bool:
         """
         Check if proposed parameters match blacklisted ones
@@ -198,7 +471,9 @@ class EvolutionMemory:
         Returns:
             True if they match (within tolerance)
         
-        Note: Currently uses exact match. For production, consider implementing
+        Note: Currently uses exact match, which is what lets is_blacklisted
+        look candidates up by key; fuzzy matching would need a different
+        index. For production, consider implementing
         fuzzy matching or similarity thresholds to catch variations like:
         - rsi_period: 14 vs 15 (close values)
         - Similar parameter combinations
@@ -269,5 +544,6 @@ class EvolutionMemory:
         
         removed = original_count - len(self.data["blacklisted_parameters"])
         if removed > 0:
+            self._rebuild_blacklist_index()
             self._save_history()
-            logger.info(f"Cleared {removed} old blacklist entries (older than {days} days)")
+            logger.info("Cleared %d old blacklist entries (older than %s days)", removed, days)
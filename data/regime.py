@@ -3,13 +3,21 @@ Market Regime Detection Module
 Detects market regimes using ADX (Trend Strength) and ATR (Volatility)
 """
 import logging
-from typing import List, Dict, Any
+from collections import OrderedDict
+from typing import List, Dict, Any, Hashable
 from enum import Enum
+import numpy as np
 import pandas as pd
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.warning("numba not available - indicator smoothing will use pandas ewm")
+
 
 class MarketRegime(str, Enum):
     """Market regime types"""
@@ -19,6 +27,153 @@ class MarketRegime(str, Enum):
     RANGE_QUIET = "RANGE_QUIET"
 
 
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _ewma_update(weighted: float, old_wt: float, cur: float, alpha: float):
+        """
+        One ewm(adjust=False).mean() step, including pandas' NaN handling:
+        leading NaNs stay NaN, gaps carry the last value and decay its weight
+        """
+        if weighted == weighted:
+            old_wt *= 1.0 - alpha
+            if cur == cur:
+                if weighted != cur:
+                    weighted = ((old_wt * weighted) + (alpha * cur)) / (old_wt + alpha)
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        return weighted, old_wt
+    
+    @numba.njit(cache=True)
+    def _ewma_kernel(values: np.ndarray, alpha: float) -> np.ndarray:
+        """
+        ewm(adjust=False).mean() over a whole array
+        """
+        n = values.shape[0]
+        out = np.empty(n)
+        if n == 0:
+            return out
+        
+        weighted = values[0]
+        out[0] = weighted
+        old_wt = 1.0
+        
+        for i in range(1, n):
+            weighted, old_wt = _ewma_update(weighted, old_wt, values[i], alpha)
+            out[i] = weighted
+        
+        return out
+    
+    @numba.njit(cache=True)
+    def _fmax(a: float, b: float) -> float:
+        """Scalar np.fmax: a NaN argument loses to a number"""
+        if a != a:
+            return b
+        if b != b:
+            return a
+        return a if a >= b else b
+    
+    @numba.njit(cache=True, error_model='numpy')
+    def _regime_last_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, alpha: float):
+        """
+        Fused calculate_regime_indicators keeping only what the regime needs:
+        the full ATR array (for its percentile) and the last ADX, +DI and -DI
+        
+        Performs the same float operations, in the same order, as the
+        Series version, so the results are identical.
+        """
+        n = high.shape[0]
+        atr_out = np.empty(n)
+        
+        # Row 0: no previous candle, so TR = high - low and +DM = -DM = 0
+        atr = high[0] - low[0]
+        atr_wt = 1.0
+        plus_dm_ewm = 0.0
+        plus_wt = 1.0
+        minus_dm_ewm = 0.0
+        minus_wt = 1.0
+        atr_out[0] = atr
+        
+        plus_di = 100 * (plus_dm_ewm / atr)
+        minus_di = 100 * (minus_dm_ewm / atr)
+        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+        if np.isinf(dx):
+            dx = 0.0
+        adx = dx
+        adx_wt = 1.0
+        
+        for i in range(1, n):
+            prev_close = close[i - 1]
+            true_range = _fmax(high[i] - low[i], _fmax(abs(high[i] - prev_close), abs(low[i] - prev_close)))
+            
+            up_move = high[i] - high[i - 1]
+            down_move = low[i - 1] - low[i]
+            plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0
+            minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0
+            
+            atr, atr_wt = _ewma_update(atr, atr_wt, true_range, alpha)
+            plus_dm_ewm, plus_wt = _ewma_update(plus_dm_ewm, plus_wt, plus_dm, alpha)
+            minus_dm_ewm, minus_wt = _ewma_update(minus_dm_ewm, minus_wt, minus_dm, alpha)
+            atr_out[i] = atr
+            
+            plus_di = 100 * (plus_dm_ewm / atr)
+            minus_di = 100 * (minus_dm_ewm / atr)
+            dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+            if np.isinf(dx):
+                dx = 0.0
+            adx, adx_wt = _ewma_update(adx, adx_wt, dx, alpha)
+        
+        return atr_out, adx, plus_di, minus_di
+
+
+def _span_alpha(period: int) -> float:
+    """Smoothing factor for ewm(span=period), derived as pandas does (span -> com -> alpha)"""
+    return 1.0 / (1.0 + (period - 1) / 2.0)
+
+
+def _ewma(series: pd.Series, period: int) -> pd.Series:
+    """
+    Exponential moving average, equal to series.ewm(span=period, adjust=False).mean()
+    
+    Runs as a compiled scalar loop when numba is installed.
+    """
+    if not NUMBA_AVAILABLE:
+        return series.ewm(span=period, adjust=False).mean()
+    
+    values = _ewma_kernel(series.to_numpy(dtype=np.float64), _span_alpha(period))
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _ewma_array(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    ewm(alpha=alpha, adjust=False).mean() over a float64 array
+    
+    Same compiled kernel as _ewma, for callers that already work on arrays.
+    """
+    if not NUMBA_AVAILABLE:
+        return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    
+    return _ewma_kernel(values, alpha)
+
+
+def _true_range(ohlcv_df: pd.DataFrame) -> pd.Series:
+    """
+    True Range: max(high - low, |high - prev close|, |low - prev close|)
+    
+    Computed on the underlying arrays; np.fmax skips the missing previous
+    close on the first row, like a NaN-skipping row max.
+    """
+    high = ohlcv_df['high'].to_numpy(dtype=np.float64)
+    low = ohlcv_df['low'].to_numpy(dtype=np.float64)
+    prev_close = np.empty_like(high)
+    prev_close[:1] = np.nan
+    prev_close[1:] = ohlcv_df['close'].to_numpy(dtype=np.float64)[:-1]
+    
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    
+    return pd.Series(true_range, index=ohlcv_df.index)
+
+
 def calculate_atr(ohlcv_df: pd.DataFrame, period: int = 14) -> pd.Series:
     """
     Calculate Average True Range (ATR) - Volatility indicator
@@ -30,92 +185,166 @@ def calculate_atr(ohlcv_df: pd.DataFrame, period: int = 14) -> pd.Series:
     Returns:
         Series with ATR values
     """
-    high = ohlcv_df['high']
-    low = ohlcv_df['low']
-    close = ohlcv_df['close']
-    
     # True Range calculation
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    true_range = _true_range(ohlcv_df)
     
     # Average True Range (exponential moving average of TR)
-    atr = true_range.ewm(span=period, adjust=False).mean()
+    atr = _ewma(true_range, period)
     
     return atr
 
 
-def calculate_adx(ohlcv_df: pd.DataFrame, period: int = 14) -> tuple:
+def calculate_regime_indicators(ohlcv_df: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
     """
-    Calculate Average Directional Index (ADX) - Trend strength indicator
+    Calculate ATR and ADX (+DI/-DI) together, sharing one True Range and ATR
     
     Args:
         ohlcv_df: DataFrame with columns ['open', 'high', 'low', 'close', 'volume']
-        period: ADX period (default: 14)
+        period: ATR/ADX period (default: 14)
         
     Returns:
-        Tuple of (ADX, +DI, -DI) Series
-    
-    Note: Using tuple instead of tuple[...] for Python 3.8+ compatibility
+        Dictionary with 'atr', 'adx', 'plus_di' and 'minus_di' Series
     """
-    high = ohlcv_df['high']
-    low = ohlcv_df['low']
-    close = ohlcv_df['close']
+    high = ohlcv_df['high'].to_numpy(dtype=np.float64)
+    low = ohlcv_df['low'].to_numpy(dtype=np.float64)
     
-    # Calculate +DM and -DM
-    up_move = high - high.shift(1)
-    down_move = low.shift(1) - low
+    # Calculate +DM and -DM (first row has no previous candle: NaN compares False -> 0)
+    up_move = np.empty_like(high)
+    down_move = np.empty_like(low)
+    up_move[:1] = np.nan
+    down_move[:1] = np.nan
+    np.subtract(high[1:], high[:-1], out=up_move[1:])
+    np.subtract(low[:-1], low[1:], out=down_move[1:])
     
-    plus_dm = pd.Series(0.0, index=ohlcv_df.index)
-    minus_dm = pd.Series(0.0, index=ohlcv_df.index)
+    plus_dm = pd.Series(np.where((up_move > down_move) & (up_move > 0), up_move, 0.0), index=ohlcv_df.index)
+    minus_dm = pd.Series(np.where((down_move > up_move) & (down_move > 0), down_move, 0.0), index=ohlcv_df.index)
     
-    plus_dm[(up_move > down_move) & (up_move > 0)] = up_move
-    minus_dm[(down_move > up_move) & (down_move > 0)] = down_move
-    
-    # Calculate True Range
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    # Calculate True Range and ATR once (same as calculate_atr)
+    atr = _ewma(_true_range(ohlcv_df), period)
     
     # Smooth the values
-    atr = true_range.ewm(span=period, adjust=False).mean()
-    plus_di = 100 * (plus_dm.ewm(span=period, adjust=False).mean() / atr)
-    minus_di = 100 * (minus_dm.ewm(span=period, adjust=False).mean() / atr)
+    plus_di = 100 * (_ewma(plus_dm, period) / atr)
+    minus_di = 100 * (_ewma(minus_dm, period) / atr)
     
     # Calculate DX and ADX
     dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
     dx = dx.replace([float('inf'), float('-inf')], 0)
-    adx = dx.ewm(span=period, adjust=False).mean()
+    adx = _ewma(dx, period)
+    
+    return {'atr': atr, 'adx': adx, 'plus_di': plus_di, 'minus_di': minus_di}
+
+
+def calculate_adx(ohlcv_df: pd.DataFrame, period: int = 14) -> tuple:
+    """
+    Calculate Average Directional Index (ADX) - Trend strength indicator
     
-    return adx, plus_di, minus_di
+    Args:
+        ohlcv_df: DataFrame with columns ['open', 'high', 'low', 'close', 'volume']
+        period: ADX period (default: 14)
+    
+    Returns:
+        Tuple of (ADX, +DI, -DI) Series
+    
+    Note: Using tuple instead of tuple[...] for Python 3.8+ compatibility
+    """
+    indicators = calculate_regime_indicators(ohlcv_df, period)
+    return indicators['adx'], indicators['plus_di'], indicators['minus_di']
+
 
+RSI_PERIOD = 14
 
-def calculate_rsi(ohlcv_df: pd.DataFrame, period: int = 14) -> pd.Series:
+# Candles whose ATR values set the volatile/quiet percentile threshold
+ATR_PERCENTILE_WINDOW = 200
+
+
+def calculate_rsi(ohlcv_df: pd.DataFrame, period: int = RSI_PERIOD) -> pd.Series:
     """
-    Calculate Relative Strength Index (RSI)
+    Calculate Relative Strength Index (RSI) with Wilder smoothing
+    
+    Average gain and loss are exponential averages with alpha = 1/period,
+    so the latest value depends on the whole series rather than only the
+    last `period` candles.
     
     Args:
         ohlcv_df: DataFrame with columns ['open', 'high', 'low', 'close', 'volume']
         period: RSI period (default: 14)
         
     Returns:
-        Series with RSI values
+        Series with RSI values (NaN for the first `period` candles)
     """
-    close = ohlcv_df['close']
-    delta = close.diff()
+    rsi = _rsi_array(ohlcv_df['close'].to_numpy(dtype=np.float64), period)
+    return pd.Series(rsi, index=ohlcv_df.index)
+
+
+def _rsi_array(close: np.ndarray, period: int = RSI_PERIOD) -> np.ndarray:
+    """calculate_rsi on a float64 array of closes"""
+    delta = np.diff(close, prepend=np.nan)
     
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    # Split into gains and losses in one pass; the first row has no change
+    # and stays NaN so the averages start from the first real move
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    gain[:1] = np.nan
+    loss[:1] = np.nan
     
-    rs = gain / loss
+    alpha = 1.0 / period
+    avg_gain = _ewma_array(gain, alpha)
+    avg_loss = _ewma_array(loss, alpha)
+    
+    # No losses: gain / 0 -> inf -> RSI 100 (0 / 0 stays NaN)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
     rsi = 100 - (100 / (1 + rs))
+    rsi[:period] = np.nan
     
     return rsi
 
 
+# get_regime_metrics always uses period 14 for ATR/ADX and RSI; its kernel
+# reads these as module globals, which numba freezes into compile-time
+# constants
+_P14_REGIME_ALPHA = _span_alpha(14)
+_P14_RSI_ALPHA = 1.0 / RSI_PERIOD
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, error_model='numpy')
+    def _rsi_last_kernel(close: np.ndarray, alpha: float, period: int) -> float:
+        """Last value of _rsi_array, without the intermediate arrays"""
+        n = close.shape[0]
+        if n <= period:
+            return np.nan
+        
+        # Row 0 has no change (NaN); the averages start from the first real move
+        avg_gain = np.nan
+        gain_wt = 1.0
+        avg_loss = np.nan
+        loss_wt = 1.0
+        
+        for i in range(1, n):
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain, gain_wt = _ewma_update(avg_gain, gain_wt, gain, alpha)
+            avg_loss, loss_wt = _ewma_update(avg_loss, loss_wt, loss, alpha)
+        
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+    
+    @numba.njit(cache=True, error_model='numpy')
+    def _regime_metrics_p14_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        """
+        Everything get_regime_metrics needs for period 14 in one call:
+        (ATR array, ADX, +DI, -DI, RSI)
+        
+        The smoothing factors are constants here, so LLVM can fold them
+        into the inlined recurrences.
+        """
+        atr, adx, plus_di, minus_di = _regime_last_kernel(high, low, close, _P14_REGIME_ALPHA)
+        rsi = _rsi_last_kernel(close, _P14_RSI_ALPHA, 14)
+        return atr, adx, plus_di, minus_di, rsi
+
+
 def detect_regime(ohlcv_df: pd.DataFrame, adx_threshold: float = 25.0, atr_percentile: float = 50.0) -> str:
     """
     Detect market regime using ADX (trend strength) and ATR (volatility)
@@ -125,8 +354,8 @@ def detect_regime(ohlcv_df: pd.DataFrame, adx_threshold: float = 25.0, atr_perce
       - +DI > -DI: TRENDING_UP
       - +DI < -DI: TRENDING_DOWN
     - ADX <= threshold: Ranging market
-      - ATR above median: RANGE_VOLATILE
-      - ATR below median: RANGE_QUIET
+      - ATR above median of the last ATR_PERCENTILE_WINDOW candles: RANGE_VOLATILE
+      - ATR below median of the last ATR_PERCENTILE_WINDOW candles: RANGE_QUIET
     
     Args:
         ohlcv_df: DataFrame with columns ['open', 'high', 'low', 'close', 'volume']
@@ -140,98 +369,267 @@ def detect_regime(ohlcv_df: pd.DataFrame, adx_threshold: float = 25.0, atr_perce
         logger.warning("Insufficient data for regime detection (need at least 30 candles)")
         return MarketRegime.RANGE_QUIET
     
-    try:
-        # Calculate indicators
-        adx, plus_di, minus_di = calculate_adx(ohlcv_df)
-        atr = calculate_atr(ohlcv_df)
-        
-        # Get latest values
-        current_adx = adx.iloc[-1]
-        current_plus_di = plus_di.iloc[-1]
-        current_minus_di = minus_di.iloc[-1]
-        current_atr = atr.iloc[-1]
-        
-        # Calculate ATR percentile for volatility assessment
-        atr_threshold = atr.quantile(atr_percentile / 100.0)
-        
-        # Detect regime
-        if current_adx > adx_threshold:
-            # Trending market
-            if current_plus_di > current_minus_di:
-                regime = MarketRegime.TRENDING_UP
-            else:
-                regime = MarketRegime.TRENDING_DOWN
+    # Same single indicator pass as get_regime_metrics; callers that need
+    # both should call get_regime_metrics once and read 'regime'
+    return get_regime_metrics(ohlcv_df, adx_threshold, atr_percentile)['regime']
+
+
+def _last_regime_values(ohlcv_df: pd.DataFrame, period: int = 14) -> Dict[str, Any]:
+    """
+    Latest ADX, +DI and -DI plus the full ATR array (its percentile needs
+    every value) - all the regime classification reads
+    
+    Args:
+        ohlcv_df: DataFrame with columns ['open', 'high', 'low', 'close', 'volume']
+        period: ATR/ADX period (default: 14)
+    
+    Returns:
+        Dictionary with 'atr' (ndarray), 'adx', 'plus_di' and 'minus_di' (floats)
+    """
+    return _last_regime_values_arrays(
+        ohlcv_df['high'].to_numpy(dtype=np.float64),
+        ohlcv_df['low'].to_numpy(dtype=np.float64),
+        ohlcv_df['close'].to_numpy(dtype=np.float64),
+        period
+    )
+
+
+def _last_regime_values_arrays(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int = 14
+) -> Dict[str, Any]:
+    """
+    _last_regime_values on float64 high/low/close arrays
+    
+    With numba the indicators are computed in one fused pass without
+    building intermediate Series.
+    """
+    if NUMBA_AVAILABLE:
+        atr, adx, plus_di, minus_di = _regime_last_kernel(high, low, close, _span_alpha(period))
+        return {'atr': atr, 'adx': adx, 'plus_di': plus_di, 'minus_di': minus_di}
+    
+    indicators = calculate_regime_indicators(pd.DataFrame({'high': high, 'low': low, 'close': close}), period)
+    return {
+        'atr': indicators['atr'].to_numpy(),
+        'adx': indicators['adx'].iloc[-1],
+        'plus_di': indicators['plus_di'].iloc[-1],
+        'minus_di': indicators['minus_di'].iloc[-1]
+    }
+
+
+def _classify_regime(
+    values: Dict[str, Any],
+    adx_threshold: float = 25.0,
+    atr_percentile: float = 50.0
+) -> str:
+    """
+    Classify the regime from precomputed indicator values (see detect_regime)
+    
+    Args:
+        values: Output of _last_regime_values
+        adx_threshold: ADX threshold to distinguish trending vs ranging
+        atr_percentile: ATR percentile to distinguish volatile vs quiet
+    
+    Returns:
+        Market regime string
+    """
+    # Get latest values
+    current_adx = values['adx']
+    current_plus_di = values['plus_di']
+    current_minus_di = values['minus_di']
+    atr = values['atr']
+    current_atr = atr[-1]
+    
+    # Calculate ATR percentile for volatility assessment over the recent
+    # window only (NaN-skipping, like Series.quantile; np.quantile partitions
+    # rather than sorts)
+    recent_atr = atr[-ATR_PERCENTILE_WINDOW:]
+    valid_atr = recent_atr[~np.isnan(recent_atr)]
+    atr_threshold = np.quantile(valid_atr, atr_percentile / 100.0) if valid_atr.size else np.nan
+    
+    # Detect regime
+    if current_adx > adx_threshold:
+        # Trending market
+        if current_plus_di > current_minus_di:
+            regime = MarketRegime.TRENDING_UP
         else:
-            # Ranging market
-            if current_atr > atr_threshold:
-                regime = MarketRegime.RANGE_VOLATILE
-            else:
-                regime = MarketRegime.RANGE_QUIET
-        
-        logger.info(
-            f"Regime detected: {regime} "
-            f"(ADX: {current_adx:.2f}, +DI: {current_plus_di:.2f}, "
-            f"-DI: {current_minus_di:.2f}, ATR: {current_atr:.4f})"
-        )
-        
-        return regime
-        
-    except Exception as e:
-        logger.error(f"Error detecting regime: {str(e)}")
-        return MarketRegime.RANGE_QUIET
+            regime = MarketRegime.TRENDING_DOWN
+    else:
+        # Ranging market
+        if current_atr > atr_threshold:
+            regime = MarketRegime.RANGE_VOLATILE
+        else:
+            regime = MarketRegime.RANGE_QUIET
+    
+    logger.info(
+        "Regime detected: %s (ADX: %.2f, +DI: %.2f, -DI: %.2f, ATR: %.4f)",
+        regime.value, current_adx, current_plus_di, current_minus_di, current_atr
+    )
+    
+    return regime
+
+
+def _default_metrics(error: str) -> Dict[str, Any]:
+    """Neutral metrics returned when the regime can't be calculated"""
+    return {
+        'regime': MarketRegime.RANGE_QUIET,
+        'adx': 0.0,
+        'plus_di': 0.0,
+        'minus_di': 0.0,
+        'atr': 0.0,
+        'rsi': 50.0,
+        'error': error
+    }
 
 
-def get_regime_metrics(ohlcv_df: pd.DataFrame) -> Dict[str, Any]:
+def get_regime_metrics(
+    ohlcv_df: pd.DataFrame,
+    adx_threshold: float = 25.0,
+    atr_percentile: float = 50.0
+) -> Dict[str, Any]:
     """
     Get all regime-related metrics for analysis
     
     Args:
         ohlcv_df: DataFrame with columns ['open', 'high', 'low', 'close', 'volume']
+        adx_threshold: ADX threshold to distinguish trending vs ranging (default: 25)
+        atr_percentile: ATR percentile to distinguish volatile vs quiet (default: 50)
         
     Returns:
         Dictionary with regime metrics
     """
     if len(ohlcv_df) < 30:
-        return {
-            'regime': MarketRegime.RANGE_QUIET,
-            'adx': 0.0,
-            'plus_di': 0.0,
-            'minus_di': 0.0,
-            'atr': 0.0,
-            'rsi': 50.0,
-            'error': 'Insufficient data'
-        }
+        return _default_metrics('Insufficient data')
     
     try:
-        # Calculate all indicators
-        adx, plus_di, minus_di = calculate_adx(ohlcv_df)
-        atr = calculate_atr(ohlcv_df)
-        rsi = calculate_rsi(ohlcv_df)
-        regime = detect_regime(ohlcv_df)
+        high = ohlcv_df['high'].to_numpy(dtype=np.float64)
+        low = ohlcv_df['low'].to_numpy(dtype=np.float64)
+        close = ohlcv_df['close'].to_numpy(dtype=np.float64)
+    except Exception as e:
+        logger.error("Error calculating regime metrics: %s", e)
+        return _default_metrics(str(e))
+    
+    return get_regime_metrics_from_arrays(high, low, close, adx_threshold, atr_percentile)
+
+
+def get_regime_metrics_from_arrays(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    adx_threshold: float = 25.0,
+    atr_percentile: float = 50.0
+) -> Dict[str, Any]:
+    """
+    get_regime_metrics on high/low/close arrays, e.g. columns of
+    ohlcv_list_to_array, without building a DataFrame
+    
+    Args:
+        high: Candle highs
+        low: Candle lows
+        close: Candle closes
+        adx_threshold: ADX threshold to distinguish trending vs ranging (default: 25)
+        atr_percentile: ATR percentile to distinguish volatile vs quiet (default: 50)
+    
+    Returns:
+        Dictionary with regime metrics
+    """
+    if len(close) < 30:
+        return _default_metrics('Insufficient data')
+    
+    try:
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
+        
+        # Calculate all indicators (only the latest values are kept)
+        if NUMBA_AVAILABLE:
+            atr, adx, plus_di, minus_di, rsi = _regime_metrics_p14_kernel(high, low, close)
+            values = {'atr': atr, 'adx': adx, 'plus_di': plus_di, 'minus_di': minus_di}
+        else:
+            values = _last_regime_values_arrays(high, low, close)
+            rsi = _rsi_array(close, RSI_PERIOD)[-1]
+        regime = _classify_regime(values, adx_threshold, atr_percentile)
         
         # Get latest values
         metrics = {
             'regime': regime,
-            'adx': float(adx.iloc[-1]) if not adx.empty else 0.0,
-            'plus_di': float(plus_di.iloc[-1]) if not plus_di.empty else 0.0,
-            'minus_di': float(minus_di.iloc[-1]) if not minus_di.empty else 0.0,
-            'atr': float(atr.iloc[-1]) if not atr.empty else 0.0,
-            'rsi': float(rsi.iloc[-1]) if not rsi.empty else 50.0,
+            'adx': float(values['adx']),
+            'plus_di': float(values['plus_di']),
+            'minus_di': float(values['minus_di']),
+            'atr': float(values['atr'][-1]),
+            'rsi': float(rsi),
         }
         
         return metrics
         
     except Exception as e:
-        logger.error(f"Error calculating regime metrics: {str(e)}")
-        return {
-            'regime': MarketRegime.RANGE_QUIET,
-            'adx': 0.0,
-            'plus_di': 0.0,
-            'minus_di': 0.0,
-            'atr': 0.0,
-            'rsi': 50.0,
-            'error': str(e)
-        }
+        logger.error("Error calculating regime metrics: %s", e)
+        return _default_metrics(str(e))
+
+
+class RegimeMetricsCache:
+    """
+    LRU cache of regime metrics per symbol and candle set
+    
+    The metrics are deterministic for a given set of candles, so repeated
+    calls for the same candles (analysis, logging, hypotheses) reuse them.
+    The key holds the symbol, the candle count and the whole latest candle,
+    so an update to the still-open candle is recalculated.
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        """
+        Initialize the cache
+        
+        Args:
+            maxsize: Maximum number of cached results
+        """
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+    
+    def get_metrics(self, symbol: str, ohlcv: np.ndarray) -> Dict[str, Any]:
+        """
+        get_regime_metrics_from_arrays for an ohlcv_list_to_array array
+        
+        Args:
+            symbol: Trading symbol
+            ohlcv: Array of [timestamp, open, high, low, close, volume] rows
+        
+        Returns:
+            Dictionary with regime metrics (a copy the caller may modify)
+        """
+        key = (symbol, len(ohlcv), ohlcv[-1].tobytes() if len(ohlcv) else b'')
+        
+        metrics = self._cache.get(key)
+        if metrics is not None:
+            self._cache.move_to_end(key)
+            return dict(metrics)
+        
+        metrics = get_regime_metrics_from_arrays(ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4])
+        self._cache[key] = metrics
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        
+        return dict(metrics)
+    
+    def clear(self):
+        """Drop all cached results"""
+        self._cache.clear()
+
+
+def ohlcv_list_to_array(ohlcv_data: List[List]) -> np.ndarray:
+    """
+    Convert OHLCV list format to a float64 array in one pass
+    
+    Args:
+        ohlcv_data: List of [timestamp, open, high, low, close, volume]
+    
+    Returns:
+        Array of shape (n, 6); columns 2, 3 and 4 are high, low and close
+    """
+    return np.asarray(ohlcv_data, dtype=np.float64).reshape(-1, 6)
 
 
 def ohlcv_list_to_dataframe(ohlcv_data: List[List]) -> pd.DataFrame:
@@ -244,9 +642,11 @@ def ohlcv_list_to_dataframe(ohlcv_data: List[List]) -> pd.DataFrame:
     Returns:
         DataFrame with columns ['timestamp', 'open', 'high', 'low', 'close', 'volume']
     """
+    # Build from one float64 array rather than cell by cell from the lists
+    arr = ohlcv_list_to_array(ohlcv_data)
     df = pd.DataFrame(
-        ohlcv_data,
+        arr,
         columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
     )
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    df['timestamp'] = pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms')
     return df
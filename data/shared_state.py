@@ -3,9 +3,10 @@ Shared State for Global Risk Management
 Maintains global risk level and sentiment information accessible across the system
 """
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, NamedTuple, Optional
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 import threading
 
 logging.basicConfig(level=logging.INFO)
@@ -18,6 +19,40 @@ class RiskLevel(str, Enum):
     HIGH = "HIGH"
 
 
+def _oracle_view(level: RiskLevel, last_update: Optional[str], data: Dict[str, Any]) -> Mapping[str, Any]:
+    """Read-only get_oracle_data result, built once per write"""
+    return MappingProxyType({
+        'risk_level': level,
+        'last_update': last_update,
+        'data': MappingProxyType(data)
+    })
+
+
+def _sentiment_view(multiplier: float, last_update: Optional[str], data: Dict[str, Any]) -> Mapping[str, Any]:
+    """Read-only get_sentiment_data result, built once per write"""
+    return MappingProxyType({
+        'multiplier': multiplier,
+        'last_update': last_update,
+        'data': MappingProxyType(data)
+    })
+
+
+class _StateSnapshot(NamedTuple):
+    """
+    Immutable view of all shared state, replaced as a whole on every write
+    
+    Update times are stored as ISO strings, formatted once by the writer.
+    """
+    global_risk_level: RiskLevel = RiskLevel.NORMAL
+    sentiment_multiplier: float = 1.0
+    last_oracle_update: Optional[str] = None
+    last_sentiment_update: Optional[str] = None
+    oracle_data: Dict[str, Any] = {}
+    sentiment_data: Dict[str, Any] = {}
+    oracle_view: Mapping[str, Any] = _oracle_view(RiskLevel.NORMAL, None, {})
+    sentiment_view: Mapping[str, Any] = _sentiment_view(1.0, None, {})
+
+
 class SharedState:
     """
     Thread-safe shared state for global risk and sentiment
@@ -26,18 +61,38 @@ class SharedState:
     - Global risk level from TradFi Oracle
     - Sentiment multiplier from Sentiment Agent
     - Thread-safe access to shared data
+    
+    Reads are lock-free: all state lives in one immutable snapshot that
+    writers replace with a single attribute assignment (atomic in CPython).
+    The lock only serializes writers, which are rare compared to reads.
+    
+    The whale dump flag is independent of the other fields, so it is a
+    plain attribute with its own writer lock and doesn't wait on risk or
+    sentiment writers.
     """
     
+    # Slots make the per-read attribute loads descriptor lookups; __dict__
+    # stays available (created only on use) so instances can still be
+    # patched in tests
+    __slots__ = ('_lock', '_snapshot', '_whale_lock', '_whale_dump_risk', '__dict__')
+    
     def __init__(self):
         """Initialize SharedState"""
         self._lock = threading.Lock()
-        self._global_risk_level = RiskLevel.NORMAL
-        self._sentiment_multiplier = 1.0
+        self._snapshot = _StateSnapshot()
+        self._whale_lock = threading.Lock()
         self._whale_dump_risk = False
-        self._last_oracle_update: Optional[datetime] = None
-        self._last_sentiment_update: Optional[datetime] = None
-        self._oracle_data: Dict[str, Any] = {}
-        self._sentiment_data: Dict[str, Any] = {}
+    
+    def _publish(self, **changes) -> _StateSnapshot:
+        """
+        Replace the snapshot with a copy carrying `changes` (caller holds self._lock)
+        
+        Returns:
+            The previous snapshot
+        """
+        old = self._snapshot
+        self._snapshot = old._replace(**changes)
+        return old
         
     def set_global_risk_level(self, level: RiskLevel, oracle_data: Optional[Dict[str, Any]] = None):
         """
@@ -47,17 +102,25 @@ class SharedState:
             level: Risk level (NORMAL or HIGH)
             oracle_data: Optional oracle data (SPY/QQQ metrics)
         """
+        # One wall-clock read per write; it is formatted here so readers never do
+        now = datetime.now().isoformat()
+        
         with self._lock:
-            old_level = self._global_risk_level
-            self._global_risk_level = level
-            self._last_oracle_update = datetime.now()
-            if oracle_data:
-                self._oracle_data = oracle_data
-            
-            if old_level != level:
-                logger.info(f"🚨 Global risk level changed: {old_level} -> {level}")
-            else:
-                logger.debug(f"Global risk level updated: {level}")
+            # Readers use this dict without a lock, so keep a private copy
+            data = dict(oracle_data) if oracle_data else self._snapshot.oracle_data
+            old_level = self._publish(
+                global_risk_level=level,
+                last_oracle_update=now,
+                oracle_data=data,
+                oracle_view=_oracle_view(level, now, data)
+            ).global_risk_level
+        
+        # Logged after releasing the lock; arguments are only formatted if emitted.
+        # Enum members are singletons, so identity is the change test
+        if old_level is not level:
+            logger.info("🚨 Global risk level changed: %s -> %s", old_level, level)
+        else:
+            logger.debug("Global risk level updated: %s", level)
     
     def get_global_risk_level(self) -> RiskLevel:
         """
@@ -66,8 +129,7 @@ class SharedState:
         Returns:
             Current risk level
         """
-        with self._lock:
-            return self._global_risk_level
+        return self._snapshot.global_risk_level
     
     def set_sentiment_multiplier(self, multiplier: float, sentiment_data: Optional[Dict[str, Any]] = None):
         """
@@ -77,16 +139,22 @@ class SharedState:
             multiplier: Sentiment multiplier (0.5 to 1.5)
             sentiment_data: Optional sentiment analysis data
         """
-        # Clamp multiplier to valid range
-        multiplier = max(0.5, min(1.5, multiplier))
+        # Clamp multiplier to valid range (comparisons instead of min/max calls;
+        # NaN falls through to 1.5, as min(1.5, nan) did)
+        multiplier = 0.5 if multiplier < 0.5 else (multiplier if multiplier <= 1.5 else 1.5)
+        
+        now = datetime.now().isoformat()
         
         with self._lock:
-            self._sentiment_multiplier = multiplier
-            self._last_sentiment_update = datetime.now()
-            if sentiment_data:
-                self._sentiment_data = sentiment_data
-            
-            logger.info(f"💭 Sentiment multiplier updated: {multiplier:.2f}")
+            data = dict(sentiment_data) if sentiment_data else self._snapshot.sentiment_data
+            self._publish(
+                sentiment_multiplier=multiplier,
+                last_sentiment_update=now,
+                sentiment_data=data,
+                sentiment_view=_sentiment_view(multiplier, now, data)
+            )
+        
+        logger.info("💭 Sentiment multiplier updated: %.2f", multiplier)
     
     def get_sentiment_multiplier(self) -> float:
         """
@@ -95,36 +163,27 @@ class SharedState:
         Returns:
             Current sentiment multiplier
         """
-        with self._lock:
-            return self._sentiment_multiplier
+        return self._snapshot.sentiment_multiplier
     
-    def get_oracle_data(self) -> Dict[str, Any]:
+    def get_oracle_data(self) -> Mapping[str, Any]:
         """
         Get latest oracle data (thread-safe)
         
         Returns:
-            Dictionary with oracle metrics
+            Read-only mapping with oracle metrics, shared until the next
+            write (use dict(...) for a mutable copy)
         """
-        with self._lock:
-            return {
-                'risk_level': self._global_risk_level,
-                'last_update': self._last_oracle_update.isoformat() if self._last_oracle_update else None,
-                'data': self._oracle_data.copy()
-            }
+        return self._snapshot.oracle_view
     
-    def get_sentiment_data(self) -> Dict[str, Any]:
+    def get_sentiment_data(self) -> Mapping[str, Any]:
         """
         Get latest sentiment data (thread-safe)
         
         Returns:
-            Dictionary with sentiment metrics
+            Read-only mapping with sentiment metrics, shared until the next
+            write (use dict(...) for a mutable copy)
         """
-        with self._lock:
-            return {
-                'multiplier': self._sentiment_multiplier,
-                'last_update': self._last_sentiment_update.isoformat() if self._last_sentiment_update else None,
-                'data': self._sentiment_data.copy()
-            }
+        return self._snapshot.sentiment_view
     
     def set_whale_dump_risk(self, risk_active: bool):
         """
@@ -133,11 +192,13 @@ class SharedState:
         Args:
             risk_active: Whether whale dump risk is active
         """
-        with self._lock:
+        # The lock only makes the read-and-swap atomic, so each transition is logged once
+        with self._whale_lock:
             old_risk = self._whale_dump_risk
             self._whale_dump_risk = risk_active
-            if old_risk != risk_active:
-                logger.warning(f"🐋 Whale dump risk: {risk_active}")
+        
+        if old_risk != risk_active:
+            logger.warning("🐋 Whale dump risk: %s", risk_active)
     
     def get_whale_dump_risk(self) -> bool:
         """
@@ -146,30 +207,37 @@ class SharedState:
         Returns:
             Current whale dump risk status
         """
-        with self._lock:
-            return self._whale_dump_risk
+        return self._whale_dump_risk
     
-    def get_all_state(self) -> Dict[str, Any]:
+    def get_all_state(self, include_raw: bool = False) -> Dict[str, Any]:
         """
         Get complete state snapshot (thread-safe)
         
+        Args:
+            include_raw: Also return copies of the raw oracle/sentiment payloads
+        
         Returns:
             Dictionary with all state information
         """
-        with self._lock:
-            return {
-                'global_risk_level': self._global_risk_level,
-                'sentiment_multiplier': self._sentiment_multiplier,
-                'whale_dump_risk': self._whale_dump_risk,
-                'last_oracle_update': self._last_oracle_update.isoformat() if self._last_oracle_update else None,
-                'last_sentiment_update': self._last_sentiment_update.isoformat() if self._last_sentiment_update else None,
-                'oracle_data': self._oracle_data.copy(),
-                'sentiment_data': self._sentiment_data.copy()
-            }
+        # One snapshot read, so every risk/sentiment field comes from the same state
+        snapshot = self._snapshot
+        state = {
+            'global_risk_level': snapshot.global_risk_level,
+            'sentiment_multiplier': snapshot.sentiment_multiplier,
+            'whale_dump_risk': self._whale_dump_risk,
+            'last_oracle_update': snapshot.last_oracle_update,
+            'last_sentiment_update': snapshot.last_sentiment_update
+        }
+        if include_raw:
+            # Only callers that read or edit the payloads pay for the copies
+            state['oracle_data'] = snapshot.oracle_data.copy()
+            state['sentiment_data'] = snapshot.sentiment_data.copy()
+        return state
 
 
 # Global singleton instance
 _shared_state_instance: Optional[SharedState] = None
+_shared_state_lock = threading.Lock()
 
 
 def get_shared_state() -> SharedState:
@@ -180,6 +248,12 @@ def get_shared_state() -> SharedState:
         SharedState instance
     """
     global _shared_state_instance
-    if _shared_state_instance is None:
-        _shared_state_instance = SharedState()
-    return _shared_state_instance
+    instance = _shared_state_instance
+    if instance is None:
+        # Only the first calls take the lock; re-check so racing threads
+        # all get the instance the winner created
+        with _shared_state_lock:
+            if _shared_state_instance is None:
+                _shared_state_instance = SharedState()
+            instance = _shared_state_instance
+    return instance
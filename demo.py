@@ -7,6 +7,7 @@ import asyncio
 import sys
 import os
 from datetime import datetime, timedelta
+import numpy as np
 
 # Set test environment
 os.environ['WEEX_API_KEY'] = 'demo_key'
@@ -19,6 +20,7 @@ from reasoning_loop import ReasoningLoop
 from architect import Architect
 from guardrails import Guardrails
 import active_logic
+from demo_helpers import buffered_section
 
 
 class MockDiscoveryAgent:
@@ -41,16 +43,17 @@ class MockDiscoveryAgent:
     async def fetch_ohlcv(self, symbol, timeframe='15m', limit=100):
         """Generate mock OHLCV data with a trend"""
         base_price = 50000 if 'BTC' in symbol else 3000
-        data = []
-        for i in range(limit):
-            timestamp = int(datetime.now().timestamp() * 1000) - (limit - i) * 15 * 60 * 1000
-            open_price = base_price + i * 10
-            high = open_price + 50
-            low = open_price - 30
-            close = open_price + 20
-            volume = 1000 + i * 5
-            data.append([timestamp, open_price, high, low, close, volume])
-        return data
+        now_ms = int(datetime.now().timestamp() * 1000)
+        
+        # All columns are int64, so tolist() gives the same ints as before
+        i = np.arange(limit, dtype=np.int64)
+        timestamps = now_ms - (limit - i) * 15 * 60 * 1000
+        open_price = base_price + i * 10
+        high = open_price + 50
+        low = open_price - 30
+        close = open_price + 20
+        volume = 1000 + i * 5
+        return np.column_stack([timestamps, open_price, high, low, close, volume]).tolist()
     
     async def fetch_balance(self):
         return {
@@ -61,10 +64,11 @@ class MockDiscoveryAgent:
 
 async def demo():
     """Run a complete demo of Aether-Evo"""
-    print("=" * 70)
-    print("🌟 AETHER-EVO DEMONSTRATION 🌟")
-    print("=" * 70)
-    print()
+    with buffered_section():
+        print("=" * 70)
+        print("🌟 AETHER-EVO DEMONSTRATION 🌟")
+        print("=" * 70)
+        print()
     
     # 1. Load Configuration
     print("1️⃣  Loading Configuration...")
@@ -164,30 +168,31 @@ async def demo():
     print()
     
     # 10. Status Summary
-    print("🔟 System Status Summary")
-    status = guardrails.get_status()
-    print(f"   📊 Current Equity: ${status['current_equity']:.2f}")
-    print(f"   📈 Change: {status['equity_change_pct']:+.2f}%")
-    print(f"   🛡️  Kill-Switch: {'🛑 ACTIVE' if status['kill_switch_active'] else '✅ Inactive'}")
-    print(f"   🔓 Can Evolve: {'Yes' if status['can_evolve'] else 'No (locked)'}")
-    print(f"   🧬 Evolutions: {len(architect.get_evolution_history())}")
-    print()
-    
-    print("=" * 70)
-    print("✅ DEMONSTRATION COMPLETE")
-    print("=" * 70)
-    print()
-    print("Key Features Demonstrated:")
-    print("  ✓ Configuration management")
-    print("  ✓ Discovery Agent (API mapping)")
-    print("  ✓ Reasoning Loop (R1 analysis)")
-    print("  ✓ Trading signal generation")
-    print("  ✓ Evolution system (Architect)")
-    print("  ✓ Guardrails (kill-switch, stability lock)")
-    print("  ✓ Code validation and audit")
-    print()
-    print("Ready for production with real WEEX credentials!")
-    print()
+    with buffered_section():
+        print("🔟 System Status Summary")
+        status = guardrails.get_status()
+        print(f"   📊 Current Equity: ${status['current_equity']:.2f}")
+        print(f"   📈 Change: {status['equity_change_pct']:+.2f}%")
+        print(f"   🛡️  Kill-Switch: {'🛑 ACTIVE' if status['kill_switch_active'] else '✅ Inactive'}")
+        print(f"   🔓 Can Evolve: {'Yes' if status['can_evolve'] else 'No (locked)'}")
+        print(f"   🧬 Evolutions: {len(architect.get_evolution_history())}")
+        print()
+        
+        print("=" * 70)
+        print("✅ DEMONSTRATION COMPLETE")
+        print("=" * 70)
+        print()
+        print("Key Features Demonstrated:")
+        print("  ✓ Configuration management")
+        print("  ✓ Discovery Agent (API mapping)")
+        print("  ✓ Reasoning Loop (R1 analysis)")
+        print("  ✓ Trading signal generation")
+        print("  ✓ Evolution system (Architect)")
+        print("  ✓ Guardrails (kill-switch, stability lock)")
+        print("  ✓ Code validation and audit")
+        print()
+        print("Ready for production with real WEEX credentials!")
+        print()
 
 
 if __name__ == "__main__":
@@ -3,12 +3,21 @@ Demo: Enhanced Adversarial Alpha Agent
 Demonstrates psychological bias detection and contrarian trading signals
 """
 import logging
+
+import numpy as np
 from core.adversary import AdversarialAlpha, test_adversary
 from agents.narrative import NarrativePulse
+from demo_helpers import buffered_section
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s:%(name)s:%(message)s')
 logger = logging.getLogger(__name__)
 
+# Scenario closing prices, built once as contiguous float64 arrays
+FOMO_PRICES = np.tile(np.array([88000, 89000, 90000, 92000, 94000, 95000], dtype=np.float64), 3)
+PANIC_PRICES = np.tile(np.array([90000, 88000, 86000, 84000, 82000], dtype=np.float64), 4)
+EXHAUSTION_PRICES = np.tile(np.array([90000, 91000, 92500, 94000, 95500, 97000, 98000], dtype=np.float64), 3)
+WHALE_DUMP_PRICES = np.tile(np.array([92000, 91000, 90000, 89000, 88000], dtype=np.float64), 4)
+
 
 def demo_psychological_bias_detection():
     """
@@ -30,15 +39,16 @@ def demo_psychological_bias_detection():
         'price_change_pct': 5.5,
         'sentiment': 'extreme greed',
         'volume': 8000.0,
-        'recent_prices': [88000, 89000, 90000, 92000, 94000, 95000] * 3
+        'recent_prices': FOMO_PRICES
     }
     
     result = adversary.analyze_market(fomo_data)
-    print(f"Signal: {result['signal']}")
-    print(f"Confidence: {result['confidence']:.2%}")
-    print(f"Detected Bias: {result['detected_bias']}")
-    print(f"Trap Prediction: {result['trap_prediction']}")
-    print(f"Reasoning: {result['reasoning_path'][:150]}...")
+    with buffered_section():
+        print(f"Signal: {result['signal']}")
+        print(f"Confidence: {result['confidence']:.2%}")
+        print(f"Detected Bias: {result['detected_bias']}")
+        print(f"Trap Prediction: {result['trap_prediction']}")
+        print(f"Reasoning: {result['reasoning_path'][:150]}...")
     
     # Scenario 2: Panic Seller - Contrarian Buy
     print("\n📊 Scenario 2: Panic Seller (Mean Reversion Opportunity)")
@@ -48,16 +58,17 @@ def demo_psychological_bias_detection():
         'price_change_pct': -8.0,
         'sentiment': 'extreme fear',
         'volume': 12000.0,
-        'recent_prices': [90000, 88000, 86000, 84000, 82000] * 4,
+        'recent_prices': PANIC_PRICES,
         'at_support': True
     }
     
     result = adversary.analyze_market(panic_data)
-    print(f"Signal: {result['signal']}")
-    print(f"Confidence: {result['confidence']:.2%}")
-    print(f"Detected Bias: {result['detected_bias']}")
-    print(f"RSI: {result['rsi']:.2f}")
-    print(f"Reasoning: {result['reasoning_path'][:150]}...")
+    with buffered_section():
+        print(f"Signal: {result['signal']}")
+        print(f"Confidence: {result['confidence']:.2%}")
+        print(f"Detected Bias: {result['detected_bias']}")
+        print(f"RSI: {result['rsi']:.2f}")
+        print(f"Reasoning: {result['reasoning_path'][:150]}...")
     
     # Scenario 3: Trend Exhaustion - Recency Bias
     print("\n📊 Scenario 3: Trend Exhaustion (Recency Bias)")
@@ -67,14 +78,15 @@ def demo_psychological_bias_detection():
         'price_change_pct': 1.5,
         'sentiment': 'greed',
         'volume': 5000.0,
-        'recent_prices': [90000, 91000, 92500, 94000, 95500, 97000, 98000] * 3
+        'recent_prices': EXHAUSTION_PRICES
     }
     
     result = adversary.analyze_market(exhaustion_data)
-    print(f"Signal: {result['signal']}")
-    print(f"Confidence: {result['confidence']:.2%}")
-    print(f"Detected Bias: {result['detected_bias']}")
-    print(f"Reasoning: {result['reasoning_path'][:150]}...")
+    with buffered_section():
+        print(f"Signal: {result['signal']}")
+        print(f"Confidence: {result['confidence']:.2%}")
+        print(f"Detected Bias: {result['detected_bias']}")
+        print(f"Reasoning: {result['reasoning_path'][:150]}...")
 
 
 def demo_narrative_integration():
@@ -101,12 +113,13 @@ def demo_narrative_integration():
     }
     
     narrative_result = narrative.monitor_narrative(market_data)
-    print(f"\n🐋 Narrative Analysis:")
-    print(f"   Overall Sentiment: {narrative_result['overall_sentiment']}")
-    print(f"   Whale Dump Risk: {narrative_result['whale_dump_risk']}")
-    print(f"   Signals Detected: {len(narrative_result['signals'])}")
-    for signal in narrative_result['signals']:
-        print(f"   - {signal['type']}: {signal['message']}")
+    with buffered_section():
+        print(f"\n🐋 Narrative Analysis:")
+        print(f"   Overall Sentiment: {narrative_result['overall_sentiment']}")
+        print(f"   Whale Dump Risk: {narrative_result['whale_dump_risk']}")
+        print(f"   Signals Detected: {len(narrative_result['signals'])}")
+        for signal in narrative_result['signals']:
+            print(f"   - {signal['type']}: {signal['message']}")
     
     # Now analyze with adversary, including narrative data
     adversary_market_data = {
@@ -114,7 +127,7 @@ def demo_narrative_integration():
         'price_change_pct': -6.0,
         'sentiment': 'fear',
         'volume': 5000.0,
-        'recent_prices': [92000, 91000, 90000, 89000, 88000] * 4
+        'recent_prices': WHALE_DUMP_PRICES
     }
     
     result = adversary.analyze_market(
@@ -122,11 +135,12 @@ def demo_narrative_integration():
         narrative_data=narrative_result
     )
     
-    print(f"\n🎯 Adversarial Analysis (with Narrative):")
-    print(f"   Signal: {result['signal']}")
-    print(f"   Confidence: {result['confidence']:.2%}")
-    print(f"   Detected Bias: {result['detected_bias']}")
-    print(f"   Reasoning: {result['reasoning_path'][:200]}...")
+    with buffered_section():
+        print(f"\n🎯 Adversarial Analysis (with Narrative):")
+        print(f"   Signal: {result['signal']}")
+        print(f"   Confidence: {result['confidence']:.2%}")
+        print(f"   Detected Bias: {result['detected_bias']}")
+        print(f"   Reasoning: {result['reasoning_path'][:200]}...")
 
 
 def demo_shadow_mode_resilience():
@@ -146,20 +160,20 @@ def demo_shadow_mode_resilience():
     # Simulate mock/synthetic data scenario
     import time
     current_time = int(time.time() * 1000)
-    mock_ohlcv = []
-    for i in range(30):
-        # Create slightly varying synthetic data
-        base_price = 90000.0
-        variation = (i % 10 - 5) * 50  # Small variations
-        mock_ohlcv.append([
-            current_time - (i * 900000),  # 15m intervals
-            base_price + variation,
-            base_price + variation + 200,
-            base_price + variation - 200,
-            base_price + variation + 50,
-            1.5
-        ])
-    mock_ohlcv = sorted(mock_ohlcv, key=lambda x: x[0])
+    # Create slightly varying synthetic data, oldest candle first
+    i = np.arange(29, -1, -1)
+    base_price = 90000.0
+    price = base_price + (i % 10 - 5) * 50  # Small variations
+    mock_ohlcv = [
+        list(candle) for candle in zip(
+            (current_time - i * 900000).tolist(),  # 15m intervals
+            price.tolist(),
+            (price + 200).tolist(),
+            (price - 200).tolist(),
+            (price + 50).tolist(),
+            [1.5] * len(i)
+        )
+    ]
     
     mock_data = {
         'price': 90000.0,
@@ -173,13 +187,14 @@ def demo_shadow_mode_resilience():
     result = adversary.analyze_market(mock_data, ohlcv_data=mock_ohlcv)
     elapsed = time.time() - start
     
-    print(f"✅ Analysis completed with synthetic data")
-    print(f"   Response Time: {elapsed:.3f}s (target: <1s)")
-    print(f"   Signal: {result['signal']}")
-    print(f"   Mode: {result.get('mode', 'UNKNOWN')}")
-    print(f"   Status: Agent continues to function normally")
-    print(f"\n💡 Key Point: Agent never 'goes blind' - falls back to mock data")
-    print(f"   and continues reasoning loop for testing/development")
+    with buffered_section():
+        print(f"✅ Analysis completed with synthetic data")
+        print(f"   Response Time: {elapsed:.3f}s (target: <1s)")
+        print(f"   Signal: {result['signal']}")
+        print(f"   Mode: {result.get('mode', 'UNKNOWN')}")
+        print(f"   Status: Agent continues to function normally")
+        print(f"\n💡 Key Point: Agent never 'goes blind' - falls back to mock data")
+        print(f"   and continues reasoning loop for testing/development")
 
 
 def demo_red_team_validation():
@@ -205,13 +220,14 @@ def aggressive_strategy(data):
 """
     
     approved, report = adversary.red_team_strategy(risky_strategy)
-    print(f"Verdict: {'✅ APPROVED' if approved else '❌ REJECTED'}")
-    print(f"Tests Passed: {len(report['tests_passed'])}")
-    print(f"Tests Failed: {len(report['tests_failed'])}")
-    if report['recommendations']:
-        print(f"Recommendations:")
-        for rec in report['recommendations']:
-            print(f"  - {rec}")
+    with buffered_section():
+        print(f"Verdict: {'✅ APPROVED' if approved else '❌ REJECTED'}")
+        print(f"Tests Passed: {len(report['tests_passed'])}")
+        print(f"Tests Failed: {len(report['tests_failed'])}")
+        if report['recommendations']:
+            print(f"Recommendations:")
+            for rec in report['recommendations']:
+                print(f"  - {rec}")
     
     # Example 2: Safe strategy (should be approved)
     print("\n📊 Example 2: Safe Strategy (With Protections)")
@@ -233,9 +249,10 @@ def defensive_strategy(data):
 """
     
     approved, report = adversary.red_team_strategy(safe_strategy)
-    print(f"Verdict: {'✅ APPROVED' if approved else '❌ REJECTED'}")
-    print(f"Tests Passed: {len(report['tests_passed'])}")
-    print(f"Tests Failed: {len(report['tests_failed'])}")
+    with buffered_section():
+        print(f"Verdict: {'✅ APPROVED' if approved else '❌ REJECTED'}")
+        print(f"Tests Passed: {len(report['tests_passed'])}")
+        print(f"Tests Failed: {len(report['tests_failed'])}")
 
 
 def main():
@@ -256,20 +273,21 @@ def main():
     print("="*70)
     test_adversary()
     
-    print("\n" + "="*70)
-    print("✅ DEMONSTRATION COMPLETE")
-    print("="*70)
-    print("\n📚 Key Features Demonstrated:")
-    print("   1. ✅ Psychological Bias Detection (FOMO, Panic, Exhaustion)")
-    print("   2. ✅ Narrative Pulse Integration (Whale Activity, News)")
-    print("   3. ✅ Shadow Mode Resilience (451 Error Recovery)")
-    print("   4. ✅ Red Team Validation (Strategy Safety Checks)")
-    print("   5. ✅ Heuristic Mode (Works without API keys)")
-    print("   6. ✅ DeepSeek-V3 Ready (LLM integration available)")
-    print("\n💡 Next Steps:")
-    print("   - Set DEEPSEEK_API_KEY in .env for LLM-powered analysis")
-    print("   - Integrate with live trading system")
-    print("   - Monitor signal history for performance tracking")
+    with buffered_section():
+        print("\n" + "="*70)
+        print("✅ DEMONSTRATION COMPLETE")
+        print("="*70)
+        print("\n📚 Key Features Demonstrated:")
+        print("   1. ✅ Psychological Bias Detection (FOMO, Panic, Exhaustion)")
+        print("   2. ✅ Narrative Pulse Integration (Whale Activity, News)")
+        print("   3. ✅ Shadow Mode Resilience (451 Error Recovery)")
+        print("   4. ✅ Red Team Validation (Strategy Safety Checks)")
+        print("   5. ✅ Heuristic Mode (Works without API keys)")
+        print("   6. ✅ DeepSeek-V3 Ready (LLM integration available)")
+        print("\n💡 Next Steps:")
+        print("   - Set DEEPSEEK_API_KEY in .env for LLM-powered analysis")
+        print("   - Integrate with live trading system")
+        print("   - Monitor signal history for performance tracking")
 
 
 if __name__ == "__main__":
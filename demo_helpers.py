@@ -0,0 +1,18 @@
+"""
+Shared helpers for the demo scripts
+"""
+import io
+import sys
+from contextlib import contextmanager, redirect_stdout
+
+
+@contextmanager
+def buffered_section():
+    """Collect a section's prints and write them to stdout in one call"""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            yield
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
@@ -13,6 +13,7 @@ from core.backtester import VectorizedBacktester
 from data.logger import ReasoningLogger
 from data.memory import EvolutionMemory
 from config import AetherConfig
+from demo_helpers import buffered_section
 
 
 def print_header(text):
@@ -24,9 +25,10 @@ def print_header(text):
 
 async def demo_phase3():
     """Demonstrate Phase 3 features"""
-    print("\n" + "🌟" * 35)
-    print("  AlphaWEEX Phase 3: The Alpha Factory & Reasoning Visualizer")
-    print("🌟" * 35 + "\n")
+    with buffered_section():
+        print("\n" + "🌟" * 35)
+        print("  AlphaWEEX Phase 3: The Alpha Factory & Reasoning Visualizer")
+        print("🌟" * 35 + "\n")
     
     # Initialize components
     print("Initializing Phase 3 components...")
@@ -50,15 +52,16 @@ async def demo_phase3():
     
     hypothesis = await explorer.explore(current_regime='TRENDING_UP')
     
-    print("✨ NEW HYPOTHESIS GENERATED:")
-    print(f"   {hypothesis['hypothesis']}")
-    print(f"\n📈 Confidence: {hypothesis['confidence']:.0%}")
-    print(f"🎯 Suggested Indicators:")
-    for indicator in hypothesis['suggested_indicators']:
-        print(f"      • {indicator}")
-    print(f"\n💡 Implementation Hints:")
-    for i, hint in enumerate(hypothesis['implementation_hints'], 1):
-        print(f"      {i}. {hint}")
+    with buffered_section():
+        print("✨ NEW HYPOTHESIS GENERATED:")
+        print(f"   {hypothesis['hypothesis']}")
+        print(f"\n📈 Confidence: {hypothesis['confidence']:.0%}")
+        print(f"🎯 Suggested Indicators:")
+        for indicator in hypothesis['suggested_indicators']:
+            print(f"      • {indicator}")
+        print(f"\n💡 Implementation Hints:")
+        for i, hint in enumerate(hypothesis['implementation_hints'], 1):
+            print(f"      {i}. {hint}")
     
     # Log hypothesis
     logger.log_hypothesis(hypothesis, source='explorer')
@@ -77,19 +80,20 @@ async def demo_phase3():
     if result['success']:
         metrics = result['metrics']
         
-        print("📈 BACKTEST RESULTS:")
-        print(f"   Total Return:  {metrics['total_return']:>8.2%}")
-        print(f"   Sharpe Ratio:  {metrics['sharpe_ratio']:>8.2f} {'✅' if metrics['sharpe_ratio'] > 1.2 else '❌'}")
-        print(f"   Max Drawdown:  {metrics['max_drawdown']:>8.2%} {'✅' if metrics['max_drawdown'] < 0.05 else '❌'}")
-        print(f"   Win Rate:      {metrics['win_rate']:>8.2%}")
-        print(f"   Num Trades:    {metrics['num_trades']:>8}")
-        print(f"   Final Equity:  ${metrics['final_equity']:>8.2f}")
-        
-        print(f"\n{'✅' if result['can_deploy'] else '❌'} Deployment Status: {'APPROVED' if result['can_deploy'] else 'BLOCKED'}")
-        
-        if not result['can_deploy']:
-            print("   Strategy does not meet deployment criteria")
-            print("   Evolution will be blocked until strategy improves")
+        with buffered_section():
+            print("📈 BACKTEST RESULTS:")
+            print(f"   Total Return:  {metrics['total_return']:>8.2%}")
+            print(f"   Sharpe Ratio:  {metrics['sharpe_ratio']:>8.2f} {'✅' if metrics['sharpe_ratio'] > 1.2 else '❌'}")
+            print(f"   Max Drawdown:  {metrics['max_drawdown']:>8.2%} {'✅' if metrics['max_drawdown'] < 0.05 else '❌'}")
+            print(f"   Win Rate:      {metrics['win_rate']:>8.2%}")
+            print(f"   Num Trades:    {metrics['num_trades']:>8}")
+            print(f"   Final Equity:  ${metrics['final_equity']:>8.2f}")
+            
+            print(f"\n{'✅' if result['can_deploy'] else '❌'} Deployment Status: {'APPROVED' if result['can_deploy'] else 'BLOCKED'}")
+            
+            if not result['can_deploy']:
+                print("   Strategy does not meet deployment criteria")
+                print("   Evolution will be blocked until strategy improves")
     
     # 3. Reasoning Logger Demo
     print_header("3. Reasoning Logger - Complete Trace Logging")
@@ -114,59 +118,62 @@ async def demo_phase3():
     print("✅ Reasoning trace saved to data/reasoning_logs.jsonl")
     
     # Show statistics
-    stats = logger.get_statistics()
-    print(f"\n📊 Logger Statistics:")
-    print(f"   Total traces:  {stats['total_traces']}")
-    print(f"   File size:     {stats['file_size_mb']:.3f} MB")
-    print(f"   Sources:")
-    for source, count in stats['sources'].items():
-        print(f"      • {source}: {count} traces")
-    
-    # Show recent traces
-    print("\n📖 Recent Traces:")
-    traces = logger.read_recent_traces(count=3)
-    for i, trace in enumerate(traces[-3:], 1):
-        print(f"   {i}. [{trace['source']}] {trace['timestamp'][:19]} - {trace['thought_count']} thoughts")
+    with buffered_section():
+        stats = logger.get_statistics()
+        print(f"\n📊 Logger Statistics:")
+        print(f"   Total traces:  {stats['total_traces']}")
+        print(f"   File size:     {stats['file_size_mb']:.3f} MB")
+        print(f"   Sources:")
+        for source, count in stats['sources'].items():
+            print(f"      • {source}: {count} traces")
+        
+        # Show recent traces
+        print("\n📖 Recent Traces:")
+        traces = logger.read_recent_traces(count=3)
+        for i, trace in enumerate(traces[-3:], 1):
+            print(f"   {i}. [{trace['source']}] {trace['timestamp'][:19]} - {trace['thought_count']} thoughts")
     
     # 4. Dashboard Preview
-    print_header("4. Interactive Dashboard - System Visualization")
-    
-    print("🖥️  Dashboard Features:")
-    print("   • Thinking Log - Real-time R1 reasoning with <thought> tags")
-    print("   • Strategy Lineage - Visual evolution timeline")
-    print("   • Live Metrics - PnL tracking vs kill-switch threshold")
-    print("   • System Status - Component health monitoring")
-    
-    print("\n🚀 To launch the dashboard, run:")
-    print("   streamlit run dashboard/app.py")
-    print("\n   Then open your browser to: http://localhost:8501")
+    with buffered_section():
+        print_header("4. Interactive Dashboard - System Visualization")
+        
+        print("🖥️  Dashboard Features:")
+        print("   • Thinking Log - Real-time R1 reasoning with <thought> tags")
+        print("   • Strategy Lineage - Visual evolution timeline")
+        print("   • Live Metrics - PnL tracking vs kill-switch threshold")
+        print("   • System Status - Component health monitoring")
+        
+        print("\n🚀 To launch the dashboard, run:")
+        print("   streamlit run dashboard/app.py")
+        print("\n   Then open your browser to: http://localhost:8501")
     
     # Summary
-    print_header("Summary - Phase 3 Components Working")
-    
-    print("✅ Stochastic Alpha Explorer")
-    print("   • 6-hour creative hypothesis generation")
-    print("   • Temperature 1.3 for unconventional ideas")
-    print("   • Analyzes failed strategies to avoid repetition")
-    
-    print("\n✅ Vectorized Backtester")
-    print("   • Pandas-based for speed")
-    print("   • Sharpe Ratio & Max Drawdown validation")
-    print("   • Blocks deployment if thresholds not met")
-    
-    print("\n✅ Reasoning Logger")
-    print("   • JSONL format for easy parsing")
-    print("   • <thought> tag extraction")
-    print("   • Automatic log rotation at 100MB")
-    
-    print("\n✅ Interactive Dashboard")
-    print("   • Streamlit-based web interface")
-    print("   • Real-time visualization")
-    print("   • Multiple views (Thinking, Lineage, Metrics)")
-    
-    print("\n" + "=" * 70)
-    print("  🎉 Phase 3 Implementation Complete!")
-    print("=" * 70 + "\n")
+    with buffered_section():
+        print_header("Summary - Phase 3 Components Working")
+        
+        print("✅ Stochastic Alpha Explorer")
+        print("   • 6-hour creative hypothesis generation")
+        print("   • Temperature 1.3 for unconventional ideas")
+        print("   • Analyzes failed strategies to avoid repetition")
+        
+        print("\n✅ Vectorized Backtester")
+        print("   • Pandas-based for speed")
+        print("   • Sharpe Ratio & Max Drawdown validation")
+        print("   • Blocks deployment if thresholds not met")
+        
+        print("\n✅ Reasoning Logger")
+        print("   • JSONL format for easy parsing")
+        print("   • <thought> tag extraction")
+        print("   • Automatic log rotation at 100MB")
+        
+        print("\n✅ Interactive Dashboard")
+        print("   • Streamlit-based web interface")
+        print("   • Real-time visualization")
+        print("   • Multiple views (Thinking, Lineage, Metrics)")
+        
+        print("\n" + "=" * 70)
+        print("  🎉 Phase 3 Implementation Complete!")
+        print("=" * 70 + "\n")
 
 
 if __name__ == "__main__":
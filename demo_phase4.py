@@ -5,6 +5,7 @@ Demonstrates Oracle, Sentiment Agent, and Position Sizing
 import asyncio
 import sys
 from pathlib import Path
+import numpy as np
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -40,10 +41,16 @@ async def main():
     architect = Architect(guardrails)
     shared_state = get_shared_state()
     
+    # The three providers are independent, so fetch them concurrently
+    print("\n🔍 Fetching market data, Fear & Greed Index and Bitcoin headlines...")
+    market_summary, fear_greed, headlines = await asyncio.gather(
+        asyncio.to_thread(oracle.get_market_summary),
+        asyncio.to_thread(sentiment_agent.fetch_fear_greed_index),
+        asyncio.to_thread(sentiment_agent.fetch_bitcoin_news, 5)
+    )
+    
     # Demonstrate Oracle
     print_header("1. TradFi Oracle - Market Risk Assessment")
-    print("\n🔍 Fetching market data from Alpaca API...")
-    market_summary = oracle.get_market_summary()
     
     print(f"\n📊 Market Data:")
     market_data = market_summary['market_data']
@@ -57,19 +64,17 @@ async def main():
     
     # Demonstrate Sentiment Agent
     print_header("2. Sentiment Agent - Market Sentiment Analysis")
-    print("\n😱 Fetching Fear & Greed Index...")
-    fear_greed = sentiment_agent.fetch_fear_greed_index()
+    print("\n😱 Fear & Greed Index:")
     print(f"  Value: {fear_greed['value']}")
     print(f"  Classification: {fear_greed['classification']}")
     print(f"  Source: {fear_greed['source']}")
     
-    print("\n📰 Fetching Bitcoin headlines...")
-    headlines = sentiment_agent.fetch_bitcoin_news(5)
+    print("\n📰 Bitcoin headlines:")
     for i, headline in enumerate(headlines, 1):
         print(f"  {i}. {headline}")
     
     print("\n💭 Analyzing sentiment...")
-    multiplier = await sentiment_agent.update_sentiment()
+    multiplier = await sentiment_agent.update_sentiment(fear_greed, headlines)
     sentiment_summary = sentiment_agent.get_sentiment_summary()
     sentiment_info = sentiment_summary['data']
     
@@ -83,47 +88,39 @@ async def main():
     
     base_size = 100.0
     
-    # Scenario 1: Normal conditions
-    print("Scenario 1: Normal Market Conditions")
-    shared_state.set_global_risk_level(RiskLevel.NORMAL)
-    shared_state.set_sentiment_multiplier(1.0)
-    size1 = architect.get_adjusted_size(base_size)
-    print(f"  Base Size: ${base_size:.2f}")
-    print(f"  Risk: NORMAL | Sentiment: 1.0x")
-    print(f"  Final Size: ${size1:.2f}")
-    
-    # Scenario 2: Cautious sentiment
-    print("\nScenario 2: Cautious Sentiment")
-    shared_state.set_global_risk_level(RiskLevel.NORMAL)
-    shared_state.set_sentiment_multiplier(0.7)
-    size2 = architect.get_adjusted_size(base_size)
-    print(f"  Base Size: ${base_size:.2f}")
-    print(f"  Risk: NORMAL | Sentiment: 0.7x")
-    print(f"  Final Size: ${size2:.2f}")
-    reduction2 = ((size2 - base_size) / base_size) * 100
-    print(f"  Reduction: {abs(reduction2):.1f}%")
-    
-    # Scenario 3: High risk
-    print("\nScenario 3: High Risk Market")
-    shared_state.set_global_risk_level(RiskLevel.HIGH)
-    shared_state.set_sentiment_multiplier(1.0)
-    size3 = architect.get_adjusted_size(base_size)
-    print(f"  Base Size: ${base_size:.2f}")
-    print(f"  Risk: HIGH | Sentiment: 1.0x")
-    print(f"  Final Size: ${size3:.2f}")
-    reduction3 = ((size3 - base_size) / base_size) * 100
-    print(f"  Reduction: {abs(reduction3):.1f}%")
-    
-    # Scenario 4: Worst case (High risk + cautious sentiment)
-    print("\nScenario 4: Worst Case (High Risk + Panicked Sentiment)")
-    shared_state.set_global_risk_level(RiskLevel.HIGH)
-    shared_state.set_sentiment_multiplier(0.5)
-    size4 = architect.get_adjusted_size(base_size)
-    print(f"  Base Size: ${base_size:.2f}")
-    print(f"  Risk: HIGH | Sentiment: 0.5x")
-    print(f"  Final Size: ${size4:.2f}")
-    reduction4 = ((size4 - base_size) / base_size) * 100
-    print(f"  Reduction: {abs(reduction4):.1f}%")
+    # (title, risk level, sentiment multiplier), sized in one batch call
+    scenarios = [
+        ("Normal Market Conditions", RiskLevel.NORMAL, 1.0),
+        ("Cautious Sentiment", RiskLevel.NORMAL, 0.7),
+        ("High Risk Market", RiskLevel.HIGH, 1.0),
+        ("Worst Case (High Risk + Panicked Sentiment)", RiskLevel.HIGH, 0.5),
+    ]
+    sizes = architect.get_adjusted_sizes_batch(
+        [base_size] * len(scenarios),
+        [risk for _, risk, _ in scenarios],
+        [sentiment for _, _, sentiment in scenarios],
+        whale_dump_risk=[False] * len(scenarios)
+    )
+    
+    reductions = np.abs((sizes - base_size) / base_size * 100.0)
+    
+    cards = []
+    for i, ((title, risk, sentiment), size, reduction) in enumerate(zip(scenarios, sizes, reductions), 1):
+        card = (
+            f"Scenario {i}: {title}\n"
+            f"  Base Size: ${base_size:.2f}\n"
+            f"  Risk: {risk.name} | Sentiment: {sentiment:.1f}x\n"
+            f"  Final Size: ${size:.2f}"
+        )
+        if size < base_size:
+            card += f"\n  Reduction: {reduction:.1f}%"
+        cards.append(card)
+    print("\n\n".join(cards))
+    
+    # Leave shared state on the last scenario for the summary below
+    _, risk, sentiment = scenarios[-1]
+    shared_state.set_global_risk_level(risk)
+    shared_state.set_sentiment_multiplier(sentiment)
     
     # Summary
     print_header("Summary")
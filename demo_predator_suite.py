@@ -71,12 +71,11 @@ async def demo_behavioral_adversary():
     return adversary, result
 
 
-async def demo_reconciliation_auditor(adversary):
+async def demo_reconciliation_auditor(adversary, ledger):
     """Demo: ReconciliationAuditor - The Auditor"""
     print_section("AGENT 2: RECONCILIATION AUDITOR")
     
     # Initialize
-    ledger = IntelligenceLedger(db_path="data/demo_ledger.db")
     auditor = ReconciliationAuditor(ledger=ledger)
     
     print("\n📝 Recording 3 predictions...")
@@ -103,31 +102,34 @@ async def demo_reconciliation_auditor(adversary):
         }
     ]
     
-    pred_ids = []
-    for i, pred in enumerate(predictions, 1):
-        result = adversary.analyze_psychology(pred['data'], sentiment=pred['sentiment'])
-        
-        pred_id = ledger.record_prediction(
-            predicted_bias=result['predicted_bias'],
-            predicted_outcome=result['predicted_outcome'],
-            confidence=result['confidence'],
-            market_regime=result['market_regime'],
-            archetype=result['detected_archetype'],
-            signal=result['signal'],
-            price_at_prediction=pred['data']['price']
-        )
-        pred_ids.append(pred_id)
-        
+    # Analyses are independent, so run them concurrently (API mode makes one LLM call each)
+    results = await asyncio.gather(*(
+        asyncio.to_thread(adversary.analyze_psychology, pred['data'], sentiment=pred['sentiment'])
+        for pred in predictions
+    ))
+    
+    pred_ids = ledger.record_predictions([
+        {
+            'predicted_bias': result['predicted_bias'],
+            'predicted_outcome': result['predicted_outcome'],
+            'confidence': result['confidence'],
+            'market_regime': result['market_regime'],
+            'archetype': result['detected_archetype'],
+            'signal': result['signal'],
+            'price_at_prediction': pred['data']['price']
+        }
+        for result, pred in zip(results, predictions)
+    ])
+    
+    for i, (result, pred) in enumerate(zip(results, predictions), 1):
         print(f"  {i}. {pred['label']}: Predicted {result['signal']} @ ${pred['data']['price']:,}")
     
     # Simulate audit after 1 hour
     print("\n🔍 Running 1-hour audit...")
     await asyncio.sleep(0.1)  # Simulate time passing
     
+    outcomes = []
     for i, (pred_id, pred) in enumerate(zip(pred_ids, predictions), 1):
-        # Update actual price
-        ledger.update_actual_price(pred_id, pred['actual_1h'], "1h")
-        
         # Calculate score
         prediction_data = {
             'id': pred_id,
@@ -139,11 +141,14 @@ async def demo_reconciliation_auditor(adversary):
         }
         
         score = auditor._calculate_success_score(prediction_data, pred['actual_1h'])
-        ledger.update_success_score(pred_id, "1h", score)
+        outcomes.append((pred_id, pred['actual_1h'], score))
         
         outcome = "✅ Correct" if score > 0 else "❌ Wrong"
         print(f"  {i}. Prediction #{pred_id}: {outcome} (Score: {score:+.2f})")
     
+    # Store actual prices and scores in one transaction
+    ledger.update_outcomes("1h", outcomes)
+    
     # Display statistics
     stats = ledger.get_statistics()
     print(f"\n📊 Overall Statistics:")
@@ -160,16 +165,10 @@ async def demo_reconciliation_auditor(adversary):
     return ledger, auditor, failed
 
 
-async def demo_evolutionary_mutator(failed_predictions):
+async def demo_evolutionary_mutator(failed_predictions, mutator):
     """Demo: EvolutionaryMutator - The DNA Patch"""
     print_section("AGENT 3: EVOLUTIONARY MUTATOR")
     
-    # Initialize
-    mutator = EvolutionaryMutator(
-        prompts_dir="data/demo_prompts",
-        evolution_interval_hours=24
-    )
-    
     print(f"\n🧬 Current Prompt Version: v{mutator.current_version}")
     
     # Display current prompt (first 200 chars)
@@ -229,14 +228,24 @@ async def main():
     
     start_time = time.time()
     
+    # Ledger and mutator setup (DB open, prompt files) doesn't depend on the
+    # adversary, so start it in worker threads while the first demo runs
+    ledger_task = asyncio.create_task(
+        asyncio.to_thread(IntelligenceLedger, db_path="data/demo_ledger.db")
+    )
+    mutator_task = asyncio.create_task(
+        asyncio.to_thread(
+            EvolutionaryMutator,
+            prompts_dir="data/demo_prompts",
+            evolution_interval_hours=24
+        )
+    )
+    
     # Demo each agent
     adversary, last_analysis = await demo_behavioral_adversary()
-    await asyncio.sleep(0.5)
-    
-    ledger, auditor, failed = await demo_reconciliation_auditor(adversary)
-    await asyncio.sleep(0.5)
+    ledger, auditor, failed = await demo_reconciliation_auditor(adversary, await ledger_task)
     
-    mutator = await demo_evolutionary_mutator(failed)
+    mutator = await demo_evolutionary_mutator(failed, await mutator_task)
     
     # Summary
     print_section("DEMO COMPLETE")
@@ -4,9 +4,12 @@ Updated: Fixed missing fetch_balance and added Mock OHLCV generation.
 """
 import ccxt
 import asyncio
+import os
+import pickle
 import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+from pathlib import Path
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -18,9 +21,15 @@ class DiscoveryAgent:
     US-COMPATIBLE: Uses binanceus as a fallback to avoid 451 errors on US servers.
     """
     
-    def __init__(self, api_key: str = None, api_secret: str = None, api_password: str = None, exchange_id: str = 'binanceus'):
+    # Seconds a live discovery result (in memory or on disk) is reused before markets are reloaded
+    CAPS_TTL = 3600
+    
+    def __init__(self, api_key: str = None, api_secret: str = None, api_password: str = None, exchange_id: str = 'binanceus',
+                 markets_cache_dir: Optional[str] = None):
         """
         Initialize Discovery Agent with Binance.us fallback for US servers.
+        If markets_cache_dir is set, loaded markets are persisted there so restarts
+        within CAPS_TTL skip the load_markets download.
         """
         try:
             # Dynamically load the exchange class from CCXT
@@ -47,18 +56,32 @@ class DiscoveryAgent:
             logger.error(f"Failed to initialize exchange: {str(e)}")
             self.exchange = ccxt.binanceus({'enableRateLimit': True})
 
+        self.markets_cache_dir = Path(markets_cache_dir) if markets_cache_dir else None
         self.capabilities: Dict[str, Any] = {}
+        self._caps_cached_at: Optional[float] = None
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._tickers_key: Optional[tuple] = None
+        self._tickers_cached_at: Optional[float] = None
 
     async def discover_capabilities(self) -> Dict[str, Any]:
         """
         Discover capabilities. Triggers MOCK MODE if blocked by regional 451 errors.
+        Live results are reused for CAPS_TTL seconds; mock results are not cached,
+        so the next call retries the live connection.
         """
+        if self._caps_cached_at is not None and time.monotonic() - self._caps_cached_at < self.CAPS_TTL:
+            return self.capabilities
+        
         logger.info(f"🔍 [Aether-Evo] Starting discovery on {self.exchange.id}...")
         
         try:
-            markets = await asyncio.to_thread(self.exchange.load_markets)
-            symbols = list(markets.keys())
-            logger.info(f"✅ Live Connection Successful: {len(symbols)} symbols found.")
+            markets = await asyncio.to_thread(self._load_cached_markets)
+            if markets is not None:
+                logger.info(f"✅ Loaded {len(markets)} symbols from markets cache.")
+            else:
+                markets = await asyncio.to_thread(self.exchange.load_markets)
+                logger.info(f"✅ Live Connection Successful: {len(markets)} symbols found.")
+                await asyncio.to_thread(self._save_cached_markets, markets)
             
         except Exception as e:
             logger.warning(f"⚠️ API Connection Blocked ({e}). ACTIVATING SHADOW MOCK MODE.")
@@ -67,19 +90,70 @@ class DiscoveryAgent:
                 'ETH/USDT': {'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'active': True},
                 'SOL/USDT': {'symbol': 'SOL/USDT', 'base': 'SOL', 'quote': 'USDT', 'active': True}
             }
-            symbols = list(markets.keys())
 
+        mode = 'MOCK' if len(markets) <= 3 else 'LIVE'
         self.capabilities = {
-            'symbols': symbols,
             'timeframes': getattr(self.exchange, 'timeframes', {'1m': '1m', '5m': '5m', '15m': '15m'}),
             'features': self.exchange.has,
             'markets': markets,
             'last_discovery': datetime.now().isoformat(),
-            'mode': 'MOCK' if len(symbols) <= 3 else 'LIVE'
+            'mode': mode
         }
+        self._caps_cached_at = time.monotonic() if mode == 'LIVE' else None
         
         return self.capabilities
 
+    def _markets_cache_path(self) -> Optional[Path]:
+        """Disk cache file for this exchange's markets (None when caching is off)"""
+        if self.markets_cache_dir is None:
+            return None
+        return self.markets_cache_dir / f"markets_{self.exchange.id}.pkl"
+
+    def _load_cached_markets(self) -> Optional[Dict[str, Any]]:
+        """
+        Markets from the disk cache if it is younger than CAPS_TTL, else None.
+        Also primes the exchange (markets, markets_by_id, currencies) so later
+        fetch_* calls don't trigger their own load_markets.
+        """
+        path = self._markets_cache_path()
+        if path is None:
+            return None
+        try:
+            if time.time() - path.stat().st_mtime >= self.CAPS_TTL:
+                return None
+            with open(path, 'rb') as f:
+                cached = pickle.load(f)
+            self.exchange.set_markets(cached['markets'], cached['currencies'])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable markets cache {path}: {e}")
+            return None
+        return self.exchange.markets
+
+    def _save_cached_markets(self, markets: Dict[str, Any]):
+        """Write freshly loaded markets to the disk cache (best effort)"""
+        path = self._markets_cache_path()
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(
+                    {'markets': dict(markets), 'currencies': self.exchange.currencies},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write markets cache {path}: {e}")
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols from the last discovery (derived from 'markets' on demand)"""
+        return list(self.capabilities.get('markets', {}).keys())
+
     async def fetch_ohlcv(self, symbol: str, timeframe: str = '15m', limit: int = 100) -> List[List]:
         """
         Fetch OHLCV. If blocked by 451 error, generates MOCK data so the brain can keep working.
@@ -102,6 +176,76 @@ class DiscoveryAgent:
                 ])
             return sorted(mock_candles, key=lambda x: x[0])
 
+    async def fetch_ohlcv_many(
+        self,
+        symbols: List[str],
+        timeframe: str = '15m',
+        limit: int = 100,
+        max_concurrency: int = 10
+    ) -> Dict[str, List[List]]:
+        """
+        Fetch OHLCV for several symbols concurrently.
+        Wall-clock is roughly the slowest request instead of the sum of all of them;
+        at most `max_concurrency` requests are in flight to respect exchange rate limits.
+        Each symbol falls back to mock candles exactly like fetch_ohlcv.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch_one(symbol: str) -> List[List]:
+            async with semaphore:
+                return await self.fetch_ohlcv(symbol, timeframe, limit)
+
+        unique_symbols = list(dict.fromkeys(symbols))
+        results = await asyncio.gather(*(fetch_one(symbol) for symbol in unique_symbols))
+        return dict(zip(unique_symbols, results))
+
+    async def fetch_all_tickers(
+        self,
+        symbols: Optional[List[str]] = None,
+        max_concurrency: int = 10
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch tickers for many symbols (all markets if None) keyed by symbol.
+        Uses one fetch_tickers request when the exchange supports it, otherwise
+        per-symbol fetch_ticker calls run concurrently (symbols that fail are left out).
+        A result is reused for the exchange's rateLimit interval, so callers in the
+        same cycle don't each spend a request.
+        """
+        key = tuple(symbols) if symbols is not None else None
+        ttl = getattr(self.exchange, 'rateLimit', 0) / 1000
+        if (
+            self._tickers_cached_at is not None
+            and key == self._tickers_key
+            and time.monotonic() - self._tickers_cached_at < ttl
+        ):
+            return self._tickers
+        
+        if self.exchange.has.get('fetchTickers'):
+            try:
+                tickers = await asyncio.to_thread(self.exchange.fetch_tickers, symbols)
+            except Exception as e:
+                logger.warning(f"Ticker fetch failed: {e}")
+                return {}
+        else:
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+            
+            async def fetch_one(symbol: str) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    try:
+                        return await asyncio.to_thread(self.exchange.fetch_ticker, symbol)
+                    except Exception as e:
+                        logger.debug(f"Ticker fetch failed for {symbol}: {e}")
+                        return None
+            
+            wanted = list(dict.fromkeys(symbols if symbols is not None else self.symbols))
+            results = await asyncio.gather(*(fetch_one(symbol) for symbol in wanted))
+            tickers = {symbol: ticker for symbol, ticker in zip(wanted, results) if ticker is not None}
+        
+        self._tickers = tickers
+        self._tickers_key = key
+        self._tickers_cached_at = time.monotonic()
+        return tickers
+
     async def fetch_balance(self) -> Dict[str, Any]:
         """
         Fetch balance. Returns 10,000 USDT Mock balance if blocked.
@@ -117,6 +261,17 @@ class DiscoveryAgent:
                 'datetime': datetime.now().isoformat()
             }
 
+    def close(self):
+        """
+        Release the exchange's pooled HTTP connections.
+        ccxt's sync client sends every call through one keep-alive requests.Session,
+        so TCP/TLS connections are reused across calls until this is called.
+        """
+        try:
+            self.exchange.close()
+        except Exception as e:
+            logger.debug(f"Exchange close failed: {e}")
+
     def get_market_info(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get cached market information"""
         return self.capabilities.get('markets', {}).get(symbol)
@@ -3,6 +3,7 @@ Guardrails - Safety mechanisms for the self-evolving system
 """
 import asyncio
 import logging
+from collections import deque
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import ast
@@ -29,7 +30,8 @@ class Guardrails:
         self.stability_lock_hours = stability_lock_hours
         
         self.last_evolution_time: Optional[datetime] = None
-        self.equity_history: list = []
+        # Chronological {'timestamp', 'equity'} entries covering the last hour
+        self.equity_history: deque = deque()
         self.kill_switch_triggered = False
         
     def update_equity(self, new_equity: float):
@@ -45,22 +47,21 @@ class Guardrails:
     
     def _check_kill_switch(self):
         """Check if 1-hour equity drop exceeds threshold"""
-        if self.kill_switch_triggered:
-            return
-        
         now = datetime.now()
         one_hour_ago = now - timedelta(hours=1)
         
-        # Get equity from 1 hour ago
-        recent_history = [
-            h for h in self.equity_history 
-            if h['timestamp'] >= one_hour_ago
-        ]
+        # Drop entries that fell out of the window so the oldest one left is
+        # the equity from 1 hour ago (and history stays bounded)
+        while self.equity_history and self.equity_history[0]['timestamp'] < one_hour_ago:
+            self.equity_history.popleft()
+        
+        if self.kill_switch_triggered:
+            return
         
-        if not recent_history:
+        if not self.equity_history:
             return
         
-        equity_1h_ago = recent_history[0]['equity']
+        equity_1h_ago = self.equity_history[0]['equity']
         equity_change = (self.current_equity - equity_1h_ago) / equity_1h_ago
         
         if equity_change <= -self.kill_switch_threshold:
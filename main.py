@@ -6,7 +6,7 @@ import asyncio
 import logging
 import sys
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from config import AetherConfig
 from discovery_agent import DiscoveryAgent
@@ -66,7 +66,8 @@ class AetherEvo:
             api_key=config.weex.api_key,
             api_secret=config.weex.api_secret,
             api_password=config.weex.api_password,
-            exchange_id=config.weex.exchange_id
+            exchange_id=config.weex.exchange_id,
+            markets_cache_dir="data/markets_cache"
         )
         
         # Guardrails
@@ -159,6 +160,10 @@ class AetherEvo:
         self.running = False
         self.symbol = config.trading.symbol
         
+        # Indicators for the last candle set; the trading loop polls more
+        # often than 15m candles change
+        self._indicator_cache: Optional[Tuple[Tuple, Dict[str, Any]]] = None
+    
     async def initialize(self):
         """Initialize the system"""
         logger.info("🚀 Aether-Evo initialization started...")
@@ -169,13 +174,13 @@ class AetherEvo:
             capabilities = await self.discovery.discover_capabilities()
             
             logger.info(f"✅ Discovery complete:")
-            logger.info(f"   - Available symbols: {len(capabilities['symbols'])}")
+            logger.info(f"   - Available symbols: {len(capabilities['markets'])}")
             logger.info(f"   - Supported timeframes: {list(capabilities['timeframes'].keys())}")
             
             # Verify trading symbol is available
-            if self.symbol not in capabilities['symbols']:
+            if self.symbol not in capabilities['markets']:
                 logger.warning(f"⚠️  Symbol {self.symbol} not found in available symbols")
-                logger.info(f"Available symbols: {capabilities['symbols'][:10]}...")
+                logger.info(f"Available symbols: {self.discovery.symbols[:10]}...")
                 return False
             
             logger.info(f"✅ Trading symbol {self.symbol} verified")
@@ -268,8 +273,8 @@ class AetherEvo:
                 # Fetch current OHLCV
                 ohlcv = await self.discovery.fetch_ohlcv(self.symbol, '15m', 100)
                 
-                # Calculate indicators using active logic
-                indicators = active_logic.calculate_indicators(ohlcv)
+                # Calculate indicators using active logic (cached per candle set)
+                indicators = self._calculate_indicators(ohlcv)
                 
                 # Generate signal using active logic
                 signal = active_logic.generate_signal(indicators, analysis)
@@ -288,11 +293,11 @@ class AetherEvo:
                             market_price=current_price
                         )
                         
-                        if shadow_result.get('promotion_alert'):
+                        if shadow_result.promotion_alert:
                             logger.warning(
                                 f"🚀 PROMOTION ALERT: Shadow strategy outperforming!\n"
-                                f"   Shadow Sharpe: {shadow_result['shadow_sharpe']:.2f}\n"
-                                f"   Live Sharpe: {shadow_result['live_sharpe']:.2f}"
+                                f"   Shadow Sharpe: {shadow_result.shadow_sharpe:.2f}\n"
+                                f"   Live Sharpe: {shadow_result.live_sharpe:.2f}"
                             )
                     except Exception as e:
                         logger.error(f"Shadow engine error (non-critical): {e}")
@@ -356,6 +361,8 @@ class AetherEvo:
         self.running = False
         self.reasoning.stop()
         self.explorer.stop()  # Phase 3: Stop explorer
+        self.discovery.close()  # Release pooled exchange connections
+        self.reasoning_logger.close()  # Write any buffered reasoning traces
         logger.info("✅ Shutdown complete")
     
     async def get_current_regime(self):
@@ -549,6 +556,31 @@ class AetherEvo:
                 logger.error(f"Error in predator suite loop: {e}")
                 await asyncio.sleep(60)
     
+    def _calculate_indicators(self, ohlcv: List[List]) -> Dict[str, Any]:
+        """
+        active_logic.calculate_indicators, reused while the candles and the
+        active logic are unchanged
+        
+        Args:
+            ohlcv: List of [timestamp, open, high, low, close, volume]
+        
+        Returns:
+            Dictionary of calculated indicators
+        """
+        # Candles before the latest one are closed, so the count plus the
+        # first and (still open) last candle identify the set; the function
+        # object changes when the Architect reloads active_logic
+        calculate = active_logic.calculate_indicators
+        key = (calculate, len(ohlcv), tuple(ohlcv[0]), tuple(ohlcv[-1])) if ohlcv else None
+        
+        if key is not None and self._indicator_cache is not None and self._indicator_cache[0] == key:
+            return dict(self._indicator_cache[1])
+        
+        indicators = calculate(ohlcv)
+        if key is not None:
+            self._indicator_cache = (key, indicators)
+        return dict(indicators)
+    
     def _calculate_simple_rsi(self, prices: list, period: int = 14) -> float:
         """Calculate simple RSI for behavioral analysis"""
         if len(prices) < period + 1:
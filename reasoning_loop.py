@@ -6,7 +6,7 @@ import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
-from data.regime import ohlcv_list_to_dataframe, get_regime_metrics
+from data.regime import ohlcv_list_to_array, RegimeMetricsCache
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,6 +26,7 @@ class ReasoningLoop:
         self.running = False
         self.latest_analysis: Optional[Dict[str, Any]] = None
         self.evolution_memory = evolution_memory
+        self.regime_cache = RegimeMetricsCache()
         
     def _format_markdown_snapshot(self, ohlcv_data: List[List], regime_metrics: Dict[str, Any]) -> str:
         """
@@ -52,6 +53,10 @@ class ReasoningLoop:
         prev_close = ohlcv_data[-2][4] if len(ohlcv_data) > 1 else close
         change = ((close - prev_close) / prev_close * 100) if prev_close > 0 else 0
         
+        # Indicators used for both the value and its interpretation
+        rsi = regime_metrics.get('rsi', 50)
+        adx = regime_metrics.get('adx', 0)
+        
         # Build markdown table
         markdown = f"""
 ## Market Snapshot - {dt.strftime('%Y-%m-%d %H:%M:%S')}
@@ -68,9 +73,9 @@ class ReasoningLoop:
 ### Technical Indicators
 | Indicator | Value | Interpretation |
 |-----------|-------|----------------|
-| **RSI** | {regime_metrics.get('rsi', 50):.2f} | {'Overbought' if regime_metrics.get('rsi', 50) > 70 else 'Oversold' if regime_metrics.get('rsi', 50) < 30 else 'Neutral'} |
+| **RSI** | {rsi:.2f} | {'Overbought' if rsi > 70 else 'Oversold' if rsi < 30 else 'Neutral'} |
 | **ATR** | {regime_metrics.get('atr', 0):.4f} | Volatility measure |
-| **ADX** | {regime_metrics.get('adx', 0):.2f} | {'Strong trend' if regime_metrics.get('adx', 0) > 25 else 'Weak/No trend'} |
+| **ADX** | {adx:.2f} | {'Strong trend' if adx > 25 else 'Weak/No trend'} |
 | **+DI** | {regime_metrics.get('plus_di', 0):.2f} | Positive directional |
 | **-DI** | {regime_metrics.get('minus_di', 0):.2f} | Negative directional |
 
@@ -106,9 +111,9 @@ class ReasoningLoop:
                 'regime': 'UNKNOWN'
             }
         
-        # Convert to DataFrame and detect regime
-        ohlcv_df = ohlcv_list_to_dataframe(ohlcv_data)
-        regime_metrics = get_regime_metrics(ohlcv_df)
+        # Convert to an array and detect regime (no DataFrame needed; cached per candle set)
+        ohlcv = ohlcv_list_to_array(ohlcv_data)
+        regime_metrics = self.regime_cache.get_metrics(symbol, ohlcv)
         regime = regime_metrics['regime']
         
         # Format markdown snapshot
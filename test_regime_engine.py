@@ -25,16 +25,20 @@ def test_regime_detection():
     
     # Generate synthetic OHLCV data
     # Test 1: Trending Up
-    timestamps = list(range(1000000000, 1000000000 + 100 * 60000, 60000))
-    trending_up = []
+    bars = 100
+    timestamps = list(range(1000000000, 1000000000 + bars * 60000, 60000))
+    rng = np.random.default_rng(0)
     base_price = 100
-    for i, ts in enumerate(timestamps):
-        price = base_price + i * 0.5 + np.random.uniform(-0.1, 0.1)
-        high = price + np.random.uniform(0, 0.5)
-        low = price - np.random.uniform(0, 0.3)
-        open_price = price + np.random.uniform(-0.2, 0.2)
-        volume = 1000 + np.random.uniform(0, 500)
-        trending_up.append([ts, open_price, high, low, price, volume])
+    i = np.arange(bars)
+    price = base_price + i * 0.5 + rng.uniform(-0.1, 0.1, size=bars)
+    high = price + rng.uniform(0, 0.5, size=bars)
+    low = price - rng.uniform(0, 0.3, size=bars)
+    open_price = price + rng.uniform(-0.2, 0.2, size=bars)
+    volume = 1000 + rng.uniform(0, 500, size=bars)
+    trending_up = [
+        [ts, *row]
+        for ts, row in zip(timestamps, np.column_stack([open_price, high, low, price, volume]).tolist())
+    ]
     
     df_trending_up = ohlcv_list_to_dataframe(trending_up)
     regime_up = detect_regime(df_trending_up)
@@ -49,14 +53,15 @@ def test_regime_detection():
     print(f"  RSI: {metrics_up['rsi']:.2f}")
     
     # Test 2: Ranging Market (volatile)
-    ranging = []
-    for i, ts in enumerate(timestamps):
-        price = base_price + np.sin(i * 0.1) * 5 + np.random.uniform(-2, 2)
-        high = price + np.random.uniform(1, 3)
-        low = price - np.random.uniform(1, 3)
-        open_price = price + np.random.uniform(-1, 1)
-        volume = 1000 + np.random.uniform(0, 1000)
-        ranging.append([ts, open_price, high, low, price, volume])
+    price = base_price + np.sin(i * 0.1) * 5 + rng.uniform(-2, 2, size=bars)
+    high = price + rng.uniform(1, 3, size=bars)
+    low = price - rng.uniform(1, 3, size=bars)
+    open_price = price + rng.uniform(-1, 1, size=bars)
+    volume = 1000 + rng.uniform(0, 1000, size=bars)
+    ranging = [
+        [ts, *row]
+        for ts, row in zip(timestamps, np.column_stack([open_price, high, low, price, volume]).tolist())
+    ]
     
     df_ranging = ohlcv_list_to_dataframe(ranging)
     regime_range = detect_regime(df_ranging)
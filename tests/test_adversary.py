@@ -206,6 +206,40 @@ class TestAdversarialEdgeCases:
         assert adversary.max_drawdown_threshold == 0.20
 
 
+class TestBiasDetectorIndicators:
+    """Test the detector's price indicators on lists and ndarrays"""
+    
+    def test_ndarray_prices_match_list_prices(self):
+        """Test RSI/volatility/analysis agree for list and float64 ndarray input"""
+        import numpy as np
+        from core.adversary import PsychologicalBiasDetector
+        
+        prices = [90000, 88000, 86000, 84000, 82000] * 4
+        array = np.tile(np.array([90000, 88000, 86000, 84000, 82000], dtype=np.float64), 4)
+        
+        assert PsychologicalBiasDetector.calculate_rsi(array) == PsychologicalBiasDetector.calculate_rsi(prices)
+        assert PsychologicalBiasDetector.calculate_volatility(array) == \
+            PsychologicalBiasDetector.calculate_volatility(prices)
+        
+        adversary = AdversarialAlpha(use_heuristic_mode=True)
+        market_data = {'price': 82000.0, 'price_change_pct': -8.0, 'sentiment': 'extreme fear'}
+        from_list = adversary.analyze_market({**market_data, 'recent_prices': prices})
+        from_array = adversary.analyze_market({**market_data, 'recent_prices': array})
+        
+        assert from_array['signal'] == from_list['signal']
+        assert from_array['rsi'] == from_list['rsi']
+    
+    def test_rsi_uses_last_period_deltas(self):
+        """Test RSI only depends on the last period+1 prices"""
+        from core.adversary import PsychologicalBiasDetector
+        
+        rising = [float(p) for p in range(100, 115)]
+        
+        assert PsychologicalBiasDetector.calculate_rsi(rising) == 100.0
+        assert PsychologicalBiasDetector.calculate_rsi([500.0, 1.0] + rising) == 100.0
+        assert PsychologicalBiasDetector.calculate_rsi(rising[:-1]) == 50.0
+
+
 def test_failing_strategy_scenario():
     """
     Integration test: Verify that a strategy with infinite drawdown risk is rejected
@@ -0,0 +1,233 @@
+"""
+Unit Tests for Discovery Agent
+Tests capability caching (in memory and on disk) and concurrent multi-symbol OHLCV/ticker fetching
+"""
+import sys
+import time
+import threading
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from discovery_agent import DiscoveryAgent
+
+
+class TestDiscoverCapabilities:
+    """Test DiscoveryAgent.discover_capabilities caching"""
+    
+    @pytest.mark.asyncio
+    async def test_live_result_reused_within_ttl(self):
+        """Test live markets load once per TTL and symbols derive from markets"""
+        agent = DiscoveryAgent()
+        calls = []
+        markets = {f'COIN{i}/USDT': {'symbol': f'COIN{i}/USDT'} for i in range(5)}
+        
+        def fake_load_markets():
+            calls.append(1)
+            return markets
+        
+        agent.exchange.load_markets = fake_load_markets
+        
+        first = await agent.discover_capabilities()
+        second = await agent.discover_capabilities()
+        
+        assert second is first
+        assert len(calls) == 1
+        assert first['mode'] == 'LIVE'
+        assert 'symbols' not in first
+        assert agent.symbols == list(markets)
+        
+        agent._caps_cached_at -= agent.CAPS_TTL
+        await agent.discover_capabilities()
+        assert len(calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_mock_result_not_cached(self):
+        """Test a blocked discovery is retried on the next call"""
+        agent = DiscoveryAgent()
+        calls = []
+        
+        def blocked_load_markets():
+            calls.append(1)
+            raise RuntimeError("451 Unavailable For Legal Reasons")
+        
+        agent.exchange.load_markets = blocked_load_markets
+        
+        capabilities = await agent.discover_capabilities()
+        await agent.discover_capabilities()
+        
+        assert capabilities['mode'] == 'MOCK'
+        assert agent.symbols == ['BTC/USDT', 'ETH/USDT', 'SOL/USDT']
+        assert len(calls) == 2
+
+
+class TestMarketsDiskCache:
+    """Test DiscoveryAgent markets_cache_dir persistence"""
+    
+    MARKETS = {
+        f'COIN{i}/USDT': {
+            'id': f'COIN{i}USDT', 'symbol': f'COIN{i}/USDT', 'base': f'COIN{i}',
+            'quote': 'USDT', 'spot': True, 'active': True
+        }
+        for i in range(5)
+    }
+    
+    @pytest.mark.asyncio
+    async def test_restart_loads_markets_from_disk(self, tmp_path):
+        """Test a second agent reuses saved markets and primes the exchange"""
+        first = DiscoveryAgent(markets_cache_dir=str(tmp_path))
+        first.exchange.load_markets = lambda: self.MARKETS
+        await first.discover_capabilities()
+        
+        def unexpected_load_markets():
+            raise AssertionError("load_markets should not be called")
+        
+        second = DiscoveryAgent(markets_cache_dir=str(tmp_path))
+        second.exchange.load_markets = unexpected_load_markets
+        capabilities = await second.discover_capabilities()
+        
+        assert capabilities['mode'] == 'LIVE'
+        assert second.symbols == list(self.MARKETS)
+        assert second.exchange.markets_by_id['COIN3USDT'][0]['symbol'] == 'COIN3/USDT'
+    
+    @pytest.mark.asyncio
+    async def test_expired_cache_reloads(self, tmp_path):
+        """Test a cache file older than CAPS_TTL is ignored"""
+        import os
+        
+        first = DiscoveryAgent(markets_cache_dir=str(tmp_path))
+        first.exchange.load_markets = lambda: self.MARKETS
+        await first.discover_capabilities()
+        
+        cache_path = first._markets_cache_path()
+        stale = time.time() - DiscoveryAgent.CAPS_TTL - 1
+        os.utime(cache_path, (stale, stale))
+        
+        calls = []
+        
+        def fake_load_markets():
+            calls.append(1)
+            return self.MARKETS
+        
+        second = DiscoveryAgent(markets_cache_dir=str(tmp_path))
+        second.exchange.load_markets = fake_load_markets
+        await second.discover_capabilities()
+        
+        assert len(calls) == 1
+
+
+class TestFetchOhlcvMany:
+    """Test DiscoveryAgent.fetch_ohlcv_many"""
+    
+    @pytest.mark.asyncio
+    async def test_fetches_each_symbol_concurrently(self):
+        """Test requests overlap, stay under the cap and map back to their symbol"""
+        agent = DiscoveryAgent()
+        lock = threading.Lock()
+        in_flight = {'now': 0, 'peak': 0}
+        
+        def fake_fetch_ohlcv(symbol, timeframe, limit=100):
+            with lock:
+                in_flight['now'] += 1
+                in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+            time.sleep(0.05)
+            with lock:
+                in_flight['now'] -= 1
+            return [[0, 1.0, 1.0, 1.0, float(len(symbol)), 1.0]] * limit
+        
+        agent.exchange.fetch_ohlcv = fake_fetch_ohlcv
+        symbols = ['BTC/USDT', 'ETH/USDT', 'SOL/USDT', 'DOGE/USDT', 'AVAX/USDT']
+        
+        result = await agent.fetch_ohlcv_many(symbols + ['BTC/USDT'], '15m', 3, max_concurrency=3)
+        
+        assert list(result) == symbols
+        assert all(len(candles) == 3 for candles in result.values())
+        assert result['DOGE/USDT'][0][4] == float(len('DOGE/USDT'))
+        assert 1 < in_flight['peak'] <= 3
+    
+    @pytest.mark.asyncio
+    async def test_failed_symbol_falls_back_to_mock(self):
+        """Test one failing symbol gets mock candles without failing the batch"""
+        agent = DiscoveryAgent()
+        
+        def fake_fetch_ohlcv(symbol, timeframe, limit=100):
+            if symbol == 'ETH/USDT':
+                raise RuntimeError("451 Unavailable For Legal Reasons")
+            return [[0, 2.0, 2.0, 2.0, 2.0, 2.0]] * limit
+        
+        agent.exchange.fetch_ohlcv = fake_fetch_ohlcv
+        
+        result = await agent.fetch_ohlcv_many(['BTC/USDT', 'ETH/USDT'], '15m', 5)
+        
+        assert result['BTC/USDT'][0][4] == 2.0
+        assert len(result['ETH/USDT']) == 5
+        assert result['ETH/USDT'][0][4] == 90000.0
+
+
+
+class TestFetchAllTickers:
+    """Test DiscoveryAgent.fetch_all_tickers"""
+    
+    @pytest.mark.asyncio
+    async def test_bulk_request_reused_within_rate_limit(self):
+        """Test one fetch_tickers call serves repeat requests until rateLimit elapses"""
+        agent = DiscoveryAgent()
+        calls = []
+        
+        def fake_fetch_tickers(symbols=None):
+            calls.append(symbols)
+            return {'BTC/USDT': {'last': 90000.0}, 'ETH/USDT': {'last': 3000.0}}
+        
+        agent.exchange.has['fetchTickers'] = True
+        agent.exchange.fetch_tickers = fake_fetch_tickers
+        agent.exchange.rateLimit = 60000
+        
+        first = await agent.fetch_all_tickers()
+        second = await agent.fetch_all_tickers()
+        
+        assert second is first
+        assert calls == [None]
+        assert first['ETH/USDT']['last'] == 3000.0
+        
+        await agent.fetch_all_tickers(['BTC/USDT'])
+        assert calls == [None, ['BTC/USDT']]
+    
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_symbol_requests(self):
+        """Test exchanges without fetchTickers get concurrent fetch_ticker calls"""
+        agent = DiscoveryAgent()
+        
+        def fake_fetch_ticker(symbol):
+            if symbol == 'ETH/USDT':
+                raise RuntimeError("451 Unavailable For Legal Reasons")
+            return {'symbol': symbol, 'last': 1.0}
+        
+        agent.exchange.has['fetchTickers'] = False
+        agent.exchange.fetch_ticker = fake_fetch_ticker
+        
+        tickers = await agent.fetch_all_tickers(['BTC/USDT', 'ETH/USDT', 'SOL/USDT'])
+        
+        assert list(tickers) == ['BTC/USDT', 'SOL/USDT']
+        assert tickers['SOL/USDT']['symbol'] == 'SOL/USDT'
+
+
+class TestConnectionReuse:
+    """Test DiscoveryAgent HTTP session handling"""
+    
+    def test_close_releases_pooled_session(self):
+        """Test close() closes the exchange's keep-alive session and tolerates repeats"""
+        from unittest.mock import patch
+        
+        agent = DiscoveryAgent()
+        
+        with patch.object(agent.exchange.session, 'close') as close_session:
+            agent.close()
+            agent.close()
+        
+        assert close_session.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,212 @@
+"""
+Unit Tests for Evolution Memory
+Tests history persistence
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import os
+import pytest
+from data import memory as memory_module
+from data.memory import EvolutionMemory
+
+
+class TestPersistence:
+    """Test saving and loading evolution history"""
+    
+    def test_history_round_trip(self, tmp_path):
+        """Test a recorded evolution is saved as indented JSON and reloaded"""
+        history_file = tmp_path / "evolution_history.json"
+        memory = EvolutionMemory(history_file=str(history_file))
+        
+        memory.record_evolution({'rsi_period': 14}, "Drawdown", "Tighten stops", 1000.0)
+        memory._save_history()
+        
+        assert history_file.read_text().startswith('{\n  "evolutions"')
+        reloaded = EvolutionMemory(history_file=str(history_file))
+        assert reloaded.data == memory.data
+        assert reloaded.data['evolutions'][0]['parameters'] == {'rsi_period': 14}
+    
+    def test_json_fallback_matches(self, tmp_path, monkeypatch):
+        """Test the json fallback writes the same history"""
+        memory = EvolutionMemory(history_file=str(tmp_path / "a.json"))
+        memory.record_evolution({'threshold': 0.5, 'name': 'é'}, "Test", "None", 1000.0)
+        memory._save_history()
+        
+        monkeypatch.setattr(memory_module, 'ORJSON_AVAILABLE', False)
+        fallback = json.loads(memory_module._dumps_history(memory.data))
+        
+        assert fallback == json.loads(memory.history_file.read_bytes())
+
+
+class TestMsgpackCopy:
+    """Test the binary copy of the history snapshot"""
+    
+    @pytest.mark.skipif(not memory_module.MSGPACK_AVAILABLE, reason="msgpack not installed")
+    def test_loads_from_msgpack_copy(self, tmp_path, monkeypatch):
+        """Test a saved history is reloaded from msgpack without parsing JSON"""
+        history_file = str(tmp_path / "history.json")
+        memory = EvolutionMemory(history_file=history_file)
+        memory.record_evolution({'rsi_period': 14}, "Drawdown", "Tighten stops", 1000.0)
+        memory._save_history()
+        
+        monkeypatch.setattr(memory_module.json, 'load', lambda f: pytest.fail("JSON parsed"))
+        reloaded = EvolutionMemory(history_file=history_file)
+        
+        assert memory.msgpack_file.exists()
+        assert reloaded.data == memory.data
+    
+    @pytest.mark.skipif(not memory_module.MSGPACK_AVAILABLE, reason="msgpack not installed")
+    def test_stale_copy_ignored(self, tmp_path):
+        """Test a JSON file newer than the copy takes precedence"""
+        history_file = tmp_path / "history.json"
+        memory = EvolutionMemory(history_file=str(history_file))
+        memory._save_history()
+        
+        edited = dict(memory.data, evolutions=[{'parameters': {'edited': True}}])
+        history_file.write_text(json.dumps(edited))
+        os.utime(memory.msgpack_file, ns=(0, 0))
+        
+        assert EvolutionMemory(history_file=str(history_file)).data['evolutions'] == edited['evolutions']
+    
+    def test_unpackable_data_skips_copy(self, tmp_path, monkeypatch):
+        """Test data msgpack can't encode still saves and loads from JSON"""
+        import numpy as np
+        
+        memory = EvolutionMemory(history_file=str(tmp_path / "history.json"))
+        memory.record_evolution({'rsi_period': np.int64(14)}, "Test", "None", 1000.0)
+        memory._save_history()
+        
+        assert not memory.msgpack_file.exists()
+        assert EvolutionMemory(history_file=str(memory.history_file)).data['evolutions'][0]['parameters'] == {'rsi_period': 14}
+
+
+class TestJournal:
+    """Test append-only persistence of history changes"""
+    
+    def test_append_does_not_rewrite_snapshot(self, tmp_path):
+        """Test recording an evolution only appends to the journal"""
+        memory = EvolutionMemory(history_file=str(tmp_path / "history.json"))
+        memory.record_evolution({'rsi_period': 14}, "Drawdown", "Tighten stops", 1000.0)
+        memory.update_performance_window(0, 1010.0, 10.0)
+        
+        assert not memory.history_file.exists()
+        lines = memory.journal_file.read_bytes().splitlines()
+        assert [json.loads(line)['op'] for line in lines] == ['evolution', 'update']
+    
+    def test_reload_replays_journal(self, tmp_path):
+        """Test a reload sees journaled evolutions, updates and blacklists"""
+        history_file = str(tmp_path / "history.json")
+        memory = EvolutionMemory(history_file=history_file)
+        memory.record_evolution({'rsi_period': 14}, "Drawdown", "Tighten stops", 1000.0)
+        memory._save_history()
+        memory.record_evolution({'rsi_period': 21}, "Chop", "Widen bands", 1000.0)
+        memory._blacklist_parameters({'rsi_period': 21}, -10.0, 1)
+        memory.update_performance_window(1, 990.0, -10.0)
+        
+        reloaded = EvolutionMemory(history_file=history_file)
+        
+        assert reloaded.data == memory.data
+        assert reloaded.is_blacklisted({'rsi_period': 21})[0]
+    
+    def test_compaction_truncates_journal(self, tmp_path):
+        """Test the snapshot is rewritten after compact_every events"""
+        history_file = str(tmp_path / "history.json")
+        memory = EvolutionMemory(history_file=history_file, compact_every=3)
+        for period in (10, 12, 14):
+            memory.record_evolution({'rsi_period': period}, "Test", "None", 1000.0)
+        
+        assert not memory.journal_file.exists()
+        assert len(json.loads(memory.history_file.read_bytes())['evolutions']) == 3
+        assert EvolutionMemory(history_file=history_file).data == memory.data
+    
+    def test_snapshot_events_not_replayed_twice(self, tmp_path):
+        """Test a journal left behind by an interrupted compaction is skipped"""
+        history_file = str(tmp_path / "history.json")
+        memory = EvolutionMemory(history_file=history_file)
+        memory.record_evolution({'rsi_period': 14}, "Test", "None", 1000.0)
+        stale_journal = memory.journal_file.read_bytes()
+        memory._save_history()
+        memory.journal_file.write_bytes(stale_journal + b'{"op": "evolution", "rec')
+        
+        reloaded = EvolutionMemory(history_file=history_file)
+        
+        assert reloaded.get_evolution_count() == 1
+    
+    def test_torn_append_does_not_swallow_next_event(self, tmp_path):
+        """Test a journal cut mid-line is trimmed so later appends survive a reload"""
+        history_file = str(tmp_path / "history.json")
+        memory = EvolutionMemory(history_file=history_file)
+        memory.record_evolution({'rsi_period': 14}, "Drawdown", "Tighten stops", 1000.0)
+        memory.record_evolution({'rsi_period': 21}, "Chop", "Widen bands", 1000.0)
+        
+        # Crash while writing the second event: keep only part of its line
+        journal = memory.journal_file.read_bytes()
+        first_end = journal.index(b'\n') + 1
+        memory.journal_file.write_bytes(journal[:first_end + 20])
+        
+        restarted = EvolutionMemory(history_file=history_file)
+        restarted.record_evolution({'rsi_period': 28}, "Trend", "Hold longer", 1000.0)
+        restarted.update_performance_window(1, 1010.0, 10.0)
+        
+        reloaded = EvolutionMemory(history_file=history_file)
+        
+        assert restarted.get_evolution_count() == 2
+        assert reloaded.data == restarted.data
+    
+    def test_bad_event_does_not_abort_replay(self, tmp_path):
+        """Test an event that can't be applied is skipped and later events still replay"""
+        history_file = str(tmp_path / "history.json")
+        memory = EvolutionMemory(history_file=history_file)
+        memory.record_evolution({'rsi_period': 14}, "Drawdown", "Tighten stops", 1000.0)
+        memory._append_event({"op": "update", "index": 5, "fields": {"pnl": 1.0}})
+        memory.record_evolution({'rsi_period': 21}, "Chop", "Widen bands", 1000.0)
+        
+        reloaded = EvolutionMemory(history_file=history_file)
+        
+        assert reloaded.get_evolution_count() == 2
+
+
+class TestBlacklist:
+    """Test parameter blacklisting"""
+    
+    def test_lookup_matches_dict_equality(self, tmp_path):
+        """Test lookups find == equal parameters regardless of key order or int/float"""
+        memory = EvolutionMemory(history_file=str(tmp_path / "history.json"))
+        memory._blacklist_parameters({'rsi_period': 14, 'bands': [1, 2.5], 'mode': 'fast'}, -5.0, 0)
+        
+        assert memory.is_blacklisted({'mode': 'fast', 'bands': [1.0, 2.5], 'rsi_period': 14.0})[0]
+        assert not memory.is_blacklisted({'rsi_period': 15, 'bands': [1, 2.5], 'mode': 'fast'})[0]
+        assert not memory.is_blacklisted({'rsi_period': 14, 'bands': (1, 2.5), 'mode': 'fast'})[0]
+    
+    def test_index_rebuilt_on_load_and_clear(self, tmp_path):
+        """Test the lookup index follows reloads and blacklist expiry"""
+        history_file = str(tmp_path / "history.json")
+        memory = EvolutionMemory(history_file=history_file)
+        memory._blacklist_parameters({'rsi_period': 14}, -5.0, 0)
+        
+        reloaded = EvolutionMemory(history_file=history_file)
+        is_blacklisted, reason = reloaded.is_blacklisted({'rsi_period': 14})
+        assert is_blacklisted
+        assert "Negative PnL" in reason
+        
+        reloaded.data['blacklisted_parameters'][0]['timestamp'] = '2000-01-01T00:00:00'
+        reloaded.clear_old_blacklist(days=30)
+        assert not reloaded.is_blacklisted({'rsi_period': 14})[0]
+    
+    def test_unhashable_parameters_fall_back_to_scan(self, tmp_path):
+        """Test parameters that cannot be keyed are still compared"""
+        memory = EvolutionMemory(history_file=str(tmp_path / "history.json"))
+        memory.data['blacklisted_parameters'].append({'parameters': {'tags': {'a': bytearray(b'x')}}, 'reason': 'r'})
+        memory._rebuild_blacklist_index()
+        
+        assert memory.is_blacklisted({'tags': {'a': bytearray(b'x')}}) == (True, 'r')
+
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, "-v", "-s"])
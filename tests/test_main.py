@@ -0,0 +1,81 @@
+"""
+Unit Tests for the AetherEvo orchestrator
+Tests the per-candle-set indicator cache used by the trading loop
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import active_logic
+from main import AetherEvo
+
+
+def make_ohlcv(n=30, last_close=100.0):
+    """Create n candles whose last (still open) candle closes at last_close"""
+    ohlcv = [[1000000000 + i * 900000, 100.0, 101.0, 99.0, 100.0 + i * 0.1, 10.0] for i in range(n)]
+    ohlcv[-1][4] = last_close
+    return ohlcv
+
+
+def make_engine():
+    """Bare AetherEvo with only the indicator cache set up (no exchange/config)"""
+    engine = AetherEvo.__new__(AetherEvo)
+    engine._indicator_cache = None
+    return engine
+
+
+def counting(calculate, calls):
+    """Wrap calculate_indicators so each real computation is recorded"""
+    def wrapper(ohlcv):
+        calls.append(len(ohlcv))
+        return calculate(ohlcv)
+    return wrapper
+
+
+class TestIndicatorCache:
+    """Test AetherEvo._calculate_indicators"""
+    
+    def test_same_candles_hit_cache(self, monkeypatch):
+        """Test an unchanged candle set is computed once and callers get copies"""
+        calls = []
+        monkeypatch.setattr(active_logic, 'calculate_indicators', counting(active_logic.calculate_indicators, calls))
+        engine = make_engine()
+        
+        first = engine._calculate_indicators(make_ohlcv())
+        first['current_price'] = -1.0
+        second = engine._calculate_indicators(make_ohlcv())
+        
+        assert calls == [30]
+        assert second['current_price'] != -1.0
+    
+    def test_open_candle_update_misses_cache(self, monkeypatch):
+        """Test a change to the still-open last candle recomputes"""
+        calls = []
+        monkeypatch.setattr(active_logic, 'calculate_indicators', counting(active_logic.calculate_indicators, calls))
+        engine = make_engine()
+        
+        first = engine._calculate_indicators(make_ohlcv(last_close=100.0))
+        second = engine._calculate_indicators(make_ohlcv(last_close=105.0))
+        
+        assert len(calls) == 2
+        assert second['current_price'] == 105.0
+        assert first['current_price'] == 100.0
+    
+    def test_reloaded_active_logic_misses_cache(self, monkeypatch):
+        """Test a new calculate_indicators (Architect reload) is used despite identical candles"""
+        engine = make_engine()
+        original = active_logic.calculate_indicators
+        engine._calculate_indicators(make_ohlcv())
+        
+        calls = []
+        monkeypatch.setattr(active_logic, 'calculate_indicators', counting(original, calls))
+        engine._calculate_indicators(make_ohlcv())
+        
+        assert calls == [30]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -13,6 +13,7 @@ import pytest
 import asyncio
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
+import time
 
 
 class TestSyntaxChecks:
@@ -53,6 +54,34 @@ class TestSharedState:
         
         assert state1 is state2  # Should be same instance
     
+    def test_shared_state_singleton_concurrent_first_call(self, monkeypatch):
+        """Test threads racing on the first call all get one instance"""
+        import threading
+        from data import shared_state as shared_state_module
+        
+        monkeypatch.setattr(shared_state_module, '_shared_state_instance', None)
+        created = []
+        original_init = shared_state_module.SharedState.__init__
+        
+        def slow_init(self):
+            created.append(self)
+            time.sleep(0.01)
+            original_init(self)
+        
+        monkeypatch.setattr(shared_state_module.SharedState, '__init__', slow_init)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(shared_state_module.get_shared_state()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+    
     def test_risk_level_management(self):
         """Test global risk level management"""
         from data.shared_state import get_shared_state, RiskLevel
@@ -82,6 +111,101 @@ class TestSharedState:
         
         state.set_sentiment_multiplier(0.1)  # Below min
         assert state.get_sentiment_multiplier() == 0.5  # Should be clamped
+        
+        state.set_sentiment_multiplier(1.5)  # Bounds are kept as-is
+        assert state.get_sentiment_multiplier() == 1.5
+        
+        state.set_sentiment_multiplier(float('nan'))  # Not a number
+        assert state.get_sentiment_multiplier() == 1.5
+    
+    def test_snapshot_reads_are_isolated(self):
+        """Test reads see whole writes and are unaffected by later caller mutation"""
+        from data.shared_state import SharedState, RiskLevel
+        
+        state = SharedState()
+        oracle_data = {'spy_change': -0.02}
+        state.set_global_risk_level(RiskLevel.HIGH, oracle_data)
+        before = state.get_all_state()
+        
+        oracle_data['spy_change'] = 0.0
+        state.set_whale_dump_risk(True)
+        
+        assert before['whale_dump_risk'] is False
+        assert state.get_oracle_data()['data'] == {'spy_change': -0.02}
+        assert state.get_all_state()['global_risk_level'] == RiskLevel.HIGH
+        assert state.get_whale_dump_risk() is True
+    
+    def test_all_state_raw_payloads_are_opt_in(self):
+        """Test get_all_state only copies the raw payloads when asked"""
+        from data.shared_state import SharedState, RiskLevel
+        
+        state = SharedState()
+        state.set_global_risk_level(RiskLevel.HIGH, {'spy_change': -0.02})
+        
+        assert 'oracle_data' not in state.get_all_state()
+        
+        raw = state.get_all_state(include_raw=True)
+        raw['oracle_data']['spy_change'] = 0.0
+        assert raw['sentiment_data'] == {}
+        assert state.get_oracle_data()['data'] == {'spy_change': -0.02}
+    
+    def test_data_getters_return_shared_read_only_views(self):
+        """Test oracle/sentiment getters reuse one read-only view per write"""
+        from data.shared_state import SharedState, RiskLevel
+        
+        state = SharedState()
+        state.set_sentiment_multiplier(0.8, {'score': 0.2})
+        view = state.get_sentiment_data()
+        
+        assert state.get_sentiment_data() is view
+        assert dict(view)['data'] == {'score': 0.2}
+        with pytest.raises(TypeError):
+            view['data']['score'] = 1.0
+        
+        state.set_global_risk_level(RiskLevel.HIGH)
+        assert state.get_sentiment_data() is view
+        assert state.get_oracle_data()['risk_level'] == RiskLevel.HIGH
+        
+        state.set_sentiment_multiplier(0.9)
+        assert state.get_sentiment_data()['multiplier'] == 0.9
+        assert state.get_sentiment_data()['data'] == {'score': 0.2}
+    
+    def test_update_times_formatted_on_write(self):
+        """Test readers get the ISO update time stored by the writer"""
+        from data.shared_state import SharedState, RiskLevel
+        
+        state = SharedState()
+        assert state.get_all_state()['last_oracle_update'] is None
+        
+        state.set_global_risk_level(RiskLevel.NORMAL)
+        last_update = state.get_oracle_data()['last_update']
+        
+        assert datetime.fromisoformat(last_update) <= datetime.now()
+        assert state.get_all_state()['last_oracle_update'] is last_update
+    
+    def test_all_state_consistent_under_concurrent_writes(self):
+        """Test get_all_state never mixes fields from different writes"""
+        import threading
+        from data.shared_state import SharedState, RiskLevel
+        
+        state = SharedState()
+        stop = threading.Event()
+        
+        def writer():
+            while not stop.is_set():
+                for level in (RiskLevel.HIGH, RiskLevel.NORMAL):
+                    state.set_global_risk_level(level, {'level': level.value})
+        
+        thread = threading.Thread(target=writer, daemon=True)
+        thread.start()
+        try:
+            for _ in range(20000):
+                snapshot = state.get_all_state(include_raw=True)
+                if snapshot['oracle_data']:
+                    assert snapshot['oracle_data']['level'] == snapshot['global_risk_level'].value
+        finally:
+            stop.set()
+            thread.join()
 
 
 class TestTradFiOracle:
@@ -102,34 +226,81 @@ class TestTradFiOracle:
         oracle = TradFiOracle()
         data = oracle._get_fallback_data()
         
-        assert 'spy' in data
-        assert 'qqq' in data
-        assert 'timestamp' in data
+        assert data.spy_price > 0
+        assert data.qqq_price > 0
+        assert data.timestamp > 0
+        assert data.source == 'fallback'
+    
+    def test_market_snapshot_to_dict(self):
+        """Test snapshots convert to the nested layout used by the dashboard"""
+        from core.oracle import TradFiOracle
+        
+        oracle = TradFiOracle()
+        first = oracle._get_fallback_data()
+        data = first.to_dict()
+        
+        assert data['spy']['price'] == first.spy_price
+        assert data['qqq']['change_pct'] == first.qqq_change_pct
         assert data['source'] == 'fallback'
+        assert datetime.fromisoformat(data['timestamp'])
+        
+        # Each fallback reading gets its own timestamp
+        second = oracle._get_fallback_data()
+        assert second.timestamp >= first.timestamp
+        assert second.spy_price == first.spy_price
+    
+    def test_alpaca_clients_pooled_by_credentials(self, monkeypatch):
+        """Test oracles with the same credentials share one client with a widened pool"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from core import oracle as oracle_module
+        from core.oracle import TradFiOracle
+        
+        created = []
+        
+        class FakeREST:
+            def __init__(self, key_id, secret_key, base_url):
+                self.key_id = key_id
+                self._session = requests.Session()
+                created.append(self)
+        
+        monkeypatch.setattr(oracle_module, 'ALPACA_AVAILABLE', True)
+        monkeypatch.setattr(oracle_module, 'REST', FakeREST, raising=False)
+        monkeypatch.setattr(oracle_module, 'HTTPAdapter', HTTPAdapter, raising=False)
+        monkeypatch.setattr(oracle_module, '_SESSION_POOL', {})
+        
+        first = TradFiOracle(alpaca_api_key="key-a", alpaca_secret_key="secret-a")
+        second = TradFiOracle(alpaca_api_key="key-a", alpaca_secret_key="secret-a")
+        other = TradFiOracle(alpaca_api_key="key-b", alpaca_secret_key="secret-b")
+        
+        assert first.alpaca_client is second.alpaca_client
+        assert other.alpaca_client is not first.alpaca_client
+        assert len(created) == 2
+        
+        adapter = first.alpaca_client._session.get_adapter('https://data.alpaca.markets')
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 8
+        assert first.alpaca_client._session.get_adapter('http://example.com') is adapter
     
     def test_oracle_risk_calculation_high(self):
         """Test Oracle sets HIGH risk when SPY drops > 1%"""
-        from core.oracle import TradFiOracle
+        from core.oracle import TradFiOracle, MarketSnapshot
         from data.shared_state import get_shared_state, RiskLevel
         
         oracle = TradFiOracle()
         
         # Mock market data with SPY down 1.5%
         with patch.object(oracle, 'fetch_market_data') as mock_fetch:
-            mock_fetch.return_value = {
-                'timestamp': datetime.now().isoformat(),
-                'spy': {
-                    'price': 450.0,
-                    'change_pct': -1.5,
-                    'prev_price': 456.8
-                },
-                'qqq': {
-                    'price': 380.0,
-                    'change_pct': -1.2,
-                    'prev_price': 384.6
-                },
-                'source': 'test'
-            }
+            mock_fetch.return_value = MarketSnapshot(
+                timestamp=time.time(),
+                spy_price=450.0,
+                spy_change_pct=-1.5,
+                spy_prev_price=456.8,
+                qqq_price=380.0,
+                qqq_change_pct=-1.2,
+                qqq_prev_price=384.6,
+                source='test'
+            )
             
             risk = oracle.update_global_risk()
             
@@ -137,27 +308,23 @@ class TestTradFiOracle:
     
     def test_oracle_risk_calculation_normal(self):
         """Test Oracle sets NORMAL risk when SPY is stable"""
-        from core.oracle import TradFiOracle
+        from core.oracle import TradFiOracle, MarketSnapshot
         from data.shared_state import get_shared_state, RiskLevel
         
         oracle = TradFiOracle()
         
         # Mock market data with SPY up 0.5%
         with patch.object(oracle, 'fetch_market_data') as mock_fetch:
-            mock_fetch.return_value = {
-                'timestamp': datetime.now().isoformat(),
-                'spy': {
-                    'price': 450.0,
-                    'change_pct': 0.5,
-                    'prev_price': 447.8
-                },
-                'qqq': {
-                    'price': 380.0,
-                    'change_pct': 0.7,
-                    'prev_price': 377.4
-                },
-                'source': 'test'
-            }
+            mock_fetch.return_value = MarketSnapshot(
+                timestamp=time.time(),
+                spy_price=450.0,
+                spy_change_pct=0.5,
+                spy_prev_price=447.8,
+                qqq_price=380.0,
+                qqq_change_pct=0.7,
+                qqq_prev_price=377.4,
+                source='test'
+            )
             
             risk = oracle.update_global_risk()
             
@@ -176,6 +343,46 @@ class TestTradFiOracle:
             
             # Should default to NORMAL on error
             assert risk == RiskLevel.NORMAL
+    
+    def test_oracle_skips_unchanged_publish(self):
+        """Test Oracle only writes shared state when the reading changes"""
+        from core.oracle import TradFiOracle
+        
+        oracle = TradFiOracle()
+        market_data = oracle._get_fallback_data()
+        
+        with patch.object(oracle, 'fetch_market_data', return_value=market_data), \
+                patch.object(oracle.shared_state, 'set_global_risk_level',
+                             wraps=oracle.shared_state.set_global_risk_level) as mock_set:
+            oracle.update_global_risk()
+            oracle.update_global_risk()
+            assert mock_set.call_count == 1
+            
+            # A stale publish is refreshed even if nothing changed
+            oracle.min_publish_interval = 0.0
+            oracle.update_global_risk()
+            assert mock_set.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_oracle_fetch_market_data_async(self):
+        """Test async fetch requests both symbols and builds market data"""
+        from core.oracle import TradFiOracle
+        
+        oracle = TradFiOracle()
+        oracle.alpaca_client = Mock()  # Pretend Alpaca is configured
+        
+        closes = {'SPY': [456.8, 450.0], 'QQQ': [384.6, 380.0]}
+        
+        async def fake_fetch(session, symbol, start_time, end_time):
+            return closes[symbol]
+        
+        with patch.object(oracle, '_fetch_symbol_async', side_effect=fake_fetch):
+            data = await oracle.fetch_market_data_async()
+        
+        assert data.source == 'alpaca'
+        assert data.spy_price == 450.0
+        assert data.spy_change_pct == pytest.approx(-1.49, abs=0.01)
+        assert data.qqq_prev_price == 384.6
 
 
 class TestSentimentAgent:
@@ -259,6 +466,25 @@ class TestSentimentAgent:
         
         assert result['sentiment'] == 'Neutral'
         assert 0.9 <= result['multiplier'] <= 1.1  # Should maintain exposure
+    
+    @pytest.mark.asyncio
+    async def test_update_sentiment_uses_prefetched_inputs(self):
+        """Test update_sentiment skips fetching inputs it was given"""
+        from unittest.mock import patch
+        from agents.perception import SentimentAgent
+        
+        agent = SentimentAgent()
+        fear_greed = {'value': 85, 'classification': 'Extreme Greed', 'source': 'test'}
+        headlines = ['Bitcoin surges to new highs']
+        
+        with patch.object(agent, 'fetch_fear_greed_index') as fetch_index, \
+                patch.object(agent, 'fetch_bitcoin_news') as fetch_news:
+            multiplier = await agent.update_sentiment(fear_greed, headlines)
+        
+        fetch_index.assert_not_called()
+        fetch_news.assert_not_called()
+        assert multiplier == agent._rule_based_sentiment(fear_greed, headlines)['multiplier']
+        assert agent.shared_state.get_sentiment_data()['data']['headlines'] == headlines
 
 
 class TestPositionSizing:
@@ -371,6 +597,66 @@ class TestPositionSizing:
         # Verify significant reduction
         reduction_pct = ((adjusted - base_size) / base_size) * 100
         assert reduction_pct == -75.0  # 75% reduction
+    
+    def test_get_adjusted_sizes_batch_matches_scalar(self):
+        """Test batch sizing matches get_adjusted_size for every scenario"""
+        from architect import Architect
+        from data.shared_state import get_shared_state, RiskLevel
+        from guardrails import Guardrails
+        
+        guardrails = Guardrails(
+            initial_equity=1000.0,
+            kill_switch_threshold=0.03,
+            stability_lock_hours=12
+        )
+        architect = Architect(guardrails)
+        state = get_shared_state()
+        
+        scenarios = [
+            (100.0, RiskLevel.NORMAL, 1.0, False),
+            (100.0, RiskLevel.NORMAL, 0.7, False),
+            (100.0, RiskLevel.HIGH, 1.0, False),
+            (37.3, RiskLevel.HIGH, 0.5, True),
+            (250.0, RiskLevel.NORMAL, 1.5, True),
+        ]
+        
+        sizes = architect.get_adjusted_sizes_batch(
+            [base for base, _, _, _ in scenarios],
+            [risk for _, risk, _, _ in scenarios],
+            [sentiment for _, _, sentiment, _ in scenarios],
+            [whale for _, _, _, whale in scenarios]
+        )
+        
+        try:
+            for (base, risk, sentiment, whale), size in zip(scenarios, sizes):
+                state.set_global_risk_level(risk)
+                state.set_sentiment_multiplier(sentiment)
+                state.set_whale_dump_risk(whale)
+                assert architect.get_adjusted_size(base) == size
+        finally:
+            state.set_global_risk_level(RiskLevel.NORMAL)
+            state.set_sentiment_multiplier(1.0)
+            state.set_whale_dump_risk(False)
+    
+    def test_get_adjusted_sizes_batch_broadcasts_scalars(self):
+        """Test a single risk level/sentiment/whale flag applies to every base size"""
+        from architect import Architect
+        from data.shared_state import RiskLevel
+        from guardrails import Guardrails
+        
+        guardrails = Guardrails(
+            initial_equity=1000.0,
+            kill_switch_threshold=0.03,
+            stability_lock_hours=12
+        )
+        architect = Architect(guardrails)
+        
+        sizes = architect.get_adjusted_sizes_batch([100.0] * 4, RiskLevel.HIGH, 1.0, False)
+        
+        assert sizes.tolist() == [50.0] * 4
+        assert architect.get_adjusted_sizes_batch([100.0, 80.0], RiskLevel.NORMAL, 0.5, True).tolist() == [
+            100.0 * 0.5 * 0.7, 80.0 * 0.5 * 0.7
+        ]
 
 
 class TestIntegration:
@@ -379,7 +665,7 @@ class TestIntegration:
     @pytest.mark.asyncio
     async def test_full_workflow(self):
         """Test complete workflow: Oracle → Sentiment → Position Sizing"""
-        from core.oracle import TradFiOracle
+        from core.oracle import TradFiOracle, MarketSnapshot
         from agents.perception import SentimentAgent
         from architect import Architect
         from data.shared_state import get_shared_state, RiskLevel
@@ -397,12 +683,16 @@ class TestIntegration:
         
         # Mock Oracle to return HIGH risk
         with patch.object(oracle, 'fetch_market_data') as mock_fetch:
-            mock_fetch.return_value = {
-                'timestamp': datetime.now().isoformat(),
-                'spy': {'price': 450.0, 'change_pct': -1.5, 'prev_price': 456.8},
-                'qqq': {'price': 380.0, 'change_pct': -1.2, 'prev_price': 384.6},
-                'source': 'test'
-            }
+            mock_fetch.return_value = MarketSnapshot(
+                timestamp=time.time(),
+                spy_price=450.0,
+                spy_change_pct=-1.5,
+                spy_prev_price=456.8,
+                qqq_price=380.0,
+                qqq_change_pct=-1.2,
+                qqq_prev_price=384.6,
+                source='test'
+            )
             
             # Step 1: Update Oracle
             risk = oracle.update_global_risk()
@@ -178,6 +178,50 @@ class TestIntelligenceLedger:
         failed = ledger.get_failed_predictions(limit=5)
         
         assert len(failed) == 3
+    
+    def test_batch_record_and_outcomes(self):
+        """Test batch recording and outcome updates in one transaction each"""
+        import sqlite3
+        
+        ledger = IntelligenceLedger(db_path=self.test_db)
+        
+        pred_ids = ledger.record_predictions([
+            {
+                'predicted_bias': f"Test {i}",
+                'predicted_outcome': f"Outcome {i}",
+                'confidence': 0.7,
+                'market_regime': "CHOPPY",
+                'archetype': "NEUTRAL",
+                'signal': "HOLD",
+                'price_at_prediction': 90000.0 + i
+            }
+            for i in range(3)
+        ])
+        ledger.update_outcomes("1h", [(pred_id, 89000.0, -0.5) for pred_id in pred_ids])
+        
+        assert len(set(pred_ids)) == 3
+        assert ledger.get_statistics()['total_predictions'] == 3
+        assert len(ledger.get_failed_predictions(limit=5)) == 3
+        
+        conn = sqlite3.connect(self.test_db)
+        rows = conn.execute(
+            "SELECT id, price_at_prediction, actual_price_1h FROM predictions ORDER BY id"
+        ).fetchall()
+        conn.close()
+        
+        assert rows == [(pred_id, 90000.0 + i, 89000.0) for i, pred_id in enumerate(pred_ids)]
+    
+    def test_wal_journal_mode(self):
+        """Test ledger database uses WAL journaling"""
+        import sqlite3
+        
+        IntelligenceLedger(db_path=self.test_db)
+        
+        conn = sqlite3.connect(self.test_db)
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        
+        assert mode == "wal"
 
 
 class TestReconciliationAuditor:
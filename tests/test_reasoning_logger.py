@@ -0,0 +1,284 @@
+"""
+Unit Tests for Reasoning Logger
+Tests JSONL trace logging and tail reads
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import pytest
+from data import logger as logger_module
+from data.logger import ReasoningLogger
+
+
+@pytest.fixture
+def reasoning_logger(tmp_path):
+    """Logger writing to a temporary JSONL file"""
+    return ReasoningLogger(log_file=str(tmp_path / "reasoning_logs.jsonl"))
+
+
+class TestSerialization:
+    """Test JSONL trace serialization"""
+    
+    def test_orjson_and_json_lines_agree(self, monkeypatch):
+        """Test both backends produce one newline-terminated line with the same content"""
+        entry = {'source': 'test', 'response': 'é <thought>x</thought>', 'metadata': {'confidence': 0.75}}
+        
+        fast = logger_module._dump_trace_line(entry)
+        monkeypatch.setattr(logger_module, 'ORJSON_AVAILABLE', False)
+        slow = logger_module._dump_trace_line(entry)
+        
+        assert fast.endswith(b'\n') and fast.count(b'\n') == 1
+        assert json.loads(fast) == json.loads(slow) == entry
+    
+    def test_numpy_and_unsupported_values(self):
+        """Test numpy scalars serialize, and types orjson rejects fall back to json"""
+        import numpy as np
+        
+        class Price(float):
+            pass
+        
+        line = logger_module._dump_trace_line({'pnl': np.float64(1.5), 'price': Price(2.5)})
+        
+        assert json.loads(line) == {'pnl': 1.5, 'price': 2.5}
+
+
+class TestBufferedWrites:
+    """Test batched appends to the JSONL file"""
+    
+    def test_traces_buffered_until_flush(self, tmp_path):
+        """Test traces reach the file in one append on flush"""
+        buffered = ReasoningLogger(log_file=str(tmp_path / "logs.jsonl"), flush_interval=60)
+        
+        buffered.log_reasoning_trace("first", "prompt", "response")
+        buffered.log_reasoning_trace("second", "prompt", "response")
+        assert buffered.log_file.read_text() == ""
+        
+        buffered.flush()
+        lines = buffered.log_file.read_text().splitlines()
+        
+        assert [json.loads(line)['source'] for line in lines] == ['first', 'second']
+        buffered.close()
+    
+    def test_size_threshold_flushes(self, tmp_path):
+        """Test the buffer is written once it reaches the size threshold"""
+        buffered = ReasoningLogger(
+            log_file=str(tmp_path / "logs.jsonl"), flush_threshold_bytes=1, flush_interval=60
+        )
+        
+        buffered.log_reasoning_trace("source", "prompt", "response")
+        
+        assert buffered.log_file.read_text().count('\n') == 1
+        buffered.close()
+    
+    def test_interval_flushes(self, tmp_path):
+        """Test a lone trace is written after the flush interval"""
+        import time
+        
+        buffered = ReasoningLogger(log_file=str(tmp_path / "logs.jsonl"), flush_interval=0.05)
+        buffered.log_reasoning_trace("source", "prompt", "response")
+        
+        deadline = time.time() + 5
+        while buffered.log_file.read_text() == "" and time.time() < deadline:
+            time.sleep(0.01)
+        
+        assert buffered.log_file.read_text().count('\n') == 1
+        buffered.close()
+    
+    def test_readers_see_buffered_traces(self, tmp_path):
+        """Test reads and statistics include traces not yet flushed"""
+        buffered = ReasoningLogger(log_file=str(tmp_path / "logs.jsonl"), flush_interval=60)
+        
+        buffered.log_reasoning_trace("source", "prompt", "response")
+        
+        assert len(buffered.read_recent_traces(count=5)) == 1
+        assert buffered.count_traces() == 1
+        assert buffered.get_statistics()['total_traces'] == 1
+        buffered.close()
+    
+    def test_exit_hook_flushes_unclosed_loggers(self, tmp_path):
+        """Test buffered traces of a logger nobody closed are written at exit"""
+        buffered = ReasoningLogger(log_file=str(tmp_path / "logs.jsonl"), flush_interval=60)
+        buffered.log_reasoning_trace("source", "prompt", "response")
+        
+        logger_module._flush_open_loggers()
+        
+        assert buffered.log_file.read_text().count('\n') == 1
+        buffered.close()
+        assert buffered not in logger_module._open_loggers
+    
+    def test_unclosed_logger_not_pinned(self, tmp_path):
+        """Test a dropped logger without buffered traces can be garbage collected"""
+        import gc
+        import weakref
+        
+        dropped = ReasoningLogger(log_file=str(tmp_path / "logs.jsonl"))
+        ref = weakref.ref(dropped)
+        del dropped
+        gc.collect()
+        
+        assert ref() is None
+
+    
+    def test_gather_write_batches(self, tmp_path, monkeypatch):
+        """Test batches larger than IOV_MAX and the plain write fallback keep order"""
+        chunks = [f'{{"n": {i}}}\n'.encode() for i in range(50)]
+        monkeypatch.setattr(logger_module, '_IOV_MAX', 16)
+        
+        assert logger_module._append_chunks(tmp_path / "a.jsonl", chunks) == sum(map(len, chunks))
+        monkeypatch.delattr(logger_module.os, 'writev', raising=False)
+        logger_module._append_chunks(tmp_path / "b.jsonl", chunks)
+        
+        expected = b''.join(chunks)
+        assert (tmp_path / "a.jsonl").read_bytes() == expected
+        assert (tmp_path / "b.jsonl").read_bytes() == expected
+    
+    def test_rotates_on_tracked_size(self, tmp_path, monkeypatch):
+        """Test rotation uses the running size counter instead of stat()"""
+        buffered = ReasoningLogger(log_file=str(tmp_path / "logs.jsonl"), flush_interval=0)
+        buffered.max_size_bytes = 100
+        
+        buffered.log_reasoning_trace("first", "prompt", "response")
+        assert buffered._file_size == buffered.log_file.stat().st_size
+        
+        monkeypatch.setattr(Path, 'stat', lambda *a, **k: pytest.fail("stat() called on write"))
+        buffered.log_reasoning_trace("second", "prompt", "response")
+        monkeypatch.undo()
+        
+        rotated = [path for path in tmp_path.iterdir() if path.name != "logs.jsonl"]
+        assert len(rotated) == 1
+        assert json.loads(rotated[0].read_text())['source'] == 'first'
+        assert json.loads(buffered.log_file.read_text())['source'] == 'second'
+        assert buffered._file_size == buffered.log_file.stat().st_size
+        buffered.close()
+
+
+class TestStatistics:
+    """Test log statistics"""
+    
+    def test_counts_by_source(self, reasoning_logger):
+        """Test traces are counted per source, skipping invalid lines"""
+        for source in ['explorer', 'explorer', 'reasoning_loop']:
+            reasoning_logger.log_reasoning_trace(source, "prompt", "response")
+        reasoning_logger.flush()
+        with open(reasoning_logger.log_file, 'a') as f:
+            f.write('not json\n{"prompt": "no source"}\n')
+        
+        stats = reasoning_logger.get_statistics()
+        
+        assert stats['total_traces'] == 4
+        assert stats['sources'] == {'explorer': 2, 'reasoning_loop': 1, 'unknown': 1}
+
+
+class TestThoughtTags:
+    """Test <thought> tag extraction"""
+    
+    def test_extracts_stripped_multiline_thoughts(self, reasoning_logger):
+        """Test every tag is extracted, across lines, with whitespace stripped"""
+        text = "pre <thought>\n first\nline </thought> mid <thought>second</thought> <thought>unclosed"
+        
+        assert reasoning_logger.extract_thought_tags(text) == ['first\nline', 'second']
+        assert reasoning_logger.extract_thought_tags("no tags") == []
+    
+    @pytest.mark.parametrize("text", [
+        "<thought>a</thought> x <thought>b\nc</thought>" * 40,
+        "<thought>unclosed " + "x" * 300,
+        "x" * 300 + "</thought><thought>late</thought><thought>",
+        "<thought><thought>nested</thought></thought>" * 20,
+    ])
+    def test_scanner_matches_regex(self, text):
+        """Test the str.find scan returns what the regex finds"""
+        assert len(text) >= logger_module._SCAN_MIN_CHARS
+        assert logger_module.find_thought_tags(text) == logger_module._THOUGHT_RE.findall(text)
+
+
+class TestTailRead:
+    """Test reading the most recent traces"""
+    
+    def test_reads_last_traces_in_order(self, reasoning_logger):
+        """Test only the last N traces are returned, oldest first"""
+        for i in range(5):
+            reasoning_logger.log_reasoning_trace(f"source_{i}", "prompt", "<thought>x</thought>")
+        
+        traces = reasoning_logger.read_recent_traces(count=2)
+        
+        assert [t['source'] for t in traces] == ['source_3', 'source_4']
+        assert traces[-1]['thought_count'] == 1
+    
+    def test_tail_spans_multiple_blocks(self, reasoning_logger, monkeypatch):
+        """Test the fallback scan stitches lines split across read blocks"""
+        def no_mmap(*args, **kwargs):
+            raise OSError("mmap unavailable")
+        
+        monkeypatch.setattr(logger_module, '_TAIL_BLOCK_SIZE', 16)
+        monkeypatch.setattr(logger_module.mmap, 'mmap', no_mmap)
+        for i in range(20):
+            reasoning_logger.log_reasoning_trace(f"source_{i}", "prompt", "response " * 5)
+        
+        traces = reasoning_logger.read_recent_traces(count=3)
+        
+        assert [t['source'] for t in traces] == ['source_17', 'source_18', 'source_19']
+    
+    def test_fallback_matches_mmap(self, reasoning_logger, monkeypatch):
+        """Test the block-scan fallback returns the same lines as the mmap walk"""
+        for i in range(20):
+            reasoning_logger.log_reasoning_trace(f"source_{i}", "prompt", "response " * 5)
+        reasoning_logger.flush()
+        with open(reasoning_logger.log_file, 'a') as f:
+            f.write('\n{"source": "partial"')
+        
+        expected = reasoning_logger._read_tail_lines(5)
+        
+        def no_mmap(*args, **kwargs):
+            raise OSError("mmap unavailable")
+        
+        monkeypatch.setattr(logger_module, '_TAIL_BLOCK_SIZE', 16)
+        monkeypatch.setattr(logger_module.mmap, 'mmap', no_mmap)
+        
+        assert reasoning_logger._read_tail_lines(5) == expected
+        assert expected[-1] == b'{"source": "partial"'
+        assert expected[-2] == b''
+    
+    def test_json_fallback_without_orjson(self, reasoning_logger, monkeypatch):
+        """Test traces parse identically with the json module"""
+        reasoning_logger.log_reasoning_trace("source", "prompt", "<thought>é</thought>")
+        expected = reasoning_logger.read_recent_traces(count=1)
+        
+        monkeypatch.setattr(logger_module, 'ORJSON_AVAILABLE', False)
+        
+        assert reasoning_logger.read_recent_traces(count=1) == expected
+    
+    def test_count_larger_than_file(self, reasoning_logger):
+        """Test requesting more traces than logged returns all of them"""
+        reasoning_logger.log_reasoning_trace("only", "prompt", "response")
+        
+        assert len(reasoning_logger.read_recent_traces(count=10)) == 1
+        assert reasoning_logger.read_recent_traces(count=0) == []
+    
+    def test_partial_last_line_skipped(self, reasoning_logger):
+        """Test a line still being written is ignored"""
+        reasoning_logger.log_reasoning_trace("complete", "prompt", "response")
+        reasoning_logger.flush()
+        with open(reasoning_logger.log_file, 'a') as f:
+            f.write(json.dumps({'source': 'partial'})[:10])
+        
+        traces = reasoning_logger.read_recent_traces(count=2)
+        
+        assert [t['source'] for t in traces] == ['complete']
+    
+    def test_count_traces(self, reasoning_logger):
+        """Test traces are counted without parsing"""
+        assert reasoning_logger.count_traces() == 0
+        
+        for i in range(3):
+            reasoning_logger.log_reasoning_trace("source", "prompt", "response")
+        
+        assert reasoning_logger.count_traces() == 3
+
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, "-v", "-s"])
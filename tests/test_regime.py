@@ -0,0 +1,293 @@
+"""
+Unit Tests for Market Regime Detection
+Tests the ATR/ADX indicator calculations
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pandas as pd
+import pytest
+from data.regime import (
+    RegimeMetricsCache,
+    _ewma, _last_regime_values, _true_range, calculate_adx, calculate_atr, calculate_regime_indicators, calculate_rsi,
+    detect_regime, get_regime_metrics, get_regime_metrics_from_arrays, ohlcv_list_to_array, ohlcv_list_to_dataframe
+)
+
+
+def make_ohlcv(n: int = 100, seed: int = 0) -> pd.DataFrame:
+    """Random-walk OHLCV candles"""
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 1, n).cumsum()
+    return pd.DataFrame({
+        'open': close,
+        'high': close + rng.random(n),
+        'low': close - rng.random(n),
+        'close': close,
+        'volume': rng.random(n) * 1000
+    })
+
+
+class TestTrueRange:
+    """Test the True Range helper"""
+    
+    def test_matches_row_max_reference(self):
+        """Test TR equals the row-wise max of the three candidate ranges"""
+        df = make_ohlcv()
+        prev_close = df['close'].shift(1)
+        reference = pd.concat([
+            df['high'] - df['low'],
+            (df['high'] - prev_close).abs(),
+            (df['low'] - prev_close).abs()
+        ], axis=1).max(axis=1)
+        
+        pd.testing.assert_series_equal(_true_range(df), reference)
+    
+    def test_first_row_is_high_minus_low(self):
+        """Test the first candle (no previous close) uses high - low"""
+        df = make_ohlcv(5)
+        
+        assert _true_range(df).iloc[0] == pytest.approx(df['high'].iloc[0] - df['low'].iloc[0])
+        assert not calculate_atr(df).isna().any()
+
+
+class TestEwma:
+    """Test the EWMA smoothing helper"""
+    
+    def test_matches_pandas_ewm(self):
+        """Test _ewma equals ewm(adjust=False).mean(), including NaN gaps"""
+        values = np.random.default_rng(1).normal(size=200)
+        values[:3] = np.nan
+        values[50:55] = np.nan
+        values[120] = np.nan
+        series = pd.Series(values)
+        
+        for period in [1, 14, 30]:
+            expected = series.ewm(span=period, adjust=False).mean()
+            np.testing.assert_array_equal(_ewma(series, period).to_numpy(), expected.to_numpy())
+    
+    def test_empty_series(self):
+        """Test an empty input gives an empty result"""
+        assert _ewma(pd.Series([], dtype=float), 14).empty
+
+
+class TestRegimeIndicators:
+    """Test the shared ATR/ADX calculation"""
+    
+    def test_shared_indicators_match_individual(self):
+        """Test the combined indicators equal calculate_atr and calculate_adx"""
+        df = make_ohlcv(200)
+        
+        indicators = calculate_regime_indicators(df)
+        adx, plus_di, minus_di = calculate_adx(df)
+        
+        pd.testing.assert_series_equal(indicators['atr'], calculate_atr(df))
+        pd.testing.assert_series_equal(indicators['adx'], adx)
+        pd.testing.assert_series_equal(indicators['plus_di'], plus_di)
+        pd.testing.assert_series_equal(indicators['minus_di'], minus_di)
+    
+    def test_metrics_regime_matches_detect_regime(self):
+        """Test get_regime_metrics reports the same regime and latest values"""
+        df = make_ohlcv(200, seed=3)
+        
+        metrics = get_regime_metrics(df)
+        
+        assert metrics['regime'] == detect_regime(df)
+        assert metrics['atr'] == pytest.approx(calculate_atr(df).iloc[-1])
+        assert metrics['adx'] == pytest.approx(calculate_adx(df)[0].iloc[-1])
+    
+    @pytest.mark.parametrize("adx_threshold, atr_percentile", [(25.0, 50.0), (10.0, 50.0), (60.0, 10.0), (60.0, 90.0)])
+    def test_detect_regime_uses_metrics_pass(self, adx_threshold, atr_percentile):
+        """Test detect_regime's thresholds give the same regime as classifying the indicators"""
+        from data.regime import _classify_regime
+        
+        df = make_ohlcv(150, seed=8)
+        
+        expected = _classify_regime(_last_regime_values(df), adx_threshold, atr_percentile)
+        
+        assert detect_regime(df, adx_threshold, atr_percentile) == expected
+        assert get_regime_metrics(df, adx_threshold, atr_percentile)['regime'] == expected
+    
+    def test_atr_percentile_uses_recent_window(self):
+        """Test ATR values older than the percentile window don't set the threshold"""
+        from data.regime import ATR_PERCENTILE_WINDOW, _classify_regime
+        
+        atr = np.concatenate([np.full(500, 100.0), np.full(ATR_PERCENTILE_WINDOW - 1, 1.0), [2.0]])
+        values = {'atr': atr, 'adx': 10.0, 'plus_di': 20.0, 'minus_di': 20.0}
+        
+        assert _classify_regime(values) == 'RANGE_VOLATILE'
+        assert _classify_regime(dict(values, atr=atr[:-50])) == 'RANGE_QUIET'
+
+
+class TestRsi:
+    """Test the Wilder-smoothed RSI"""
+    
+    def test_matches_pandas_reference(self):
+        """Test RSI equals the pandas ewm(alpha=1/period) formulation"""
+        df = make_ohlcv(200, seed=3)
+        delta = df['close'].diff()
+        avg_gain = delta.clip(lower=0).mask(delta.isna()).ewm(alpha=1 / 14, adjust=False).mean()
+        avg_loss = (-delta).clip(lower=0).mask(delta.isna()).ewm(alpha=1 / 14, adjust=False).mean()
+        expected = 100 - (100 / (1 + avg_gain / avg_loss))
+        expected.iloc[:14] = np.nan
+        
+        pd.testing.assert_series_equal(calculate_rsi(df), expected, check_names=False)
+    
+    def test_warmup_and_no_losses(self):
+        """Test the first period values are NaN and a steady rise gives 100"""
+        df = pd.DataFrame({'close': np.arange(1.0, 31.0)})
+        
+        rsi = calculate_rsi(df)
+        
+        assert rsi.iloc[:14].isna().all()
+        assert (rsi.iloc[14:] == 100).all()
+    
+    @pytest.mark.parametrize("n", [5, 14, 15, 200])
+    def test_specialized_kernel_matches(self, n):
+        """Test the fused period-14 kernel returns the array path's latest values"""
+        from data import regime
+        
+        if not regime.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        
+        df = make_ohlcv(n, seed=n)
+        df.loc[n // 2, 'close'] = np.nan
+        high, low, close = (df[col].to_numpy() for col in ('high', 'low', 'close'))
+        
+        atr, adx, plus_di, minus_di, rsi = regime._regime_metrics_p14_kernel(high, low, close)
+        
+        np.testing.assert_array_equal(rsi, calculate_rsi(df).iloc[-1])
+        np.testing.assert_array_equal(atr, calculate_atr(df).to_numpy())
+    
+    def test_bounded(self):
+        """Test RSI stays within [0, 100]"""
+        rsi = calculate_rsi(make_ohlcv(500, seed=4)).dropna()
+        
+        assert ((rsi >= 0) & (rsi <= 100)).all()
+
+
+class TestOhlcvArrays:
+    """Test the DataFrame-free OHLCV path"""
+    
+    def test_dataframe_conversion(self):
+        """Test the list conversion keeps values and millisecond timestamps"""
+        ohlcv_data = [[1700000000123, 1, 2, 0.5, 1.5, 10], [1700000060000, 1.5, 2.5, 1, 2, 11]]
+        
+        df = ohlcv_list_to_dataframe(ohlcv_data)
+        
+        assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        assert df['timestamp'].iloc[0] == pd.Timestamp('2023-11-14 22:13:20.123')
+        assert df['close'].tolist() == [1.5, 2.0]
+    
+    def test_array_metrics_match_dataframe(self):
+        """Test metrics from the array columns equal the DataFrame metrics"""
+        df = make_ohlcv(120, seed=6)
+        ohlcv_data = [[i * 60000, *row] for i, row in enumerate(df.itertuples(index=False))]
+        
+        ohlcv = ohlcv_list_to_array(ohlcv_data)
+        
+        assert get_regime_metrics_from_arrays(ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4]) == get_regime_metrics(df)
+    
+    def test_empty_list(self):
+        """Test an empty list gives an empty array and insufficient data"""
+        ohlcv = ohlcv_list_to_array([])
+        
+        assert ohlcv.shape == (0, 6)
+        assert get_regime_metrics_from_arrays(ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4])['error'] == 'Insufficient data'
+
+
+class TestRegimeMetricsCache:
+    """Test memoized regime metrics"""
+    
+    def make_array(self, n: int = 60, seed: int = 7) -> np.ndarray:
+        """OHLCV array with millisecond timestamps"""
+        df = make_ohlcv(n, seed=seed)
+        return ohlcv_list_to_array([[i * 60000, *row] for i, row in enumerate(df.itertuples(index=False))])
+    
+    def test_hit_returns_copy(self, monkeypatch):
+        """Test the same candles are computed once and callers get copies"""
+        from data import regime
+        
+        calls = []
+        original = regime.get_regime_metrics_from_arrays
+        monkeypatch.setattr(regime, 'get_regime_metrics_from_arrays', lambda *a: calls.append(1) or original(*a))
+        cache = RegimeMetricsCache()
+        ohlcv = self.make_array()
+        
+        first = cache.get_metrics('BTC/USDT', ohlcv)
+        first['regime'] = 'changed'
+        second = cache.get_metrics('BTC/USDT', ohlcv.copy())
+        
+        assert len(calls) == 1
+        assert second == original(ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4])
+    
+    def test_key_includes_symbol_and_latest_candle(self):
+        """Test other symbols and an updated open candle are recalculated"""
+        cache = RegimeMetricsCache()
+        ohlcv = self.make_array()
+        cache.get_metrics('BTC/USDT', ohlcv)
+        updated = ohlcv.copy()
+        updated[-1, 4] += 5.0
+        
+        cache.get_metrics('ETH/USDT', ohlcv)
+        metrics = cache.get_metrics('BTC/USDT', updated)
+        
+        assert len(cache._cache) == 3
+        assert metrics == get_regime_metrics_from_arrays(updated[:, 2], updated[:, 3], updated[:, 4])
+    
+    def test_bounded(self):
+        """Test the least recently used entry is evicted"""
+        cache = RegimeMetricsCache(maxsize=2)
+        ohlcv = self.make_array()
+        
+        for symbol in ('A', 'B', 'A', 'C'):
+            cache.get_metrics(symbol, ohlcv)
+        
+        assert [key[0] for key in cache._cache] == ['A', 'C']
+
+
+class TestLastRegimeValues:
+    """Test the tail-only indicator path used by the regime classification"""
+    
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_full_series(self, seed):
+        """Test the latest values and ATR array equal the full Series calculation"""
+        df = make_ohlcv(300, seed=seed)
+        df.loc[10, 'close'] = np.nan
+        
+        values = _last_regime_values(df)
+        adx, plus_di, minus_di = calculate_adx(df)
+        
+        np.testing.assert_array_equal(values['atr'], calculate_atr(df).to_numpy())
+        assert values['adx'] == adx.iloc[-1]
+        assert values['plus_di'] == plus_di.iloc[-1]
+        assert values['minus_di'] == minus_di.iloc[-1]
+    
+    def test_flat_candles(self):
+        """Test zero-range candles (0/0 directional index) match the Series path"""
+        df = pd.DataFrame({'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1.0}, index=range(40))
+        
+        values = _last_regime_values(df)
+        adx, _, _ = calculate_adx(df)
+        
+        np.testing.assert_array_equal(values['adx'], adx.iloc[-1])
+        assert detect_regime(df) == 'RANGE_QUIET'
+    
+    def test_pandas_fallback(self, monkeypatch):
+        """Test the path without numba gives the same metrics"""
+        from data import regime
+        
+        df = make_ohlcv(120, seed=5)
+        expected = get_regime_metrics(df)
+        
+        monkeypatch.setattr(regime, 'NUMBA_AVAILABLE', False)
+        
+        assert get_regime_metrics(df) == expected
+
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, "-v", "-s"])
@@ -9,7 +9,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pytest
-from core.shadow_engine import ShadowEngine, ShadowStrategy
+import numpy as np
+from core.shadow_engine import ShadowEngine, ShadowStrategy, TradeResult
 
 
 class TestShadowStrategy:
@@ -53,6 +54,14 @@ class TestShadowStrategy:
         assert stats['win_count'] == 2
         assert stats['win_rate'] == pytest.approx(2/3, 0.01)
         assert stats['total_pnl'] == 120.0
+    
+    def test_slots_layout(self):
+        """Test that strategies use slots instead of a per-instance dict"""
+        strategy = ShadowStrategy(name="Test")
+        
+        assert not hasattr(strategy, '__dict__')
+        with pytest.raises(AttributeError):
+            strategy.unknown_attribute = 1
 
 
 class TestShadowEngine:
@@ -81,11 +90,78 @@ class TestShadowEngine:
             market_volatility=0.02
         )
         
+        assert isinstance(result, TradeResult)
+        assert result.market_signal == "buy"
+        assert isinstance(result.live_pnl, float)
+        assert isinstance(result.shadow_pnl, float)
+        assert isinstance(result.live_sharpe, float)
+        assert isinstance(result.shadow_sharpe, float)
+        assert result.promotion_alert is None
+    
+    def test_trade_result_to_dict(self):
+        """Test converting a trade result to a dashboard-friendly dict"""
+        engine = ShadowEngine()
+        
+        result = engine.simulate_trade_pair("buy", 50000.0, 0.02).to_dict()
+        
         assert 'live_pnl' in result
         assert 'shadow_pnl' in result
         assert 'live_sharpe' in result
         assert 'shadow_sharpe' in result
         assert 'promotion_alert' in result
+        assert isinstance(result['timestamp'], str)
+    
+    def test_trade_result_iso_timestamp(self):
+        """Test that the raw timestamp is formatted lazily on demand"""
+        from datetime import datetime
+        
+        engine = ShadowEngine()
+        
+        result = engine.simulate_trade_pair("buy", 50000.0, 0.02)
+        
+        assert isinstance(result.timestamp, float)
+        assert datetime.fromisoformat(result.iso_timestamp).timestamp() == pytest.approx(result.timestamp)
+    
+    def test_seeded_simulation_is_reproducible(self):
+        """Test that engines with the same seed replay identical trades"""
+        engine_a = ShadowEngine(seed=42)
+        engine_b = ShadowEngine(seed=42)
+        
+        for i in range(5):
+            result_a = engine_a.simulate_trade_pair("buy", 50000.0, 0.02)
+            result_b = engine_b.simulate_trade_pair("buy", 50000.0, 0.02)
+            
+            assert result_a.live_pnl == result_b.live_pnl
+            assert result_a.shadow_pnl == result_b.shadow_pnl
+    
+    def test_simulate_batch(self):
+        """Test batch simulation shapes, hold handling and seeding"""
+        signals = ["buy", "sell", "hold", "buy"]
+        
+        live_a, shadow_a = ShadowEngine(seed=7).simulate_batch(signals, 0.02)
+        live_b, shadow_b = ShadowEngine(seed=7).simulate_batch(signals, [0.02] * 4)
+        
+        assert live_a.shape == (4,)
+        assert shadow_a.shape == (4,)
+        assert live_a[2] == 0.0
+        assert shadow_a[2] == 0.0
+        assert np.allclose(live_a, live_b)
+        assert np.allclose(shadow_a, shadow_b)
+    
+    def test_simulate_batch_matches_model(self):
+        """Test batch kernel follows the single-trade PnL model"""
+        engine = ShadowEngine(seed=3)
+        live, shadow = engine.simulate_batch(["buy", "sell"], 0.02)
+        
+        z_live, z_shadow = np.random.default_rng(3).standard_normal((2, 2))
+        live_lev = engine.live_strategy.leverage_multiplier
+        shadow_lev = engine.shadow_strategy.leverage_multiplier
+        shadow_vol = 0.02 * engine.shadow_strategy.risk_multiplier
+        
+        assert live[0] == pytest.approx((z_live[0] * 0.02 + 0.3 * 0.02) * live_lev * 1000.0)
+        assert live[1] == pytest.approx((z_live[1] * 0.02 - 0.3 * 0.02) * live_lev * 1000.0)
+        assert shadow[0] == pytest.approx((z_shadow[0] + 0.3) * shadow_vol * shadow_lev * 1000.0)
+        assert engine.live_strategy.trade_count == 0
     
     def test_shadow_higher_leverage(self):
         """Test that shadow strategy has higher leverage"""
@@ -110,6 +186,20 @@ class TestShadowEngine:
         assert 'roi_diff' in summary['comparison']
         assert 'sharpe_diff' in summary['comparison']
     
+    def test_comparison_summary_cached_until_next_trade(self):
+        """Test that the summary is reused until a new trade is recorded"""
+        engine = ShadowEngine()
+        engine.simulate_trade_pair("buy", 50000.0, 0.02)
+        
+        first = engine.get_comparison_summary()
+        assert engine.get_comparison_summary() is first
+        
+        engine.simulate_trade_pair("buy", 50000.0, 0.02)
+        refreshed = engine.get_comparison_summary()
+        
+        assert refreshed is not first
+        assert refreshed['live']['trade_count'] == 2
+    
     def test_reset_shadow_strategy(self):
         """Test resetting shadow strategy"""
         engine = ShadowEngine()
@@ -124,6 +214,26 @@ class TestShadowEngine:
         assert engine.shadow_strategy.risk_multiplier == 2.0
         assert engine.shadow_strategy.trade_count == 0
     
+    def test_reset_during_trade_drops_stale_shadow_trade(self):
+        """Test a reset between compute and commit doesn't credit the retired strategy"""
+        engine = ShadowEngine()
+        retired = engine.shadow_strategy
+        calculate_sharpe = engine._calculate_sharpe_ratio
+        
+        def sharpe_then_reset(strategy):
+            result = calculate_sharpe(strategy)
+            if strategy is retired:
+                engine.reset_shadow_strategy(leverage_multiplier=3.0)
+            return result
+        
+        engine._calculate_sharpe_ratio = sharpe_then_reset
+        result = engine.simulate_trade_pair("buy", 50000.0, 0.02)
+        
+        assert result.promotion_alert is None
+        assert engine.live_strategy.trade_count == 1
+        assert retired.trade_count == 0
+        assert engine.shadow_strategy.trade_count == 0
+    
     def test_dashboard_data(self):
         """Test dashboard data generation"""
         engine = ShadowEngine()
@@ -188,8 +298,19 @@ class TestEdgeCases:
         )
         
         # Hold signals should generate minimal or zero PnL
-        assert isinstance(result['live_pnl'], (int, float))
-        assert isinstance(result['shadow_pnl'], (int, float))
+        assert isinstance(result.live_pnl, (int, float))
+        assert isinstance(result.shadow_pnl, (int, float))
+    
+    def test_hold_signal_not_recorded(self):
+        """Test that hold signals are not counted as trades"""
+        engine = ShadowEngine()
+        
+        result = engine.simulate_trade_pair("hold", 50000.0)
+        
+        assert result.live_pnl == 0.0
+        assert result.shadow_pnl == 0.0
+        assert engine.live_strategy.trade_count == 0
+        assert engine.shadow_strategy.trade_count == 0
     
     def test_thread_safety(self):
         """Test thread-safe operations"""
@@ -0,0 +1,450 @@
+"""
+Unit Tests for WEEX Native Client
+Tests request signing and precision enforcement (no network access)
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import hashlib
+import hmac
+import json
+import pytest
+import numpy as np
+from decimal import Decimal
+from core.weex_client import WEEXClient
+
+
+class TestSignature:
+    """Test request signing"""
+    
+    def test_signature_matches_hmac_sha256(self):
+        """Test signature equals a reference HMAC-SHA256 hex digest"""
+        client = WEEXClient(api_key="key", api_secret="secret")
+        
+        signature = client._generate_signature(
+            "1700000000000",
+            "POST",
+            "/capi/v2/order/placeOrder",
+            '{"symbol": "BTC-USDT"}'
+        )
+        
+        expected = hmac.new(
+            b"secret",
+            b'1700000000000POST/capi/v2/order/placeOrder{"symbol": "BTC-USDT"}',
+            hashlib.sha256
+        ).hexdigest()
+        assert signature == expected
+    
+    def test_signature_accepts_bytes(self):
+        """Test pre-encoded bytes arguments sign identically to strings"""
+        client = WEEXClient(api_key="key", api_secret="secret")
+        
+        from_str = client._generate_signature("1700000000000", "GET", "/capi/v2/market/contracts")
+        from_bytes = client._generate_signature(b"1700000000000", b"GET", b"/capi/v2/market/contracts")
+        
+        assert from_str == from_bytes
+    
+    def test_sign_batch_matches_single(self):
+        """Test batch signing agrees with _generate_signature for each request"""
+        client = WEEXClient(api_key="key", api_secret="secret")
+        requests = [
+            ("1700000000000", "GET", "/capi/v2/market/contracts"),
+            (b"1700000000001", b"POST", b"/capi/v2/order/placeOrder", b'{"size":"0.1"}'),
+        ]
+        
+        signatures = client.sign_batch(requests)
+        
+        assert signatures == [client._generate_signature(*r) for r in requests]
+    
+    def test_hmac_batch_shape(self):
+        """Test the raw batch returns one 32-byte digest row per message"""
+        from core.hmac_batch import hmac_sha256_batch
+        
+        digests = hmac_sha256_batch(b"secret", [b"a", b"b", b"c"])
+        
+        assert digests.shape == (3, 32)
+        assert digests[1].tobytes() == hmac.new(b"secret", b"b", hashlib.sha256).digest()
+        assert hmac_sha256_batch(b"secret", []).shape == (0, 32)
+    
+    def test_headers_include_signature(self):
+        """Test authentication headers carry key, signature and timestamp"""
+        client = WEEXClient(api_key="key", api_secret="secret", api_password="pass")
+        
+        headers = client._get_headers("1700000000000", "GET", "/capi/v2/market/contracts")
+        
+        assert headers["WEEX-ACCESS-KEY"] == "key"
+        assert headers["WEEX-ACCESS-TIMESTAMP"] == "1700000000000"
+        assert headers["WEEX-ACCESS-PASSPHRASE"] == "pass"
+        assert len(headers["WEEX-ACCESS-SIGN"]) == 64
+    
+    def test_timestamp_ms(self):
+        """Test request timestamps are integer milliseconds since the epoch"""
+        import time
+        from core.weex_client import _timestamp_ms
+        
+        before = int(time.time() * 1000)
+        timestamp = _timestamp_ms()
+        after = int(time.time() * 1000)
+        
+        assert timestamp.isdigit()
+        assert before - 1 <= int(timestamp) <= after + 1
+    
+    def test_headers_do_not_leak_between_requests(self):
+        """Test per-request fields are not written into the shared template"""
+        client = WEEXClient(api_key="key", api_secret="secret")
+        
+        first = client._get_headers("1", "GET", "/a")
+        second = client._get_headers("2", "GET", "/b")
+        
+        assert first["WEEX-ACCESS-TIMESTAMP"] == "1"
+        assert second["WEEX-ACCESS-TIMESTAMP"] == "2"
+        assert first["WEEX-ACCESS-SIGN"] != second["WEEX-ACCESS-SIGN"]
+        assert "WEEX-ACCESS-PASSPHRASE" not in first
+        assert "WEEX-ACCESS-SIGN" not in client._base_headers
+
+
+
+
+class TestSession:
+    """Test session and connection pool lifecycle"""
+    
+    @pytest.mark.asyncio
+    async def test_connector_reused_across_contexts(self):
+        """Test consecutive contexts share one connection pool"""
+        client = WEEXClient(api_key="key", api_secret="secret")
+        
+        async with client:
+            connector = client._connector
+            assert client.session is not None
+        
+        assert client.session is None
+        assert not connector.closed
+        
+        async with client:
+            assert client._connector is connector
+        
+        await client.close()
+        assert connector.closed
+    
+    @pytest.mark.asyncio
+    async def test_nested_contexts_keep_session_open(self):
+        """Test leaving an inner context does not close the outer session"""
+        client = WEEXClient(api_key="key", api_secret="secret")
+        
+        async with client:
+            session = client.session
+            async with client:
+                assert client.session is session
+            assert not session.closed
+        
+        assert session.closed
+        await client.close()
+
+
+def make_client() -> WEEXClient:
+    """Create a client with BTC-USDT market info cached (as set by demos)"""
+    client = WEEXClient(api_key="key", api_secret="secret")
+    client.market_info_cache['BTC-USDT'] = {
+        'tick_size': Decimal('0.01'),
+        'size_increment': Decimal('0.001'),
+        'min_order_size': Decimal('0.001'),
+        'max_order_size': Decimal('100.0'),
+        'contract_type': 'spot',
+        'status': 'active'
+    }
+    return client
+
+
+class TestPrecision:
+    """Test tick_size/size_increment enforcement"""
+    
+    def test_rounds_down_to_increments(self):
+        """Test price and size are rounded down to tick and size increment"""
+        client = make_client()
+        
+        price, size = client._enforce_precision('BTC-USDT', 50123.456789, 0.123456789)
+        
+        assert price == Decimal('50123.45')
+        assert size == Decimal('0.123')
+        assert str(price) == '50123.45'
+    
+    def test_float_noise_does_not_drop_a_tick(self):
+        """Test values already on an increment are left unchanged"""
+        client = make_client()
+        
+        price, size = client._enforce_precision('BTC-USDT', 0.29, 0.123)
+        
+        assert price == Decimal('0.29')
+        assert size == Decimal('0.123')
+    
+    def test_size_clamped_to_limits(self):
+        """Test size is clamped to the min/max order size"""
+        client = make_client()
+        
+        _, small = client._enforce_precision('BTC-USDT', 50000.0, 0.0001)
+        _, large = client._enforce_precision('BTC-USDT', 50000.0, 500.0)
+        
+        assert small == Decimal('0.001')
+        assert large == Decimal('100.0')
+    
+    def test_integer_fields_derived_lazily(self):
+        """Test integer-tick fields are added to manually cached market info"""
+        client = make_client()
+        
+        client._enforce_precision('BTC-USDT', 50000.0, 1.0)
+        info = client.get_market_info('BTC-USDT')
+        
+        assert info['tick_size_int'] == 1
+        assert info['tick_scale'] == 100
+        assert info['size_increment_int'] == 1
+        assert info['size_scale'] == 1000
+    
+    @pytest.mark.asyncio
+    async def test_validate_aligned_order_skips_adjustment(self):
+        """Test aligned orders validate without running _enforce_precision"""
+        from unittest.mock import patch
+        
+        client = make_client()
+        
+        with patch.object(client, '_enforce_precision', wraps=client._enforce_precision) as mock_enforce:
+            assert await client.validate_order_precision('BTC-USDT', 50000.01, 0.123)
+            assert mock_enforce.call_count == 0
+            
+            assert not await client.validate_order_precision('BTC-USDT', 50000.123, 0.123)
+            assert mock_enforce.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_validate_reports_which_field_moved(self, caplog):
+        """Test the adjustment warning flags only the misaligned field"""
+        client = make_client()
+        
+        with caplog.at_level('WARNING', logger='core.weex_client'):
+            assert not await client.validate_order_precision('BTC-USDT', 0.29, 0.1234)
+        
+        assert "Price: 0.29 -> 0.29 (match: True)" in caplog.text
+        assert "Size: 0.1234 -> 0.123 (match: False)" in caplog.text
+    
+    def test_precision_fn_rebuilt_on_new_market_info(self):
+        """Test the per-symbol adjuster is reused, and rebuilt when its entry is replaced"""
+        client = make_client()
+        
+        adjust = client._precision_fn('BTC-USDT')
+        assert client._precision_fn('BTC-USDT') is adjust
+        
+        client.market_info_cache['BTC-USDT'] = {
+            'tick_size': Decimal('0.5'),
+            'size_increment': Decimal('0.001'),
+            'min_order_size': Decimal('0.001'),
+            'max_order_size': Decimal('100.0')
+        }
+        price, _ = client._enforce_precision('BTC-USDT', 50000.7, 1.0)
+        
+        assert client._precision_fn('BTC-USDT') is not adjust
+        assert price == Decimal('50000.5')
+    
+    def test_unknown_symbol_passthrough(self):
+        """Test symbols without market info are returned unchanged"""
+        client = make_client()
+        
+        price, size = client._enforce_precision('ETH-USDT', 2543.98765432, 1.5)
+        
+        assert price == Decimal('2543.98765432')
+        assert size == Decimal('1.5')
+
+
+
+
+class FakeResponse:
+    """Minimal aiohttp response stand-in"""
+    
+    def __init__(self, payload=None):
+        self.payload = payload or {'code': 200, 'data': {'orderId': '1'}}
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *args):
+        return False
+    
+    def raise_for_status(self):
+        pass
+    
+    async def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """Records POST requests instead of sending them"""
+    
+    def __init__(self, payload=None):
+        self.requests = []
+        self.payload = payload
+    
+    def get(self, url, headers=None):
+        self.requests.append({'url': url, 'headers': headers, 'data': None})
+        return FakeResponse(self.payload)
+    
+    def post(self, url, headers=None, data=None):
+        self.requests.append({'url': url, 'headers': headers, 'data': data})
+        return FakeResponse(self.payload)
+
+
+class TestMarketContracts:
+    """Test contract fetching and market info caching"""
+    
+    @pytest.mark.asyncio
+    async def test_contracts_cached_with_integer_ticks(self):
+        """Test fetched contracts are merged into the cache with integer-tick fields"""
+        client = make_client()
+        client.session = FakeSession({'code': 200, 'data': [
+            {'symbol': 'ETH-USDT', 'tickSize': '0.1', 'sizeIncrement': '0.01',
+             'minOrderSize': '0.01', 'maxOrderSize': '1000', 'status': 'active'},
+            {'tickSize': '0.5'}
+        ]})
+        
+        contracts = await client.get_market_contracts()
+        info = client.get_market_info('ETH-USDT')
+        
+        assert len(contracts) == 2
+        assert info['tick_size'] == Decimal('0.1')
+        assert info['tick_scale'] == 10
+        assert info['size_increment_int'] == 1
+        assert info['size_scale'] == 100
+        assert info['max_order_size_float'] == 1000.0
+        assert 'BTC-USDT' in client.market_info_cache
+        assert set(client.market_info_cache) == {'BTC-USDT', 'ETH-USDT'}
+        assert 'ETH-USDT' in client._precision_fns
+
+
+class TestPlaceOrder:
+    """Test order serialization and signing"""
+    
+    @pytest.mark.asyncio
+    async def test_place_order_signs_sent_body(self):
+        """Test the signed body is exactly the compact JSON bytes sent"""
+        client = make_client()
+        client.session = FakeSession()
+        
+        result = await client.place_order('BTC-USDT', 'BUY', 'LIMIT', 0.123456, price=50000.129)
+        
+        request = client.session.requests[0]
+        body = request['data']
+        timestamp = request['headers']['WEEX-ACCESS-TIMESTAMP']
+        
+        assert result['code'] == 200
+        assert isinstance(body, bytes)
+        assert json.loads(body) == {
+            'symbol': 'BTC-USDT',
+            'side': 'buy',
+            'type': 'limit',
+            'size': '0.123',
+            'price': '50000.12'
+        }
+        assert b' ' not in body
+        assert request['headers']['WEEX-ACCESS-SIGN'] == client._generate_signature(
+            timestamp, 'POST', '/capi/v2/order/placeOrder', body
+        )
+
+    
+    def test_dumps_identical_without_orjson(self):
+        """Test the json fallback serializes byte-for-byte like orjson"""
+        from unittest.mock import patch
+        from core import weex_client
+        
+        payload = {'symbol': 'BTC-USDT', 'size': '0.123', 'reduceOnly': False, 'note': 'é'}
+        expected = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        
+        with patch.object(weex_client, 'ORJSON_AVAILABLE', False):
+            assert weex_client._dumps(payload) == expected
+        
+        if weex_client.ORJSON_AVAILABLE:
+            assert weex_client._dumps(payload) == expected
+
+
+class TestBatchValidation:
+    """Test vectorized order validation"""
+    
+    def test_validate_batch(self):
+        """Test batch mask flags off-tick prices, off-increment and out-of-range sizes"""
+        client = make_client()
+        
+        prices = np.array([50000.01, 50000.123, 0.29, 50000.0, 50000.0])
+        sizes = np.array([0.123, 0.123, 0.123, 0.1234, 500.0])
+        
+        mask = client.validate_batch('BTC-USDT', prices, sizes)
+        
+        assert mask.tolist() == [True, False, True, False, False]
+    
+    @pytest.mark.asyncio
+    async def test_validate_batch_matches_scalar(self):
+        """Test batch validation agrees with validate_order_precision"""
+        client = make_client()
+        prices = [50000.01, 50000.123, 123.45, 99.999]
+        sizes = [0.123, 0.001, 0.0005, 100.0]
+        
+        mask = client.validate_batch('BTC-USDT', np.array(prices), np.array(sizes))
+        
+        for i, (price, size) in enumerate(zip(prices, sizes)):
+            assert mask[i] == await client.validate_order_precision('BTC-USDT', price, size)
+    
+    def test_enforce_precision_batch_matches_scalar(self):
+        """Test batch adjustment agrees with _enforce_precision, including clamping"""
+        client = make_client()
+        prices = [50123.456789, 0.29, 50000.01, 99.999]
+        sizes = [0.123456789, 0.123, 0.0001, 500.0]
+        
+        adjusted_prices, adjusted_sizes = client.enforce_precision_batch(
+            'BTC-USDT', np.array(prices), np.array(sizes)
+        )
+        
+        assert adjusted_prices.dtype == np.float64
+        for i, (price, size) in enumerate(zip(prices, sizes)):
+            expected_price, expected_size = client._enforce_precision('BTC-USDT', price, size)
+            assert Decimal(str(adjusted_prices[i])) == expected_price
+            assert Decimal(str(adjusted_sizes[i])) == expected_size
+    
+    def test_enforce_precision_multi_mixed_symbols(self):
+        """Test mixed-symbol batches keep input order and apply each market's rules"""
+        client = make_client()
+        client.market_info_cache['ETH-USDT'] = {
+            'tick_size': Decimal('0.01'),
+            'size_increment': Decimal('0.0001'),
+            'min_order_size': Decimal('0.01'),
+            'max_order_size': Decimal('1000.0'),
+            'contract_type': 'spot',
+            'status': 'active'
+        }
+        symbols = ['BTC-USDT', 'ETH-USDT', 'BTC-USDT', 'SOL-USDT']
+        prices = [50123.456789, 2543.98765432, 99.999, 12.3456]
+        sizes = [0.123456789, 1.23456789, 500.0, 1.23456]
+        
+        adjusted_prices, adjusted_sizes = client.enforce_precision_multi(
+            symbols, np.array(prices), np.array(sizes)
+        )
+        
+        for i, (symbol, price, size) in enumerate(zip(symbols, prices, sizes)):
+            expected_price, expected_size = client._enforce_precision(symbol, price, size)
+            assert Decimal(str(adjusted_prices[i])) == expected_price
+            assert Decimal(str(adjusted_sizes[i])) == expected_size
+    
+    def test_precision_context(self):
+        """Test tick size and size increment come back as floats"""
+        client = make_client()
+        
+        assert client.precision_context('BTC-USDT') == (0.01, 0.001)
+    
+    def test_validate_batch_unknown_symbol(self):
+        """Test symbols without market info validate as all False"""
+        client = make_client()
+        
+        mask = client.validate_batch('ETH-USDT', np.array([1.0, 2.0]), np.array([1.0, 1.0]))
+        
+        assert not mask.any()
+
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, "-v", "-s"])